@@ -0,0 +1,526 @@
+"""
+LLM backends - Where LLM calls actually go.
+
+llm.py decides *how* to call the model (hedging, conversation threads, ...).
+A backend decides *where* the call goes. Every backend implements the same
+LLMBackend protocol, so the rest of the agent never knows which one it's
+talking to:
+
+- OpenAIBackend: the OpenAI API (the default)
+- OpenAICompatibleBackend: any OpenAI-compatible server, e.g. llama.cpp or
+  vLLM on your own boxes
+- ScriptedBackend: deterministic canned replies, fully offline (CI, benchmarks)
+
+Pick one with config.LLM_BACKEND (HOTSEAT_BACKEND), and optionally send the
+moderator and selector roles somewhere else with config.ROLE_BACKENDS.
+
+Token usage is counted per backend, and also charged to the scheduler
+session the call was made for (see scheduler.py).
+"""
+
+import contextvars
+import hashlib
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import AsyncIterator, Iterator, Protocol
+
+import config
+import scheduler
+
+
+_reasoning_effort = contextvars.ContextVar("hotseat_reasoning_effort", default=None)
+
+
+@contextmanager
+def reasoning_effort(effort: str | None):
+    """
+    Ask for this reasoning effort ("minimal", "low", ...) on calls made in the block.
+
+    None means the model's default. Backends that don't support it ignore it.
+    """
+    token = _reasoning_effort.set(effort)
+    try:
+        yield
+    finally:
+        _reasoning_effort.reset(token)
+
+
+def current_reasoning_effort() -> str | None:
+    return _reasoning_effort.get()
+
+
+class UnsupportedFeature(Exception):
+    """The backend can't do this (e.g. no Responses API)."""
+
+
+class ConversationExpired(Exception):
+    """The server no longer knows the previous_response_id we sent."""
+
+
+class TextStream:
+    """
+    An iterator of text chunks that can be closed from any thread.
+
+    Closing stops the stream at the next chunk boundary and releases the
+    underlying connection - this is how hedging cancels the losing request.
+
+    on_end(text) is called exactly once with the text received so far, when
+    the stream runs out, is closed or is abandoned - backends charge usage
+    there, so a stream cut short (an early moderator decision, a losing
+    hedge) is still paid for.
+    """
+
+    def __init__(self, chunks: Iterator[str], on_close=None, on_end=None):
+        self._chunks = chunks
+        self._on_close = on_close
+        self._on_end = on_end
+        self._closed = False
+        self._started = False
+        self._ended = False
+        self._received = []
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> Iterator[str]:
+        self._started = True
+        try:
+            for chunk in self._chunks:
+                if self._closed:
+                    return
+                self._received.append(chunk)
+                yield chunk
+        finally:
+            self._end()
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._on_close:
+            self._on_close()
+        if not self._started:
+            self._end()  # Otherwise the reader ends it at its next chunk boundary
+
+    def _end(self):
+        with self._lock:
+            if self._ended:
+                return
+            self._ended = True
+        if self._on_end:
+            self._on_end("".join(self._received))
+
+
+class LLMBackend(Protocol):
+    """Everything llm.py needs from a backend."""
+
+    name: str
+
+    def chat(self, system_prompt: str, user_message: str) -> str: ...
+
+    def chat_json(self, system_prompt: str, user_message: str) -> str: ...
+
+    def chat_messages(self, system_prompt: str, messages: list[dict]) -> str: ...
+
+    def stream(self, system_prompt: str, user_message: str, json_mode: bool = False) -> TextStream: ...
+
+    def respond(self, instructions: str, input: list[dict], previous_response_id: str | None) -> tuple[str, str]:
+        """Continue a server-side thread. Returns (response_id, text)."""
+        ...
+
+    def usage(self) -> dict: ...
+
+    def prewarm(self):
+        """Get ready for the first call (imports, connections). Best effort."""
+        ...
+
+    async def achat(self, system_prompt: str, user_message: str) -> str: ...
+
+    async def achat_json(self, system_prompt: str, user_message: str) -> str: ...
+
+    def astream(self, system_prompt: str, user_message: str, json_mode: bool = False) -> AsyncIterator[str]: ...
+
+
+class _UsageCounter:
+    """Thread-safe call and token counts for one backend."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0}
+
+    def add(self, prompt_tokens: int = 0, completion_tokens: int = 0, session: scheduler.Session | None = None):
+        """Count one call, charged to `session` (default: the current one)."""
+        with self.lock:
+            self.counts["calls"] += 1
+            self.counts["prompt_tokens"] += prompt_tokens or 0
+            self.counts["completion_tokens"] += completion_tokens or 0
+        (session or scheduler.current_session()).charge(prompt_tokens or 0, completion_tokens or 0)
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return dict(self.counts)
+
+
+def _messages(system_prompt: str, user_message: str) -> list[dict]:
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_message}
+    ]
+
+
+# ----------------------------------------------------------------------------
+# OpenAI
+# ----------------------------------------------------------------------------
+
+class OpenAIBackend:
+    """The OpenAI API (or anything at base_url that speaks it)."""
+
+    name = "openai"
+    stream_usage = True  # Ask for token usage at the end of streams
+    reasoning_effort = True  # Pass current_reasoning_effort() to the API
+
+    def __init__(self, api_key: str, model: str, base_url: str | None = None):
+        from openai import AsyncOpenAI, OpenAI
+
+        self.model = model
+        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self.async_client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self._usage = _UsageCounter()
+
+    def _record(self, usage, session: scheduler.Session | None = None):
+        if usage is None:
+            self._usage.add(session=session)
+            return
+        prompt = getattr(usage, "prompt_tokens", None) or getattr(usage, "input_tokens", 0)
+        completion = getattr(usage, "completion_tokens", None) or getattr(usage, "output_tokens", 0)
+        self._usage.add(prompt, completion, session=session)
+
+    def _with_effort(self, request: dict, responses_api: bool = False) -> dict:
+        effort = current_reasoning_effort()
+        if effort and self.reasoning_effort:
+            if responses_api:
+                request["reasoning"] = {"effort": effort}
+            else:
+                request["reasoning_effort"] = effort
+        return request
+
+    def _create(self, messages: list[dict], json_mode: bool = False) -> str:
+        request = self._with_effort({"model": self.model, "messages": messages})
+        if json_mode:
+            request["response_format"] = {"type": "json_object"}
+
+        response = self.client.chat.completions.create(**request)
+        self._record(response.usage)
+        return response.choices[0].message.content
+
+    def chat(self, system_prompt: str, user_message: str) -> str:
+        return self._create(_messages(system_prompt, user_message))
+
+    def chat_json(self, system_prompt: str, user_message: str) -> str:
+        return self._create(_messages(system_prompt, user_message), json_mode=True)
+
+    def chat_messages(self, system_prompt: str, messages: list[dict]) -> str:
+        return self._create([{"role": "system", "content": system_prompt}] + messages)
+
+    def _stream_request(self, system_prompt: str, user_message: str, json_mode: bool) -> dict:
+        request = {"model": self.model, "messages": _messages(system_prompt, user_message), "stream": True}
+        self._with_effort(request)
+        if json_mode:
+            request["response_format"] = {"type": "json_object"}
+        if self.stream_usage:
+            request["stream_options"] = {"include_usage": True}
+        return request
+
+    def stream(self, system_prompt: str, user_message: str, json_mode: bool = False) -> TextStream:
+        response = self.client.chat.completions.create(
+            **self._stream_request(system_prompt, user_message, json_mode)
+        )
+        session = scheduler.current_session()  # Closing may happen on another thread
+        usage = []  # The provider's count, once the stream gets that far
+
+        def chunks():
+            for chunk in response:
+                if getattr(chunk, "usage", None):
+                    usage[:] = [chunk.usage]
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
+
+        def charge(received: str):
+            if usage:
+                self._record(usage[0], session)
+            else:  # Cut short (or no usage reported): estimate, ~4 characters per token
+                self._usage.add((len(system_prompt) + len(user_message)) // 4, len(received) // 4, session=session)
+
+        return TextStream(chunks(), on_close=response.close, on_end=charge)
+
+    def respond(self, instructions: str, input: list[dict], previous_response_id: str | None) -> tuple[str, str]:
+        from openai import BadRequestError, NotFoundError
+
+        request = self._with_effort(
+            {"model": self.model, "instructions": instructions, "input": input, "store": True},
+            responses_api=True
+        )
+        if previous_response_id:
+            request["previous_response_id"] = previous_response_id
+
+        try:
+            response = self.client.responses.create(**request)
+        except (BadRequestError, NotFoundError) as e:
+            if previous_response_id:
+                raise ConversationExpired(str(e)) from e
+            if isinstance(e, NotFoundError):
+                raise UnsupportedFeature("Responses API not available") from e
+            raise
+
+        self._record(response.usage)
+        return response.id, response.output_text
+
+    def usage(self) -> dict:
+        return self._usage.snapshot()
+
+    def prewarm(self):
+        """
+        Open the connection (DNS, TCP, TLS) with a cheap request, so the
+        first real call doesn't pay for it. The sync client's pool keeps it.
+        """
+        try:
+            self.client.models.list()
+        except Exception:
+            pass  # Not every compatible server lists models; the handshake is done either way
+
+    async def _acreate(self, messages: list[dict], json_mode: bool = False) -> str:
+        request = self._with_effort({"model": self.model, "messages": messages})
+        if json_mode:
+            request["response_format"] = {"type": "json_object"}
+
+        response = await self.async_client.chat.completions.create(**request)
+        self._record(response.usage)
+        return response.choices[0].message.content
+
+    async def achat(self, system_prompt: str, user_message: str) -> str:
+        return await self._acreate(_messages(system_prompt, user_message))
+
+    async def achat_json(self, system_prompt: str, user_message: str) -> str:
+        return await self._acreate(_messages(system_prompt, user_message), json_mode=True)
+
+    async def astream(self, system_prompt: str, user_message: str, json_mode: bool = False) -> AsyncIterator[str]:
+        response = await self.async_client.chat.completions.create(
+            **self._stream_request(system_prompt, user_message, json_mode)
+        )
+        usage = None
+        async for chunk in response:
+            usage = getattr(chunk, "usage", None) or usage
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                yield delta
+        self._record(usage)
+
+
+class OpenAICompatibleBackend(OpenAIBackend):
+    """
+    A self-hosted OpenAI-compatible server (llama.cpp, vLLM, ...).
+
+    Same wire protocol as OpenAI, but with its own base URL and model name,
+    no API key required, and no assumption that optional extras (stream
+    usage, reasoning effort, the Responses API) exist. Conversation threads
+    fall back to sending the full history automatically when /responses is
+    missing.
+    """
+
+    name = "openai-compatible"
+    stream_usage = False
+    reasoning_effort = False
+
+    def __init__(self, base_url: str, model: str, api_key: str = ""):
+        super().__init__(api_key=api_key or "not-needed", model=model, base_url=base_url)
+
+
+# ----------------------------------------------------------------------------
+# Scripted (offline)
+# ----------------------------------------------------------------------------
+
+# One JSON body that satisfies both the skill selector and the moderator
+SCRIPTED_JSON = {
+    "should_ask": False,
+    "question": None,
+    "reasoning": "Scripted backend - deterministic reply.",
+    "task_skill": "critique",
+    "persona_skills": ["skeptical-vc", "early-adopter", "budget-conscious"],
+    "dynamic_personas": [],
+}
+
+SCRIPTED_REPLIES = [
+    "The core problem is real, but I don't see why anyone switches from what they use today.",
+    "I'd want proof that people will pay before building anything beyond a landing page.",
+    "The unit economics only work if retention is far better than the category average.",
+    "There's a sharper wedge here: pick one customer segment and win it outright.",
+    "Distribution is the hard part. Who already has these customers, and why wouldn't they copy you?",
+]
+
+
+_SCRIPTED_FIRST_CHUNK_SHARE = 0.3  # Of a streamed call's simulated latency
+
+
+class ScriptedBackend:
+    """
+    Deterministic, offline backend for CI and benchmarks.
+
+    Replies are picked by hashing the prompt, so the same prompt always gets
+    the same reply regardless of call order or concurrency. JSON calls get
+    SCRIPTED_JSON. A script file (JSON with optional "replies" and "json"
+    keys) can override both. Latency is simulated: each call waits between
+    0.5x and 1.5x `latency` seconds, again chosen by hash, plus
+    `latency_per_1k` seconds per 1,000 prompt tokens (like a real model's
+    prompt processing, so longer prompts are slower). Streams send their
+    first chunk 30% of the way in and spread the rest over the reply.
+    """
+
+    name = "scripted"
+
+    def __init__(self, script_path: str | None = None, latency: float = 0.0, latency_per_1k: float = 0.0):
+        self.replies = list(SCRIPTED_REPLIES)
+        self.json_reply = dict(SCRIPTED_JSON)
+        self.latency = latency
+        self.latency_per_1k = latency_per_1k
+        self._usage = _UsageCounter()
+        self._threads = {}  # response id -> message list (for respond())
+        self._threads_lock = threading.Lock()
+
+        if script_path:
+            script = json.loads(Path(script_path).read_text())
+            self.replies = script.get("replies", self.replies)
+            self.json_reply.update(script.get("json", {}))
+
+    @staticmethod
+    def _digest(*parts: str) -> int:
+        return int(hashlib.sha256("\x00".join(parts).encode()).hexdigest()[:12], 16)
+
+    def _reply(self, system_prompt: str, user_message: str, json_mode: bool) -> str:
+        if json_mode:
+            return json.dumps(self.json_reply)
+        return self.replies[self._digest(system_prompt, user_message) % len(self.replies)]
+
+    def _delay(self, system_prompt: str, user_message: str) -> float:
+        prompt_cost = self.latency_per_1k * (len(system_prompt) + len(user_message)) / 4000
+        if not self.latency:
+            return prompt_cost
+        fraction = (self._digest("latency", system_prompt, user_message) % 1000) / 1000
+        return self.latency * (0.5 + fraction) + prompt_cost
+
+    def _record(self, prompt: str, reply: str, session: scheduler.Session | None = None):
+        # Rough token estimate: ~4 characters per token
+        self._usage.add(len(prompt) // 4, len(reply) // 4, session=session)
+
+    def _complete(self, system_prompt: str, user_message: str, json_mode: bool = False) -> str:
+        time.sleep(self._delay(system_prompt, user_message))
+        reply = self._reply(system_prompt, user_message, json_mode)
+        self._record(system_prompt + user_message, reply)
+        return reply
+
+    def chat(self, system_prompt: str, user_message: str) -> str:
+        return self._complete(system_prompt, user_message)
+
+    def chat_json(self, system_prompt: str, user_message: str) -> str:
+        return self._complete(system_prompt, user_message, json_mode=True)
+
+    def chat_messages(self, system_prompt: str, messages: list[dict]) -> str:
+        return self._complete(system_prompt, json.dumps(messages))
+
+    def stream(self, system_prompt: str, user_message: str, json_mode: bool = False) -> TextStream:
+        # Like a real model: prompt processing before the first chunk, then
+        # the rest of the time spread over the reply as it's "generated"
+        delay = self._delay(system_prompt, user_message)
+        reply = self._reply(system_prompt, user_message, json_mode)
+        words = reply.split(" ")
+        session = scheduler.current_session()  # Closing may happen on another thread
+
+        def chunks():
+            time.sleep(delay * _SCRIPTED_FIRST_CHUNK_SHARE)
+            for i, word in enumerate(words):
+                if i:
+                    time.sleep(delay * (1 - _SCRIPTED_FIRST_CHUNK_SHARE) / len(words))
+                yield word if i == len(words) - 1 else word + " "
+
+        # Charged for what was sent, even if the stream is closed early
+        return TextStream(chunks(), on_end=lambda received: self._record(system_prompt + user_message, received,
+                                                                          session))
+
+    def respond(self, instructions: str, input: list[dict], previous_response_id: str | None) -> tuple[str, str]:
+        with self._threads_lock:
+            if previous_response_id and previous_response_id not in self._threads:
+                raise ConversationExpired(previous_response_id)
+            history = self._threads.get(previous_response_id, []) + input
+
+        reply = self._complete(instructions, json.dumps(history))
+        response_id = f"scripted_{self._digest(instructions, json.dumps(history), reply):x}"
+        with self._threads_lock:
+            self._threads[response_id] = history + [{"role": "assistant", "content": reply}]
+        return response_id, reply
+
+    def usage(self) -> dict:
+        return self._usage.snapshot()
+
+    def prewarm(self):
+        pass  # Nothing to connect to
+
+    async def _acomplete(self, system_prompt: str, user_message: str, json_mode: bool = False) -> str:
+        import asyncio
+
+        await asyncio.sleep(self._delay(system_prompt, user_message))
+        reply = self._reply(system_prompt, user_message, json_mode)
+        self._record(system_prompt + user_message, reply)
+        return reply
+
+    async def achat(self, system_prompt: str, user_message: str) -> str:
+        return await self._acomplete(system_prompt, user_message)
+
+    async def achat_json(self, system_prompt: str, user_message: str) -> str:
+        return await self._acomplete(system_prompt, user_message, json_mode=True)
+
+    async def astream(self, system_prompt: str, user_message: str, json_mode: bool = False) -> AsyncIterator[str]:
+        reply = await self._acomplete(system_prompt, user_message, json_mode)
+        for word in reply.split(" "):
+            yield word + " "
+
+
+# ----------------------------------------------------------------------------
+# Selection
+# ----------------------------------------------------------------------------
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+
+def create_backend(kind: str) -> LLMBackend:
+    """Build a backend from its config name."""
+    if kind == "openai":
+        return OpenAIBackend(api_key=config.OPENAI_API_KEY, model=config.MODEL, base_url=config.OPENAI_BASE_URL)
+    if kind == "openai-compatible":
+        return OpenAICompatibleBackend(base_url=config.LOCAL_BASE_URL, model=config.LOCAL_MODEL,
+                                       api_key=config.LOCAL_API_KEY)
+    if kind == "scripted":
+        return ScriptedBackend(script_path=config.SCRIPTED_SCRIPT, latency=config.SCRIPTED_LATENCY,
+                               latency_per_1k=config.SCRIPTED_LATENCY_PER_1K)
+    raise ValueError(f"Unknown LLM backend: {kind!r} (expected openai, openai-compatible or scripted)")
+
+
+def get_backend(role: str | None = None) -> LLMBackend:
+    """
+    The backend for a role ("moderator", "selector", ...), or the default.
+
+    Backends are created once and shared, so their connections and usage
+    counters are reused across calls.
+    """
+    kind = config.ROLE_BACKENDS.get(role) or config.LLM_BACKEND
+    with _backends_lock:
+        if kind not in _backends:
+            _backends[kind] = create_backend(kind)
+        return _backends[kind]
+
+
+def all_backends() -> dict[str, LLMBackend]:
+    """Every backend created so far, by config name."""
+    with _backends_lock:
+        return dict(_backends)
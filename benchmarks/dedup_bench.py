@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark: a batch with near-duplicate ideas, with and without dedup.
+
+Builds BASE_IDEAS distinct pitches plus VARIANTS reworded copies of each
+(a word swapped, punctuation changed, a phrase added), shuffles them, and
+runs every one on the scripted backend - once with dedup off, once with
+HOTSEAT_DEDUP=reuse against a fresh index.
+
+Reports sessions actually run, tokens, wall time, and how accurate the
+index was against each idea's true family (a miss is a reworded copy that
+ran anyway; a false match is a different idea that was reused).
+
+Usage:
+    python benchmarks/dedup_bench.py
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import config  # noqa: E402
+
+config.LLM_BACKEND = "scripted"
+config.SKILLS_DIR = str(ROOT / "skills")
+
+import dedup  # noqa: E402
+import llm  # noqa: E402
+from orchestrator import Orchestrator  # noqa: E402
+from skill_loader import load_all_skills  # noqa: E402
+
+VARIANTS = 2
+PRODUCTS = ["pet translator collar", "tax set-aside app for freelancers", "camping gear rental marketplace",
+            "AI meal planner for diabetics", "shared EV charger booking", "language exchange for retirees",
+            "smart plant watering kit", "second-hand school uniform swap", "bike repair at your office",
+            "noise map for apartment hunters"]
+AUDIENCES = ["busy parents", "students", "small landlords", "remote teams", "rural clinics"]
+
+
+def base_ideas() -> list[str]:
+    rng = random.Random(7)
+    return [f"{product.capitalize()} for {rng.choice(AUDIENCES)}, paid monthly, launched first in big cities "
+            f"with a free trial and a referral program" for product in PRODUCTS]
+
+
+def reword(idea: str, rng: random.Random) -> str:
+    """The same pitch, lightly edited."""
+    edits = [
+        lambda s: s.replace("paid monthly", "with a monthly subscription"),
+        lambda s: s.replace(", ", " - ", 1),
+        lambda s: s + ".",
+        lambda s: s.replace("big cities", "large cities"),
+        lambda s: s.replace("free trial", "free 14-day trial"),
+    ]
+    for edit in rng.sample(edits, 2):
+        idea = edit(idea)
+    return idea
+
+
+def run_batch(ideas: list[tuple[int, str]], mode: str, skills: dict) -> dict:
+    config.DEDUP_MODE = mode
+    before = llm.usage_stats()
+    dedup_before = dedup.dedup_stats()
+    started = time.perf_counter()
+    outcomes = []
+    for family, idea in ideas:
+        agent = Orchestrator(skills=skills, quiet=True)
+        agent.run(idea, "critique")
+        reused = agent.last_chat.get("reused_from")
+        outcomes.append((family, reused["idea"] if reused else None))
+    after = llm.usage_stats()
+    families = dict((idea, family) for family, idea in ideas)
+    seen = set()
+    misses = false_matches = 0
+    for family, source in outcomes:
+        if source is None and family in seen:
+            misses += 1
+        if source is not None and families[source] != family:
+            false_matches += 1
+        seen.add(family)
+    return {
+        "sessions": sum(1 for _, source in outcomes if source is None),
+        "tokens": after["prompt_tokens"] + after["completion_tokens"]
+        - before["prompt_tokens"] - before["completion_tokens"],
+        "seconds": time.perf_counter() - started,
+        "misses": misses,
+        "false_matches": false_matches,
+        "saved": dedup.dedup_stats()["tokens_saved"] - dedup_before["tokens_saved"],
+    }
+
+
+def main():
+    rng = random.Random(1)
+    ideas = [(family, idea) for family, base in enumerate(base_ideas())
+             for idea in [base] + [reword(base, rng) for _ in range(VARIANTS)]]
+    rng.shuffle(ideas)
+    skills = load_all_skills(verbose=False)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config.DEDUP_INDEX = str(Path(tmp) / "ideas.db")
+        print(f"{len(ideas)} ideas ({len(PRODUCTS)} pitches × {VARIANTS + 1} wordings), "
+              f"threshold {config.DEDUP_THRESHOLD}\n")
+        print(f"{'dedup':<7} {'sessions run':>13} {'tokens':>8} {'seconds':>8} {'misses':>7} {'false':>6}")
+        results = {}
+        for mode in ("off", "reuse"):
+            results[mode] = r = run_batch(ideas, mode, skills)
+            print(f"{mode:<7} {r['sessions']:>13} {r['tokens']:>8} {r['seconds']:>8.2f} "
+                  f"{r['misses']:>7} {r['false_matches']:>6}")
+
+        started = time.perf_counter()
+        index = dedup.IdeaIndex()
+        for _, idea in ideas:
+            index.find(idea, "critique")
+        lookup_ms = (time.perf_counter() - started) / len(ideas) * 1000
+
+    off, reuse = results["off"], results["reuse"]
+    print(f"\nReuse ran {off['sessions'] - reuse['sessions']} fewer sessions and used "
+          f"{1 - reuse['tokens'] / off['tokens']:.0%} fewer tokens (~{reuse['saved']} reported saved); "
+          f"a lookup takes {lookup_ms:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: what console output costs a session, printed inline vs. through
+the event bus.
+
+The console is a stream that takes WRITE_SECONDS per write (a slow
+terminal, an SSH session, a pipe nobody is reading fast enough). Runs the
+same non-interactive session on the scripted backend three ways:
+
+- inline: every event rendered and written on the publishing thread, which
+  is what print() did
+- bus: the normal EventBus, rendering on its dispatcher thread
+- null: no output at all (the floor)
+
+Reports session wall time for each, and time to flush the bus afterwards.
+
+Usage:
+    python benchmarks/events_bench.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import config  # noqa: E402
+
+config.LLM_BACKEND = "scripted"
+config.SCRIPTED_LATENCY = 0.2  # Seconds per call (0.5x - 1.5x)
+config.SKILLS_DIR = str(ROOT / "skills")
+config.MAX_TOTAL_ROUNDS = 5
+config.MAX_SILENT_ROUNDS = 5
+
+import events  # noqa: E402
+from orchestrator import Orchestrator  # noqa: E402
+from skill_loader import load_all_skills  # noqa: E402
+
+WRITE_SECONDS = 0.02
+IDEA = "AI pet translator for dogs and cats, sold as a collar with a subscription app"
+
+
+class SlowStream:
+    """A terminal that takes WRITE_SECONDS per write."""
+
+    def write(self, text: str):
+        time.sleep(WRITE_SECONDS)
+
+    def flush(self):
+        pass
+
+
+class InlineBus(events.EventBus):
+    """Hands each event to the sinks on the publishing thread, like print()."""
+
+    def publish(self, event: events.Event):
+        for sink in self.sinks:
+            sink.handle(event)
+
+
+def run(bus: events.EventBus, skills: dict) -> tuple[float, float]:
+    agent = Orchestrator(skills=skills, bus=bus)
+    bus.flush = lambda: None  # Measure the session alone; the flush is timed below
+    started = time.perf_counter()
+    agent.run(IDEA, "critique")
+    session = time.perf_counter() - started
+    del bus.flush
+    flushed = time.perf_counter()
+    bus.flush()
+    return session, time.perf_counter() - flushed
+
+
+def main():
+    skills = load_all_skills(verbose=False)
+    print(f"{config.MAX_TOTAL_ROUNDS} rounds, {WRITE_SECONDS * 1000:.0f}ms per console write\n")
+    print(f"{'output':<8} {'session':>9} {'flush after':>12}")
+    results = {}
+    for label, bus in (
+        ("inline", InlineBus([events.ConsoleSink(SlowStream())])),
+        ("bus", events.EventBus([events.ConsoleSink(SlowStream())])),
+        ("null", events.EventBus([events.NullSink()])),
+    ):
+        results[label] = run(bus, skills)
+        print(f"{label:<8} {results[label][0]:>8.2f}s {results[label][1]:>11.2f}s")
+
+    saved = results["inline"][0] - results["bus"][0]
+    print(f"\nThe bus takes {saved:.2f}s of console writes off the session")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: moderator latency with and without the early decision.
+
+Runs the same sessions twice on the scripted backend - once waiting for the
+moderator's whole JSON reply, once stream-parsing it and stopping as soon as
+should_ask (and question, if asking) are complete. The scripted moderator
+reply has its decision fields first, like the real schema, followed by the
+reasoning and other fields.
+
+Reports moderator seconds per round and rounds/sec.
+
+Usage:
+    python benchmarks/moderator_bench.py
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import config  # noqa: E402
+
+config.LLM_BACKEND = "scripted"
+config.SCRIPTED_LATENCY = 0.4  # Seconds per call (0.5x - 1.5x)
+config.SKILLS_DIR = str(ROOT / "skills")
+config.MAX_TOTAL_ROUNDS = 5
+config.MAX_SILENT_ROUNDS = 5
+
+from orchestrator import Orchestrator  # noqa: E402
+from skill_loader import load_all_skills  # noqa: E402
+
+IDEAS = [
+    "AI pet translator for dogs and cats, sold as a collar with a subscription app",
+    "Budgeting app for freelancers that sets aside tax from every invoice",
+    "Marketplace for renting out idle restaurant kitchens overnight",
+]
+
+
+def run(early: bool, skills: dict) -> dict:
+    config.MODERATOR_EARLY_DECISION = early
+    moderator_seconds = rounds = wall = 0.0
+    for idea in IDEAS:
+        agent = Orchestrator(skills=skills, quiet=True)
+        agent.run(idea, "critique")
+        report = agent.budget.report()
+        moderator_seconds += report["phases"]["moderator"]["seconds"]
+        rounds += len(report["rounds"])
+        wall += sum(entry["seconds"] for entry in report["rounds"])
+    return {
+        "moderator_per_round": moderator_seconds / rounds,
+        "rounds_per_sec": rounds / wall,
+    }
+
+
+def main():
+    skills = load_all_skills(verbose=False)
+    print(f"{len(IDEAS)} sessions × {config.MAX_TOTAL_ROUNDS} rounds, scripted latency {config.SCRIPTED_LATENCY}s\n")
+    print(f"{'moderator':<16} {'s/round':>9} {'rounds/s':>9}")
+    results = {}
+    for early in (False, True):
+        label = "early decision" if early else "full reply"
+        results[label] = run(early, skills)
+        print(f"{label:<16} {results[label]['moderator_per_round']:>8.3f}s {results[label]['rounds_per_sec']:>9.2f}")
+
+    full = results["full reply"]["moderator_per_round"]
+    early = results["early decision"]["moderator_per_round"]
+    print(f"\nModerator time per round: {1 - early / full:.0%} less with the early decision")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark: prompt tokens per persona call with full vs condensed skills.
+
+Builds the round-2 system prompt for every persona × task pair from
+skills/, once with the full skill text and once per condensing mode, and
+reports the estimated prompt tokens per call (characters / 4).
+
+"strip" is deterministic and always measured. Pass --llm to also measure
+the LLM condensation with the configured backend (HOTSEAT_BACKEND); its
+results are cached in skills/*/.condensed/, so only the first run pays.
+
+Usage:
+    python benchmarks/skill_condense_bench.py [--llm]
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import config  # noqa: E402
+
+config.SKILLS_DIR = str(ROOT / "skills")
+
+from orchestrator import Orchestrator  # noqa: E402
+from skill_loader import condense_skill, load_all_skills  # noqa: E402
+
+
+def prompt_tokens(agent: Orchestrator, personas: list, tasks: list, mode: str) -> list[int]:
+    """Round-2 system prompt size (tokens) for each persona × task pair."""
+    config.SKILL_CONDENSE = mode
+    sizes = []
+    for task in tasks:
+        condense_skill(task, mode)
+        for persona in personas:
+            condense_skill(persona, mode)
+            sizes.append(len(agent._build_persona_prompt(persona, task, round_num=2)) // 4)
+    return sizes
+
+
+def main():
+    skills = load_all_skills(verbose=False)
+    tasks = [s for s in skills.values() if "/tasks/" in s.path]
+    personas = [s for s in skills.values() if "/personas/" in s.path]
+    agent = Orchestrator(skills=skills, quiet=True)
+
+    modes = ["off", "strip"] + (["llm"] if "--llm" in sys.argv else [])
+    print(f"Round-2 persona prompts, {len(personas)} personas × {len(tasks)} tasks\n")
+    print(f"{'mode':<8} {'tokens/call':>12} {'saved/call':>11} {'saved':>7}")
+    baseline = None
+    for mode in modes:
+        sizes = prompt_tokens(agent, personas, tasks, mode)
+        average = sum(sizes) / len(sizes)
+        baseline = baseline or average
+        print(f"{mode:<8} {average:>12.0f} {baseline - average:>11.0f} {1 - average / baseline:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: barrier rounds vs. staggered rounds.
+
+Runs the same non-interactive sessions on the scripted backend, whose
+simulated latency varies from call to call (0.5x - 1.5x), once with a
+barrier per round and once staggered with K = 1 and K = 2.
+
+Reports, summed over the ideas:
+- discussion: wall time of the rounds (moderator checks included)
+- session: wall time of the whole run
+- idle: seconds personas spent between their turns, over all personas
+- turns: persona turns taken
+
+Usage:
+    python benchmarks/stagger_bench.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import config  # noqa: E402
+
+config.LLM_BACKEND = "scripted"
+config.SCRIPTED_LATENCY = 0.5  # Seconds per call (0.5x - 1.5x)
+config.SKILLS_DIR = str(ROOT / "skills")
+config.MAX_TOTAL_ROUNDS = 5
+config.MAX_SILENT_ROUNDS = 5
+
+from orchestrator import Orchestrator  # noqa: E402
+from skill_loader import load_all_skills  # noqa: E402
+
+IDEAS = [
+    "AI pet translator for dogs and cats, sold as a collar with a subscription app",
+    "Budgeting app for freelancers that sets aside tax from every invoice",
+    "Marketplace for renting camping gear from neighbours",
+]
+MODES = [("barrier", 0), ("stagger K=1", 1), ("stagger K=2", 2)]
+
+
+def run(stagger: int, skills: dict) -> dict:
+    config.STAGGER_TURNS = stagger
+    totals = {"discussion": 0.0, "session": 0.0, "idle": 0.0, "turns": 0}
+    for idea in IDEAS:
+        agent = Orchestrator(skills=skills, quiet=True)
+        started = time.perf_counter()
+        agent.run(idea, "critique")
+        pipeline = agent.last_chat["stats"]["pipeline"]
+        totals["session"] += time.perf_counter() - started
+        totals["discussion"] += pipeline["discussion_seconds"]
+        totals["idle"] += pipeline["idle_seconds"]
+        totals["turns"] += len(agent.turn_times)
+    return totals
+
+
+def main():
+    skills = load_all_skills(verbose=False)
+    print(f"{len(IDEAS)} sessions, {config.MAX_TOTAL_ROUNDS} rounds each, "
+          f"~{config.SCRIPTED_LATENCY}s per call (0.5x - 1.5x)\n")
+    print(f"{'mode':<14} {'discussion':>11} {'session':>9} {'idle':>8} {'turns':>6}")
+    results = {}
+    for label, stagger in MODES:
+        results[label] = r = run(stagger, skills)
+        print(f"{label:<14} {r['discussion']:>10.2f}s {r['session']:>8.2f}s {r['idle']:>7.2f}s {r['turns']:>6}")
+
+    barrier = results["barrier"]
+    for label, _ in MODES[1:]:
+        r = results[label]
+        print(f"\n{label}: discussion {1 - r['discussion'] / barrier['discussion']:.0%} faster, "
+              f"idle {barrier['idle'] - r['idle']:.1f}s less")
+
+
+if __name__ == "__main__":
+    main()
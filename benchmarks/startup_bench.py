@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cold-start import time and time to first token, with and without
+connection prewarming.
+
+Each run is a fresh Python process talking to standin_server.py over HTTP,
+so it pays for everything a real first launch does: importing the agent,
+importing the OpenAI SDK, and opening the connection. The "user" takes
+TYPING_SECONDS to type their idea; with prewarming, the SDK import and the
+handshake happen during that time instead of after it.
+
+Reports, per mode (median of RUNS):
+- imports: time to import the orchestrator (what the CLI does at startup)
+- first token: from "Enter" to the first streamed token of the first call
+
+Usage:
+    python benchmarks/startup_bench.py
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PORT = 8017
+RUNS = 5
+TYPING_SECONDS = 1.5
+
+# Runs in the child process. argv[1] is "1" to prewarm while "typing".
+CHILD = f"""
+import sys, threading, time
+started = time.perf_counter()
+sys.path.insert(0, {str(ROOT)!r})
+import config
+config.LLM_BACKEND = "openai"
+config.OPENAI_API_KEY = "x"
+config.OPENAI_BASE_URL = "http://localhost:{PORT}/v1"
+config.HEDGE_REQUESTS = False
+from orchestrator import Orchestrator
+imports = time.perf_counter() - started
+import llm
+if sys.argv[1] == "1":
+    threading.Thread(target=llm.prewarm, daemon=True).start()
+time.sleep({TYPING_SECONDS})  # The user types their idea
+entered = time.perf_counter()
+stream = llm.stream("You are a skeptical VC.", "AI pet translator for dogs and cats")
+next(iter(stream))
+first_token = time.perf_counter() - entered
+print({{"imports": imports, "first_token": first_token}})
+"""
+
+
+def run_child(prewarm: bool) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, "1" if prewarm else "0"],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1].replace("'", '"'))
+
+
+def main():
+    server = subprocess.Popen(
+        [sys.executable, str(ROOT / "standin_server.py"), "--port", str(PORT)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        time.sleep(1.0)  # Let the server bind
+        print(f"Cold starts against standin_server.py, {RUNS} runs each, {TYPING_SECONDS}s of typing\n")
+        print(f"{'mode':<12} {'imports':>9} {'first token':>12}")
+        results = {}
+        for prewarm in (False, True):
+            runs = [run_child(prewarm) for _ in range(RUNS)]
+            mode = "prewarm" if prewarm else "cold"
+            results[mode] = {key: statistics.median(r[key] for r in runs) for key in ("imports", "first_token")}
+            print(f"{mode:<12} {results[mode]['imports']:>8.3f}s {results[mode]['first_token']:>11.3f}s")
+
+        saved = results["cold"]["first_token"] - results["prewarm"]["first_token"]
+        print(f"\nPrewarming saves {saved:.3f}s before the first token")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark: hierarchical sub-panels vs. a flat 16-persona panel.
+
+Runs the same 16-persona panel through eight rounds twice - once flat, once
+in sub-panels of 4 - on the scripted backend. Simulated latency has a fixed
+part plus a per-token part, like a real model, so longer prompts cost time.
+
+Reports rounds/sec, prompt tokens per round and the largest persona prompt.
+
+Usage:
+    python benchmarks/subpanel_bench.py
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import config  # noqa: E402
+
+config.LLM_BACKEND = "scripted"
+config.SCRIPTED_LATENCY = 0.2  # Seconds per call (0.5x - 1.5x)
+config.SCRIPTED_LATENCY_PER_1K = 0.4  # Plus this per 1k prompt tokens
+config.SKILLS_DIR = str(ROOT / "skills")
+config.MAX_PARALLEL_CALLS = 16  # Everyone can speak at once in both modes
+config.MAX_TOTAL_ROUNDS = 8
+config.MAX_SILENT_ROUNDS = 8
+
+import llm  # noqa: E402
+from orchestrator import Orchestrator, Panel  # noqa: E402
+from skill_loader import Skill, load_all_skills  # noqa: E402
+
+PANEL_SIZE = 16
+SUBPANEL_SIZE = 4
+IDEA = "AI pet translator for dogs and cats, sold as a collar with a subscription app"
+
+
+def make_panel(skills: dict[str, Skill]) -> Panel:
+    """16 personas: the library's personas, then numbered copies of them."""
+    base = [skill for skill in skills.values() if "personas" in skill.path]
+    personas = []
+    for i in range(PANEL_SIZE):
+        source = base[i % len(base)]
+        name = f"{source.name}-{i + 1}"
+        # Distinct content, so identical prompts don't get coalesced
+        content = f"You are {name}, persona {i + 1} of {PANEL_SIZE}.\n\n{source.content}"
+        personas.append(Skill(name, source.description, content, "<bench>"))
+    return Panel(personas=personas)
+
+
+def run(subpanel_size: int, skills: dict[str, Skill], panel: Panel) -> dict:
+    config.SUBPANEL_SIZE = subpanel_size
+    agent = Orchestrator(skills=skills, quiet=True)
+    usage_before = llm.usage_stats()
+    agent.run(IDEA, "critique", panel=panel)
+    usage_after = llm.usage_stats()
+
+    rounds = len(agent.round_latencies)
+    prompt_tokens = usage_after["prompt_tokens"] - usage_before["prompt_tokens"]
+    return {
+        "rounds_per_sec": rounds / sum(agent.round_latencies),
+        "tokens_per_round": prompt_tokens / rounds,
+        "largest_prompt": max(agent.upload_bytes) // 4,
+        "calls": usage_after["calls"] - usage_before["calls"],
+    }
+
+
+def main():
+    skills = load_all_skills()
+    panel = make_panel(skills)
+
+    flat = run(0, skills, panel)
+    hierarchical = run(SUBPANEL_SIZE, skills, panel)
+
+    print(f"\n{PANEL_SIZE} personas, {config.MAX_TOTAL_ROUNDS} rounds\n")
+    print(f"{'':>24}  {'rounds/sec':>10}  {'tokens/round':>12}  {'largest prompt':>14}  {'calls':>5}")
+    for label, result in ((f"flat", flat), (f"sub-panels of {SUBPANEL_SIZE}", hierarchical)):
+        print(f"{label:>24}  {result['rounds_per_sec']:>10.2f}  {result['tokens_per_round']:>12.0f}  "
+              f"{result['largest_prompt']:>11} tok  {result['calls']:>5}")
+    print(f"\nTokens per round: {hierarchical['tokens_per_round'] / flat['tokens_per_round']:.0%} of flat; "
+          f"rounds/sec: {hierarchical['rounds_per_sec'] / flat['rounds_per_sec']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark: using the founder's typing time for background work.
+
+Runs an interactive session on the scripted backend where a simulated
+founder takes TYPING_SECONDS to answer after every round - once idle while
+waiting, once precomputing (running summary, next round's prompts, a
+connection re-warm). Simulated latency grows with prompt size, so a
+summary that reads notes plus a few new turns is faster than one that
+reads the whole discussion.
+
+Reports the final summary's time and prompt tokens, and what finished
+during each wait.
+
+Usage:
+    python benchmarks/think_time_bench.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import config  # noqa: E402
+
+config.LLM_BACKEND = "scripted"
+config.SCRIPTED_LATENCY = 0.3  # Seconds per call (0.5x - 1.5x)
+config.SCRIPTED_LATENCY_PER_1K = 0.5  # Plus this per 1k prompt tokens
+config.SKILLS_DIR = str(ROOT / "skills")
+config.MAX_TOTAL_ROUNDS = 5
+config.MAX_SILENT_ROUNDS = 5
+
+from orchestrator import Orchestrator  # noqa: E402
+from skill_loader import load_all_skills  # noqa: E402
+
+TYPING_SECONDS = 2.0
+IDEA = "AI pet translator for dogs and cats, sold as a collar with a subscription app"
+
+
+def simulated_founder(self, allow_empty: bool = False) -> str:
+    time.sleep(TYPING_SECONDS)
+    return "We charge $15/month and start with dog owners in big cities."
+
+
+def run(precompute: bool, skills: dict) -> dict:
+    config.THINK_TIME_PRECOMPUTE = precompute
+    agent = Orchestrator(skills=skills, interactive=True, quiet=True)
+    agent._get_founder_input = simulated_founder.__get__(agent)
+    agent.run(IDEA, "critique")
+    summary = agent.budget.report()["phases"]["summary"]
+    finished = sum(len(wait["finished"]) for wait in agent.think_time)
+    return {"seconds": summary["seconds"], "tokens": summary["tokens"], "finished": finished}
+
+
+def main():
+    skills = load_all_skills(verbose=False)
+    print(f"{config.MAX_TOTAL_ROUNDS} rounds, founder answers after every round in {TYPING_SECONDS}s\n")
+    print(f"{'while typing':<14} {'summary':>9} {'summary tokens':>15} {'work finished':>14}")
+    results = {}
+    for precompute in (False, True):
+        label = "precompute" if precompute else "idle"
+        results[label] = run(precompute, skills)
+        r = results[label]
+        print(f"{label:<14} {r['seconds']:>8.2f}s {r['tokens']:>15} {r['finished']:>14}")
+
+    idle, busy = results["idle"]["seconds"], results["precompute"]["seconds"]
+    print(f"\nFinal summary: {1 - busy / idle:.0%} faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Transcript vs. the old list-of-dicts discussion.
+
+Replays a session of N turns (4 personas per round). Every turn builds the
+persona context, every round asks the moderator, and the session ends with
+the summary and markdown export - the same text work the orchestrator does,
+without any LLM calls.
+
+Usage:
+    python benchmarks/transcript_bench.py
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from transcript import Transcript  # noqa: E402
+
+PERSONAS = ["skeptical-vc", "early-adopter", "budget-conscious", "pet-owner"]
+MESSAGE = "I like the core insight, but the unit economics look shaky. " * 3
+REPEATS = 3
+
+
+# The old path: re-walk and re-join the whole list on every call
+
+def old_context(discussion: list[dict]) -> str:
+    parts = ["Product idea: AI pet translator\n"]
+    if discussion:
+        parts.append("Previous discussion:")
+        for entry in discussion:
+            parts.append(f"- {entry['persona']} (round {entry['round']}): {entry['message']}")
+        parts.append("")
+    parts.append("Respond to what others have said.")
+    return '\n'.join(parts)
+
+
+def old_recent(discussion: list[dict]) -> str:
+    return '\n'.join([f"- {d['persona']}: {d['message']}" for d in discussion[-10:]])
+
+
+def old_summary(discussion: list[dict]) -> str:
+    return '\n'.join([f"- {d['persona']}: {d['message']}" for d in discussion])
+
+
+def old_markdown(discussion: list[dict]) -> str:
+    lines = []
+    current_round = 0
+    for entry in discussion:
+        if entry["round"] != current_round:
+            current_round = entry["round"]
+            lines.append(f"\n### Round {current_round}\n")
+        lines.append(f"**🎭 {entry['persona']}:**")
+        lines.append(f"{entry['message']}\n")
+    return "\n".join(lines)
+
+
+def run_old(num_turns: int):
+    discussion = []
+    for i in range(num_turns):
+        old_context(discussion)
+        discussion.append({"persona": PERSONAS[i % 4], "round": i // 4 + 1, "message": MESSAGE})
+        if i % 4 == 3:
+            old_recent(discussion)
+    old_summary(discussion)
+    old_markdown(discussion)
+
+
+# The new path
+
+def new_context(transcript: Transcript) -> str:
+    parts = ["Product idea: AI pet translator\n"]
+    if transcript:
+        parts.append("Previous discussion:")
+        parts.append(transcript.history_text())
+        parts.append("")
+    parts.append("Respond to what others have said.")
+    return '\n'.join(parts)
+
+
+def run_new(num_turns: int):
+    transcript = Transcript()
+    for i in range(num_turns):
+        new_context(transcript)
+        transcript.append(PERSONAS[i % 4], i // 4 + 1, MESSAGE)
+        if i % 4 == 3:
+            transcript.recent_text(10)
+    transcript.summary_text()
+    transcript.markdown_text()
+
+
+def measure(fn, num_turns: int) -> tuple[float, int]:
+    """Best-of-N wall time (seconds) and peak traced memory (bytes)."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        fn(num_turns)
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    fn(num_turns)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    print(f"{'turns':>6}  {'list-of-dicts':>14}  {'Transcript':>11}  {'speedup':>8}  {'peak mem (old → new)':>24}")
+    for num_turns in (10, 100, 1000):
+        old_time, old_peak = measure(run_old, num_turns)
+        new_time, new_peak = measure(run_new, num_turns)
+        print(
+            f"{num_turns:>6}  {old_time * 1000:>12.2f}ms  {new_time * 1000:>9.2f}ms  "
+            f"{old_time / new_time:>7.1f}x  {old_peak / 1024:>9.0f}KiB → {new_peak / 1024:.0f}KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Budget - Wall-clock and token limits for one session.
+
+Production needs guarantees like "a verdict within 90 seconds" or "under
+30k tokens per idea". A SessionBudget tracks what a run has spent and tells
+the orchestrator how to play each round as the budget runs down:
+
+    budget left     the next round...
+    > 50%           runs normally
+    <= 50%          asks for lower reasoning effort
+    <= 35%          also sends only recent turns (compact context)
+    <= 20%          also skips the moderator
+    too little      doesn't happen - the discussion stops
+
+KEY CONCEPT: The summary is the one thing a session must produce, so its
+estimated cost is held back as a reserve that rounds can never spend.
+"Budget left" is always measured after the reserve. The time reserve is the
+slowest call seen so far (config.BUDGET_SUMMARY_SECONDS until there is one),
+and neither reserve takes more than config.BUDGET_RESERVE_MAX_SHARE of its
+budget - a tight budget still gets rounds.
+"""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import config
+from scheduler import Session
+
+# How much more the next round costs than the last one (the context grows)
+_ROUND_GROWTH_SECONDS = 1.1
+_ROUND_GROWTH_TOKENS = 1.25
+
+
+@dataclass
+class RoundPlan:
+    """
+    How to run the next round.
+
+    Attributes:
+        mode: "normal", "low-effort", "compact", "no-moderator" or "stop"
+        reasoning_effort: Effort to ask the model for (None = its default)
+        compact: Send personas only the most recent turns
+        skip_moderator: Don't ask the moderator whether to question the founder
+        reason: Why we're not running normally
+    """
+    mode: str = "normal"
+    reasoning_effort: str | None = None
+    compact: bool = False
+    skip_moderator: bool = False
+    reason: str = ""
+
+    @property
+    def stop(self) -> bool:
+        return self.mode == "stop"
+
+
+class SessionBudget:
+    """
+    Tracks one session's time and tokens against its limits.
+
+    A limit of None means unlimited; with neither limit set, every round
+    runs normally and this only records where the time and tokens went.
+    """
+
+    def __init__(self, session: Session, seconds: float | None = None, tokens: int | None = None):
+        self.session = session
+        self.seconds = seconds or None
+        self.tokens = tokens or None
+        self.started = time.perf_counter()
+        self.phases = {}  # name -> {"seconds", "tokens"}
+        self.rounds = []  # {"round", "mode", "seconds", "tokens"}
+        self.adaptations = []  # Human-readable notes, in order
+        self.longest_call = 0.0  # Seconds, over measured calls - sizes the summary's time reserve
+
+    @property
+    def enabled(self) -> bool:
+        return self.seconds is not None or self.tokens is not None
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @contextmanager
+    def phase(self, name: str):
+        """Charge the time and tokens spent in this block to a named phase."""
+        started = time.perf_counter()
+        tokens_before = self.session.tokens()
+        try:
+            yield
+        finally:
+            entry = self.phases.setdefault(name, {"seconds": 0.0, "tokens": 0})
+            entry["seconds"] += time.perf_counter() - started
+            entry["tokens"] += self.session.tokens() - tokens_before
+
+    def record_call(self, seconds: float):
+        """Note how long a single call took."""
+        self.longest_call = max(self.longest_call, seconds)
+
+    def shortfall(self) -> str | None:
+        """
+        Why the budget can't cover one round plus the summary, by the
+        estimates before any call is made (None if it can).
+        """
+        round_and_summary = 2 * config.BUDGET_SUMMARY_SECONDS  # A round is about one call
+        if self.seconds is not None and self.seconds < round_and_summary:
+            return (f"{self.seconds:g}s is less than one round plus the summary usually take "
+                    f"(~{round_and_summary:.0f}s)")
+        round_and_summary = 2 * self._summary_tokens(0)
+        if self.tokens is not None and self.tokens < round_and_summary:
+            return (f"{self.tokens} tokens is less than one round plus the summary usually take "
+                    f"(~{round_and_summary})")
+        return None
+
+    @staticmethod
+    def _summary_tokens(summary_chars: int) -> int:
+        return (summary_chars + 1000) // 4 + config.BUDGET_SUMMARY_COMPLETION_TOKENS
+
+    def record_round(self, round_num: int, mode: str, seconds: float, tokens: int):
+        self.rounds.append({"round": round_num, "mode": mode, "seconds": seconds, "tokens": tokens})
+
+    def reserve(self, summary_chars: int) -> tuple[float, int]:
+        """(seconds, tokens) held back for the summary of a discussion this long."""
+        seconds = self.longest_call or config.BUDGET_SUMMARY_SECONDS
+        tokens = self._summary_tokens(summary_chars)
+        if self.seconds is not None:
+            seconds = min(seconds, config.BUDGET_RESERVE_MAX_SHARE * self.seconds)
+        if self.tokens is not None:
+            tokens = min(tokens, int(config.BUDGET_RESERVE_MAX_SHARE * self.tokens))
+        return seconds, tokens
+
+    def remaining(self, summary_chars: int) -> float:
+        """Fraction of the spendable (non-reserved) budget left, over the tightest limit."""
+        reserve_seconds, reserve_tokens = self.reserve(summary_chars)
+        fractions = [1.0]
+        if self.seconds is not None:
+            usable = self.seconds - reserve_seconds
+            fractions.append((usable - self.elapsed()) / usable if usable > 0 else 0.0)
+        if self.tokens is not None:
+            usable = self.tokens - reserve_tokens
+            fractions.append((usable - self.session.tokens()) / usable if usable > 0 else 0.0)
+        return max(0.0, min(fractions))
+
+    def plan_round(self, round_num: int, summary_chars: int) -> RoundPlan:
+        """
+        Decide how to run the next round.
+
+        Round 1 always runs (in the cheapest mode if need be). After that, a
+        round only runs if one like the last - a bit bigger - still fits
+        in front of the summary reserve.
+        """
+        if not self.enabled:
+            return RoundPlan()
+
+        reserve_seconds, reserve_tokens = self.reserve(summary_chars)
+        if self.rounds and round_num > 1:
+            last = self.rounds[-1]
+            if self.seconds is not None and \
+                    self.elapsed() + last["seconds"] * _ROUND_GROWTH_SECONDS + reserve_seconds > self.seconds:
+                return self._adapt(round_num, RoundPlan("stop", reason="another round would eat the summary's time"))
+            if self.tokens is not None and \
+                    self.session.tokens() + last["tokens"] * _ROUND_GROWTH_TOKENS + reserve_tokens > self.tokens:
+                return self._adapt(round_num, RoundPlan("stop", reason="another round would eat the summary's tokens"))
+
+        left = self.remaining(summary_chars)
+        reason = f"{left:.0%} of the budget left"
+        if left <= config.BUDGET_SKIP_MODERATOR_AT:
+            plan = RoundPlan("no-moderator", config.BUDGET_LOW_EFFORT, compact=True, skip_moderator=True, reason=reason)
+        elif left <= config.BUDGET_COMPACT_AT:
+            plan = RoundPlan("compact", config.BUDGET_LOW_EFFORT, compact=True, reason=reason)
+        elif left <= config.BUDGET_LOW_EFFORT_AT:
+            plan = RoundPlan("low-effort", config.BUDGET_LOW_EFFORT, reason=reason)
+        else:
+            plan = RoundPlan()
+        return self._adapt(round_num, plan)
+
+    def _adapt(self, round_num: int, plan: RoundPlan) -> RoundPlan:
+        """Note the plan when the mode changes."""
+        previous = self.rounds[-1]["mode"] if self.rounds else "normal"
+        if plan.mode != previous:
+            self.adaptations.append(f"round {round_num}: {plan.mode} ({plan.reason or 'budget recovered'})")
+        return plan
+
+    def report(self) -> dict:
+        """Limits, what was spent per phase and round, and every adaptation."""
+        elapsed = self.elapsed()
+        tokens = self.session.tokens()
+        other = {
+            "seconds": max(0.0, elapsed - sum(p["seconds"] for p in self.phases.values())),
+            "tokens": max(0, tokens - sum(p["tokens"] for p in self.phases.values())),
+        }
+        return {
+            "limits": {"seconds": self.seconds, "tokens": self.tokens},
+            "spent": {"seconds": elapsed, "tokens": tokens},
+            "phases": {**self.phases, "other": other},
+            "rounds": self.rounds,
+            "adaptations": self.adaptations,
+        }
@@ -8,10 +8,105 @@ import os
 
 # OpenAI API settings
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
+OPENAI_BASE_URL = os.environ.get("OPENAI_BASE_URL") or None  # None = api.openai.com
 MODEL = "gpt-5-mini"  # The model to use for all LLM calls
 
+# LLM backend: "openai", "openai-compatible" (your own server) or "scripted" (offline, deterministic)
+LLM_BACKEND = os.environ.get("HOTSEAT_BACKEND", "openai")
+
+# Send some roles to a different backend, e.g. a local model for the moderator and selector
+ROLE_BACKENDS = {
+    "moderator": os.environ.get("HOTSEAT_MODERATOR_BACKEND"),
+    "selector": os.environ.get("HOTSEAT_SELECTOR_BACKEND"),
+}
+
+# OpenAI-compatible server (llama.cpp, vLLM, ...)
+LOCAL_BASE_URL = os.environ.get("HOTSEAT_LOCAL_BASE_URL", "http://localhost:8080/v1")
+LOCAL_MODEL = os.environ.get("HOTSEAT_LOCAL_MODEL", "local-model")
+LOCAL_API_KEY = os.environ.get("HOTSEAT_LOCAL_API_KEY", "")
+
+# Scripted backend
+SCRIPTED_SCRIPT = os.environ.get("HOTSEAT_SCRIPT") or None  # Optional JSON file of replies
+SCRIPTED_LATENCY = float(os.environ.get("HOTSEAT_SCRIPTED_LATENCY", "0"))  # Simulated seconds per call
+SCRIPTED_LATENCY_PER_1K = float(os.environ.get("HOTSEAT_SCRIPTED_LATENCY_PER_1K", "0"))  # Extra seconds per 1k prompt tokens
+
 # Agent settings
 SKILLS_DIR = "skills"  # Where skill files live
 MAX_SILENT_ROUNDS = 3  # Auto-stop if no questions for founder after this many rounds
 MAX_TOTAL_ROUNDS = 10  # Safety limit to prevent infinite loops
-NUM_PERSONAS = 4  # How many personas to use (mix of core + dynamic)
+BASE_PANEL_SIZE = 4  # Panel the selector's default instructions produce (2-3 library + 1-2 dynamic)
+NUM_PERSONAS = BASE_PANEL_SIZE  # How many personas to use (mix of core + dynamic)
+SUBPANEL_SIZE = int(os.environ.get("HOTSEAT_SUBPANEL_SIZE", "0"))  # Split bigger panels into sub-panels of this size (0 = never)
+
+# Request hedging - duplicate a call that's slow to produce its first token
+HEDGE_REQUESTS = os.environ.get("HOTSEAT_HEDGE", "") == "1"  # Off by default
+HEDGE_BUDGET = 0.10  # Max extra calls, as a fraction of all calls
+HEDGE_DEFAULT_DELAY = 10.0  # Seconds to wait before hedging until we have enough samples
+HEDGE_MIN_SAMPLES = 20  # First-token samples needed before using the p95 threshold
+
+# Concurrency
+MAX_PARALLEL_CALLS = 8  # Concurrent LLM calls within one session (persona turns, persona generation)
+MAX_CONCURRENT_CALLS = int(os.environ.get("HOTSEAT_MAX_CONCURRENT", "16"))  # Across all sessions in this process
+BATCH_MAX_WAIT = 30.0  # Seconds a batch call can be passed over by interactive ones before it goes next
+
+# Conversation state - each persona keeps its own thread and only sends new turns
+CONVERSATION_STATE = os.environ.get("HOTSEAT_CONVERSATION_STATE", "") == "1"  # Off by default
+
+# Request coalescing - identical in-flight calls share one upstream request
+COALESCE_REQUESTS = os.environ.get("HOTSEAT_COALESCE", "1") != "0"  # On by default
+
+# Moderator - read should_ask/question from the stream and skip the rest of the reply
+MODERATOR_EARLY_DECISION = os.environ.get("HOTSEAT_MODERATOR_EARLY", "1") != "0"  # On by default
+
+# Think time - while the founder types, summarize so far and prepare the next round
+THINK_TIME_PRECOMPUTE = os.environ.get("HOTSEAT_THINK_TIME", "1") != "0"  # On by default
+
+# Job queue - batch runs spread over worker processes (main.py enqueue / worker / status)
+JOB_QUEUE = os.environ.get("HOTSEAT_QUEUE", "jobs.db")  # SQLite file; share it to share the work
+JOB_LEASE_SECONDS = 120  # A worker that stops renewing for this long loses the job
+JOB_MAX_ATTEMPTS = 3  # Tries per job (errors and expired leases both count)
+JOB_POLL_SECONDS = 5  # How often an idle `worker --wait` checks for new jobs
+
+# Meta-report - map-reduce over saved sessions (main.py report)
+META_SESSION_CHARS = 16000  # Discussion characters the map step reads per session
+META_REDUCE_FANIN = 40  # Items merged per reduce call (must exceed META_THEMES)
+META_THEMES = 10  # Themes kept per list (risks, each persona's objections)
+
+# Staggered rounds - a persona starts its next turn after this many new turns
+# from others instead of waiting for the whole round (0 = a barrier per round)
+STAGGER_TURNS = int(os.environ.get("HOTSEAT_STAGGER", "0"))
+
+# Condensed skills - shorter skill text in persona prompts from round 2 on
+SKILL_CONDENSE = os.environ.get("HOTSEAT_CONDENSE_SKILLS", "off")  # "off", "strip" or "llm"
+SKILL_CONDENSE_WORDS = 120  # Length limit for LLM-condensed skills
+
+# Idea digest - long ideas are condensed once into a brief for routine prompts
+IDEA_DIGEST_THRESHOLD = int(os.environ.get("HOTSEAT_DIGEST_THRESHOLD", "3000"))  # Characters; 0 = never condense
+IDEA_DIGEST_WORDS = 250  # Length limit for the brief
+CACHE_DIR = os.environ.get("HOTSEAT_CACHE_DIR", ".hotseat_cache")  # Digests and other derived data
+
+# Near-duplicate ideas - reuse (or start from) earlier sessions on almost the same idea
+DEDUP_MODE = os.environ.get("HOTSEAT_DEDUP", "off")  # "off", "seed" (reuse the panel) or "reuse" (the result)
+DEDUP_THRESHOLD = float(os.environ.get("HOTSEAT_DEDUP_THRESHOLD", "0.8"))  # Estimated similarity (0-1)
+DEDUP_INDEX = os.environ.get("HOTSEAT_DEDUP_INDEX", os.path.join(CACHE_DIR, "ideas.db"))  # SQLite LSH index
+DEDUP_SHINGLE_CHARS = 5  # Characters per shingle
+DEDUP_PERMUTATIONS = 128  # MinHash signature length
+DEDUP_BANDS = 32  # LSH bands (of PERMUTATIONS / BANDS values each)
+
+# Startup - warm the API connection in the background while the user types
+PREWARM_CONNECTIONS = os.environ.get("HOTSEAT_PREWARM", "1") != "0"  # On by default
+
+# Matrix mode - many ideas × tasks in one go
+MATRIX_PARALLEL_CELLS = 4  # Runs in flight at once (their LLM calls share MAX_PARALLEL_CALLS)
+
+# Session budgets - "a verdict within N seconds / under N tokens" (0 = no limit)
+SESSION_TIME_BUDGET = float(os.environ.get("HOTSEAT_TIME_BUDGET", "0"))  # Seconds per session
+SESSION_TOKEN_BUDGET = int(os.environ.get("HOTSEAT_TOKEN_BUDGET", "0"))  # Prompt + completion tokens per session
+BUDGET_LOW_EFFORT_AT = 0.50  # Budget left at which rounds ask for lower reasoning effort
+BUDGET_COMPACT_AT = 0.35  # ...and send personas only the most recent turns
+BUDGET_SKIP_MODERATOR_AT = 0.20  # ...and skip the moderator
+BUDGET_LOW_EFFORT = "low"  # Reasoning effort for budget-saving rounds
+BUDGET_COMPACT_TURNS = 8  # Turns a persona sees in compact mode
+BUDGET_SUMMARY_SECONDS = 15.0  # Expected summary time until calls have been measured
+BUDGET_RESERVE_MAX_SHARE = 0.5  # The summary's reserve never takes more than this share of a budget
+BUDGET_SUMMARY_COMPLETION_TOKENS = 1500  # Output tokens held back for the summary (reasoning included)
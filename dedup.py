@@ -0,0 +1,217 @@
+"""
+Dedup - Spot ideas we've already discussed, worded a little differently.
+
+Idea intake is full of near-duplicates: the same pitch with a new tagline, a
+typo fixed, a sentence reordered. Each one would otherwise pay for a full
+multi-round session.
+
+Every finished session is fingerprinted and added to an index on disk. Before
+a new session, its idea is looked up there, and a near-duplicate (estimated
+similarity at or above config.DEDUP_THRESHOLD) can be used two ways:
+
+- reuse: same task - return the earlier session's discussion and summary
+  instead of running a new one
+- seed: skip skill selection and persona generation, and start from the
+  earlier session's panel
+
+KEY CONCEPT: The fingerprint is a MinHash signature of the idea's
+character shingles. Two signatures agree in each position with probability
+equal to the Jaccard similarity of the shingle sets, so comparing them
+estimates how much text the ideas share. Locality-sensitive hashing splits
+each signature into bands and indexes every band: ideas that share any
+band are candidates, so a lookup only compares against a handful of past
+sessions instead of all of them.
+
+The index is one SQLite file (config.DEDUP_INDEX). Workers that share it
+share each other's results.
+"""
+
+import hashlib
+import json
+import random
+import re
+import sqlite3
+import struct
+import threading
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+
+import config
+
+_PRIME = (1 << 61) - 1  # Mersenne prime for the hash permutations
+_MAX_HASH = (1 << 32) - 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    idea TEXT NOT NULL,
+    task TEXT NOT NULL,
+    signature BLOB NOT NULL,
+    panel TEXT NOT NULL,
+    chat TEXT NOT NULL,
+    tokens INTEGER NOT NULL,
+    panel_tokens INTEGER NOT NULL,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bands (
+    band INTEGER NOT NULL,
+    bucket TEXT NOT NULL,
+    session_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bands_bucket ON bands (band, bucket);
+"""
+
+
+def _permutations(count: int) -> list[tuple[int, int]]:
+    """(a, b) for the hash functions h(x) = (a*x + b) mod p. Fixed seed: signatures must match across runs."""
+    rng = random.Random(0x5EED)
+    return [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(count)]
+
+
+_PERMUTATIONS = _permutations(config.DEDUP_PERMUTATIONS)
+
+
+def shingles(text: str, size: int | None = None) -> set[int]:
+    """
+    The idea's overlapping character shingles (after lowercasing and
+    collapsing punctuation and whitespace), hashed to 32 bits.
+    """
+    size = size or config.DEDUP_SHINGLE_CHARS
+    text = re.sub(r"[\W_]+", " ", text.lower()).strip()
+    if len(text) <= size:
+        pieces = {text}
+    else:
+        pieces = {text[i:i + size] for i in range(len(text) - size + 1)}
+    return {int.from_bytes(hashlib.blake2b(p.encode(), digest_size=4).digest(), "big") for p in pieces}
+
+
+def fingerprint(text: str) -> list[int]:
+    """The MinHash signature of `text`: the minimum of each permuted hash over its shingles."""
+    hashed = shingles(text)
+    return [min((a * x + b) % _PRIME & _MAX_HASH for x in hashed) for a, b in _PERMUTATIONS]
+
+
+def similarity(a: list[int], b: list[int]) -> float:
+    """Estimated Jaccard similarity: the share of signature positions that agree."""
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def _bands(signature: list[int]) -> list[tuple[int, str]]:
+    """(band number, bucket) for each LSH band of the signature."""
+    rows = len(signature) // config.DEDUP_BANDS
+    return [
+        (band, hashlib.blake2b(struct.pack(f"{rows}Q", *signature[band * rows:(band + 1) * rows]),
+                               digest_size=8).hexdigest())
+        for band in range(config.DEDUP_BANDS)
+    ]
+
+
+@dataclass
+class Match:
+    """
+    A past session on a near-duplicate idea.
+
+    Attributes:
+        session_id: Its row in the index
+        similarity: Estimated Jaccard similarity of the two ideas
+        idea: The earlier idea's text
+        task: The earlier session's task
+        panel: {"personas": [{name, description, content}], "reasoning"}
+        chat: The earlier session's saved chat (what save_chat writes as JSON)
+        tokens: Tokens the earlier session used in total
+        panel_tokens: Tokens its skill selection (and idea digest) used
+        created: Unix time it was indexed
+    """
+    session_id: int
+    similarity: float
+    idea: str
+    task: str
+    panel: dict
+    chat: dict
+    tokens: int
+    panel_tokens: int
+    created: float
+
+
+class IdeaIndex:
+    """The on-disk LSH index. Every method opens its own connection (thread- and process-safe)."""
+
+    def __init__(self, path: str | None = None):
+        self.path = path or config.DEDUP_INDEX
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as db:
+            db.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)  # We manage transactions
+        db.row_factory = sqlite3.Row
+        return db
+
+    def add(self, idea: str, task: str, panel: dict, chat: dict, tokens: int, panel_tokens: int,
+            signature: list[int] | None = None) -> int:
+        """Index a finished session. Returns its id."""
+        signature = signature or fingerprint(idea)
+        with closing(self._connect()) as db:
+            db.execute("BEGIN IMMEDIATE")
+            session_id = db.execute(
+                "INSERT INTO sessions (idea, task, signature, panel, chat, tokens, panel_tokens, created) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (idea, task, struct.pack(f"{len(signature)}Q", *signature), json.dumps(panel),
+                 json.dumps(chat), tokens, panel_tokens, time.time()),
+            ).lastrowid
+            db.executemany("INSERT INTO bands (band, bucket, session_id) VALUES (?, ?, ?)",
+                           [(band, bucket, session_id) for band, bucket in _bands(signature)])
+            db.execute("COMMIT")
+        return session_id
+
+    def find(self, idea: str, task: str | None = None, signature: list[int] | None = None) -> Match | None:
+        """
+        The most similar past session at or above config.DEDUP_THRESHOLD.
+
+        With `task`, a session on that task wins over a more similar one on
+        another task (only same-task results can be reused).
+        """
+        signature = signature or fingerprint(idea)
+        with closing(self._connect()) as db:
+            candidates = set()
+            for band, bucket in _bands(signature):
+                candidates.update(row[0] for row in db.execute(
+                    "SELECT session_id FROM bands WHERE band = ? AND bucket = ?", (band, bucket)))
+            if not candidates:
+                return None
+            rows = db.execute(
+                f"SELECT * FROM sessions WHERE id IN ({','.join('?' * len(candidates))})", list(candidates)
+            ).fetchall()
+
+        scored = []
+        for row in rows:
+            stored = list(struct.unpack(f"{len(row['signature']) // 8}Q", row["signature"]))
+            score = similarity(signature, stored)
+            if score >= config.DEDUP_THRESHOLD:
+                scored.append((row["task"] == task, score, row["created"], row))
+        if not scored:
+            return None
+        _, score, _, row = max(scored, key=lambda entry: entry[:3])  # Same task, then most similar, then newest
+        return Match(row["id"], score, row["idea"], row["task"], json.loads(row["panel"]),
+                     json.loads(row["chat"]), row["tokens"], row["panel_tokens"], row["created"])
+
+
+_stats = {"checked": 0, "reused": 0, "seeded": 0, "tokens_saved": 0}
+_stats_lock = threading.Lock()
+
+
+def record(outcome: str | None, tokens_saved: int = 0):
+    """Count one lookup: outcome "reused", "seeded" or None (no near-duplicate)."""
+    with _stats_lock:
+        _stats["checked"] += 1
+        if outcome:
+            _stats[outcome] += 1
+        _stats["tokens_saved"] += tokens_saved
+
+
+def dedup_stats() -> dict:
+    """Lookups, reuses, seeds and estimated tokens saved in this process."""
+    with _stats_lock:
+        return dict(_stats)
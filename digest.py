@@ -0,0 +1,98 @@
+"""
+Idea Digest - A bounded brief of a long product idea.
+
+The product idea goes into every persona turn, every moderator check and
+every sub-panel condensation - around fifty calls a session. For a one-line
+idea that's nothing; for a five-page pitch it's most of the prompt.
+
+Ideas longer than config.IDEA_DIGEST_THRESHOLD characters are condensed
+once into a brief of at most config.IDEA_DIGEST_WORDS words, and the brief
+goes into those routine prompts instead. The skill selector and the final
+summary still see the full text.
+
+KEY CONCEPT: The brief depends only on the idea text (and the digest
+settings), so it's cached on disk by content hash. Re-running the same pitch
+- or running it against three tasks in matrix mode - condenses it once.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import config
+import llm
+
+# Bump when the prompt changes, so old briefs aren't reused
+_PROMPT_VERSION = 1
+
+_SYSTEM_PROMPT = """You condense product pitches into a brief for a panel of advisors.
+
+Keep everything an advisor needs to judge the idea:
+- what the product is and who it's for
+- the problem and why now
+- business model, pricing and any numbers (keep them exact)
+- traction, team, competitors and stated risks, if given
+
+Drop marketing language, repetition and formatting. Don't add opinions or
+anything that isn't in the pitch. Write plain prose and short lists, at most
+{words} words."""
+
+
+@dataclass
+class IdeaDigest:
+    """
+    The text routine prompts should use for the idea.
+
+    Attributes:
+        text: The brief (or the idea itself, if it was short enough)
+        full_chars: Length of the original idea
+        condensed: Whether text is a brief rather than the original
+        cached: Whether the brief came from the cache (no LLM call)
+        tokens_spent: Estimated tokens the condensing call cost (0 if cached)
+    """
+    text: str
+    full_chars: int
+    condensed: bool = False
+    cached: bool = False
+    tokens_spent: int = 0
+
+    @property
+    def chars_saved(self) -> int:
+        """Characters saved every time the brief is sent instead of the idea."""
+        return max(0, self.full_chars - len(self.text))
+
+
+def _cache_path(product_idea: str) -> Path:
+    key = f"{_PROMPT_VERSION}\x00{config.IDEA_DIGEST_WORDS}\x00{product_idea}"
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return Path(config.CACHE_DIR) / "digests" / f"{digest}.json"
+
+
+def digest_idea(product_idea: str) -> IdeaDigest:
+    """
+    The brief for this idea: the idea itself if it's short, else a cached or
+    freshly condensed version.
+    """
+    full_chars = len(product_idea)
+    if not config.IDEA_DIGEST_THRESHOLD or full_chars <= config.IDEA_DIGEST_THRESHOLD:
+        return IdeaDigest(product_idea, full_chars)
+
+    path = _cache_path(product_idea)
+    try:
+        return IdeaDigest(json.loads(path.read_text())["brief"], full_chars, condensed=True, cached=True)
+    except (OSError, ValueError, KeyError):
+        pass  # Not cached yet (or unreadable) - condense it
+
+    system_prompt = _SYSTEM_PROMPT.format(words=config.IDEA_DIGEST_WORDS)
+    brief = llm.chat(system_prompt, f"Product pitch:\n\n{product_idea}", role="summary").strip()
+    tokens_spent = (len(system_prompt) + full_chars + len(brief)) // 4
+    if not brief or len(brief) >= full_chars:
+        return IdeaDigest(product_idea, full_chars, tokens_spent=tokens_spent)  # Nothing gained
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"brief": brief, "full_chars": full_chars}))
+    except OSError:
+        pass  # Caching is an optimization; the brief is still good
+    return IdeaDigest(brief, full_chars, condensed=True, tokens_spent=tokens_spent)
@@ -0,0 +1,417 @@
+"""
+Events - What a session has to say, as typed events instead of print() calls.
+
+The orchestrator, skill loader and skill selector publish events (a session
+started, a persona's tokens, a turn finished, the moderator decided, the
+summary, errors); sinks decide what to do with them:
+
+- ConsoleSink: renders them for a terminal, like the CLI always has
+- JsonlSink: one JSON object per line, for logs and replays
+- SSESink: Server-Sent Events over HTTP, for a web front end
+- NullSink: drops them (benchmarks)
+
+    bus = EventBus([ConsoleSink(), JsonlSink("events.jsonl")])
+    agent = Orchestrator(bus=bus)
+
+Code that isn't handed a bus publishes to the one bound with bus_scope()
+(the Orchestrator binds its own for the length of a run), or else to the
+default bus, which prints to the console.
+
+KEY CONCEPT: Publishing is a queue put. One dispatcher thread per bus hands
+events to the sinks, so a slow terminal, disk or web client never holds up
+an LLM call. Each event is written in one piece, so concurrent sessions no
+longer interleave half-lines. Call flush() before anything that must appear
+after the events so far (reading input, exiting).
+"""
+
+import abc
+import atexit
+import contextvars
+import json
+import queue
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+
+import scheduler
+
+
+@dataclass
+class Event:
+    """
+    Base class of every event.
+
+    Attributes:
+        session: Name of the session that published it (None outside a run)
+        time: Unix time it was published
+    """
+    session: str | None = field(default=None, kw_only=True)
+    time: float = field(default_factory=time.time, kw_only=True)
+
+    @property
+    def type(self) -> str:
+        """snake_case class name: "turn_complete", "persona_token", ..."""
+        return re.sub(r"(?<!^)(?=[A-Z])", "_", type(self).__name__).lower()
+
+    def to_dict(self) -> dict:
+        return {"type": self.type, **asdict(self)}
+
+
+@dataclass
+class Notice(Event):
+    """Progress, stats and anything else meant for a human. level: "info" or "warning"."""
+    text: str
+    level: str = "info"
+
+
+@dataclass
+class Error(Event):
+    """Something failed; the session may or may not carry on."""
+    message: str
+
+
+@dataclass
+class SessionStarted(Event):
+    task: str
+    idea: str
+
+
+@dataclass
+class SkillsSelected(Event):
+    """The skill selector's choice (before dynamic personas are generated)."""
+    task_skill: str | None
+    personas: list[str]
+    reasoning: str
+
+
+@dataclass
+class RoundStarted(Event):
+    round: int
+    staggered: bool = False
+
+
+@dataclass
+class PersonaToken(Event):
+    """A piece of a persona's reply as it streams (only sent to sinks with wants_tokens)."""
+    persona: str
+    round: int
+    text: str
+
+
+@dataclass
+class TurnComplete(Event):
+    """
+    A finished turn. kind: "persona", "founder" or "position" (a sub-panel's
+    condensed position in the plenary).
+    """
+    persona: str
+    round: int
+    message: str
+    kind: str = "persona"
+
+
+@dataclass
+class ModeratorDecision(Event):
+    """After a round: does the panel want to ask the founder, and is anyone there to answer."""
+    round: int
+    should_ask: bool
+    question: str | None
+    asked_founder: bool
+
+
+@dataclass
+class Summary(Event):
+    text: str
+
+
+class Sink(abc.ABC):
+    """
+    Receives every event published to a bus, on the bus's dispatcher thread.
+    Subclasses must implement handle().
+
+    wants_tokens: Whether this sink wants PersonaToken events. Persona
+    replies are only streamed when some sink does.
+    """
+    wants_tokens = False
+
+    @abc.abstractmethod
+    def handle(self, event: Event):
+        ...
+
+    def close(self):
+        pass
+
+
+class NullSink(Sink):
+    """Drops everything. A bus with only null sinks doesn't even queue."""
+
+    def handle(self, event: Event):
+        pass
+
+
+class ConsoleSink(Sink):
+    """Renders events for a terminal, the way the CLI has always looked."""
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.staggered = set()  # Sessions whose turns need their round shown
+
+    def handle(self, event: Event):
+        text = self._render(event)
+        if text is not None:
+            stream = self.stream or sys.stdout
+            stream.write(text + "\n")
+            stream.flush()
+
+    def _render(self, event: Event) -> str | None:
+        if isinstance(event, Notice):
+            return event.text
+        if isinstance(event, Error):
+            return f"❌ {event.message}"
+        if isinstance(event, SessionStarted):
+            return f"\n{'='*60}\n🎯 Task: {event.task}\n💡 Product: {event.idea}\n{'='*60}\n"
+        if isinstance(event, SkillsSelected):
+            return f"\n📋 Skill selection reasoning: {event.reasoning or 'N/A'}"
+        if isinstance(event, RoundStarted):
+            if event.staggered:
+                self.staggered.add(event.session)
+            label = f"📢 ROUND {event.round}" + (" (staggered)" if event.staggered else "")
+            return f"\n{'─'*40}\n{label}\n{'─'*40}"
+        if isinstance(event, TurnComplete):
+            if event.kind == "founder":
+                lines = "\n".join(f"   {line}" for line in event.message.split("\n"))
+                return f"\n👤 FOUNDER:\n{lines}\n"
+            icon = "🏛️ " if event.kind == "position" else "🎭"
+            round_label = f" (round {event.round})" if event.session in self.staggered else ""
+            return f"\n{icon} {event.persona}{round_label}:\n   {event.message}\n"
+        if isinstance(event, ModeratorDecision):
+            if not event.asked_founder:
+                return None
+            return (f"\n{'─'*40}\n❓ PERSONAS WANT TO ASK YOU:\n   {event.question}\n"
+                    f"\n   (Type 'stop' to end, or answer. Use \"\"\" for multi-line)")
+        if isinstance(event, Summary):
+            return event.text
+        return None  # PersonaToken and anything new: not for the terminal
+
+
+class JsonlSink(Sink):
+    """
+    Appends every event to a file as one JSON object per line.
+
+    tokens: Also log PersonaToken events. Off by default - persona replies
+    are only streamed for sinks that want tokens, and streamed calls aren't
+    hedged.
+    """
+
+    def __init__(self, path: str, tokens: bool = False):
+        self.path = path
+        self.wants_tokens = tokens
+        self._file = open(path, "a", encoding="utf-8")
+
+    def handle(self, event: Event):
+        self._file.write(json.dumps(event.to_dict(), ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class SSESink(Sink):
+    """
+    Serves events as Server-Sent Events at http://host:port/events.
+
+    Every connected client gets its own queue of up to `backlog` events; a
+    client that falls that far behind misses events rather than slowing
+    anyone down.
+    """
+
+    wants_tokens = True
+
+    def __init__(self, port: int, host: str = "127.0.0.1", backlog: int = 1000):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # Only when serving
+
+        self.backlog = backlog
+        self.clients = set()  # One queue.Queue per connected client
+        self.lock = threading.Lock()
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/events":
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                sink._serve(self.wfile)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, name="events-sse", daemon=True).start()
+
+    def _serve(self, wfile):
+        """Write this client's events until it disconnects (or the sink closes)."""
+        client = queue.Queue(maxsize=self.backlog)
+        with self.lock:
+            self.clients.add(client)
+        try:
+            while True:
+                try:
+                    message = client.get(timeout=15)
+                except queue.Empty:
+                    message = ": keep-alive\n\n"
+                if message is None:
+                    return
+                wfile.write(message.encode())
+                wfile.flush()
+        except OSError:
+            pass  # Client went away
+        finally:
+            with self.lock:
+                self.clients.discard(client)
+
+    def handle(self, event: Event):
+        message = f"event: {event.type}\ndata: {json.dumps(event.to_dict(), ensure_ascii=False)}\n\n"
+        with self.lock:
+            clients = list(self.clients)
+        for client in clients:
+            try:
+                client.put_nowait(message)
+            except queue.Full:
+                pass  # Too far behind - it misses this one
+
+    def close(self):
+        with self.lock:
+            clients = list(self.clients)
+        for client in clients:
+            try:
+                client.put_nowait(None)
+            except queue.Full:
+                pass
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class EventBus:
+    """
+    Hands published events to its sinks on one background thread, in order.
+
+    A sink that raises doesn't stop the others (or the session); its error
+    is reported once on stderr.
+    """
+
+    def __init__(self, sinks: list[Sink] | None = None):
+        self.sinks = list(sinks or [])
+        self.live = any(not isinstance(sink, NullSink) for sink in self.sinks)
+        self.wants_tokens = any(sink.wants_tokens for sink in self.sinks)
+        self._queue = queue.Queue()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._failed = set()  # Sinks that raised (reported once)
+
+    def publish(self, event: Event):
+        """Queue `event` for the sinks. Never blocks on them."""
+        if not self.live:
+            return
+        if event.session is None:
+            session = scheduler.current_session()
+            event.session = None if session.name == "default" else session.name
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._dispatch, name="event-bus", daemon=True)
+                    self._thread.start()
+        self._queue.put(event)
+
+    def flush(self):
+        """Wait until every event published so far has been handled."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        """Flush, then close the sinks."""
+        self.flush()
+        for sink in self.sinks:
+            sink.close()
+
+    def _dispatch(self):
+        while True:
+            event = self._queue.get()
+            try:
+                for sink in self.sinks:
+                    try:
+                        sink.handle(event)
+                    except Exception as e:
+                        if sink not in self._failed:
+                            self._failed.add(sink)
+                            print(f"Warning: event sink {type(sink).__name__} failed: {e}", file=sys.stderr)
+            finally:
+                self._queue.task_done()
+
+
+NULL_BUS = EventBus([NullSink()])
+
+_default_bus = None
+_default_lock = threading.Lock()
+_current_bus = contextvars.ContextVar("hotseat_event_bus", default=None)
+
+
+def default_bus() -> EventBus:
+    """The process-wide bus (console only, unless configure() says otherwise)."""
+    global _default_bus
+    if _default_bus is None:
+        with _default_lock:
+            if _default_bus is None:
+                _default_bus = EventBus([ConsoleSink()])
+                atexit.register(_default_bus.flush)
+    return _default_bus
+
+
+def configure(console: bool = True, jsonl: str | None = None, sse_port: int | None = None) -> EventBus:
+    """Set up the default bus's sinks (main.py's --events / --events-sse). Returns it."""
+    global _default_bus
+    sinks = []
+    if console:
+        sinks.append(ConsoleSink())
+    if jsonl:
+        sinks.append(JsonlSink(jsonl))
+    sse = SSESink(sse_port) if sse_port is not None else None
+    if sse:
+        sinks.append(sse)
+    with _default_lock:
+        if _default_bus is not None:
+            _default_bus.flush()
+        _default_bus = bus = EventBus(sinks or [NullSink()])
+        atexit.register(bus.close)
+    if sse:
+        bus.publish(Notice(f"📡 Streaming events at http://127.0.0.1:{sse.port}/events"))
+    return bus
+
+
+def current() -> EventBus:
+    """The bus bound to this context, or the default one."""
+    return _current_bus.get() or default_bus()
+
+
+def publish(event: Event):
+    """Publish to the current bus."""
+    current().publish(event)
+
+
+@contextmanager
+def bus_scope(bus: EventBus):
+    """Publish everything inside this block (pool work bound with scheduler.bind included) to `bus`."""
+    token = _current_bus.set(bus)
+    try:
+        yield bus
+    finally:
+        _current_bus.reset(token)
@@ -0,0 +1,288 @@
+"""
+Job Queue - Batch runs spread over processes and machines.
+
+One process is limited by one interpreter. For overnight runs, ideas go into
+a queue and any number of worker processes - on this box or on others that
+share the filesystem - take jobs from it:
+
+    python main.py enqueue pets.md fintech.md --tasks critique,find-pmf
+    python main.py worker &        # as many as you like, anywhere
+    python main.py status
+
+The queue is one SQLite file. No broker, no server.
+
+KEY CONCEPT: Workers don't own jobs, they lease them. Claiming a job sets a
+lease expiry, and the worker renews it while the session runs. If a worker
+dies, its lease runs out and the next worker to look picks the job up again
+(up to config.JOB_MAX_ATTEMPTS tries). A worker whose lease was taken over
+can't overwrite the new owner's result.
+
+Claims happen inside a write transaction (BEGIN IMMEDIATE), so two workers
+never get the same job. On a network filesystem, SQLite needs working file
+locks (NFSv4 / SMB usually are fine, some NFSv3 setups are not).
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+
+import config
+import dedup
+import scheduler
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    label TEXT NOT NULL,
+    idea TEXT NOT NULL,
+    task TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_until REAL,
+    created REAL NOT NULL,
+    started REAL,
+    finished REAL,
+    result_path TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id);
+"""
+
+
+@dataclass
+class Job:
+    """One idea × task to run."""
+    id: int
+    label: str
+    idea: str
+    task: str
+    attempts: int
+
+
+class JobQueue:
+    """
+    The SQLite-backed queue. Every method opens its own connection, so one
+    JobQueue can be shared by a worker's threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as db:
+            db.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)  # We manage transactions
+        db.row_factory = sqlite3.Row
+        return db
+
+    def enqueue(self, jobs: list[tuple[str, str, str]]) -> list[int]:
+        """Add (label, idea, task) jobs. Returns their ids."""
+        now = time.time()
+        with closing(self._connect()) as db:
+            db.execute("BEGIN IMMEDIATE")
+            ids = [
+                db.execute("INSERT INTO jobs (label, idea, task, created) VALUES (?, ?, ?, ?)",
+                           (label, idea, task, now)).lastrowid
+                for label, idea, task in jobs
+            ]
+            db.execute("COMMIT")
+            return ids
+
+    def claim(self, worker: str, lease_seconds: float) -> Job | None:
+        """
+        Lease the oldest job that's queued, or whose lease ran out.
+
+        Jobs that have used up their attempts are marked failed on the way.
+        (Closing the connection rolls back a transaction left open by an error.)
+        """
+        with closing(self._connect()) as db:
+            while True:
+                now = time.time()
+                db.execute("BEGIN IMMEDIATE")
+                row = db.execute(
+                    "SELECT * FROM jobs WHERE status = ? OR (status = ? AND lease_until < ?) ORDER BY id LIMIT 1",
+                    (QUEUED, RUNNING, now),
+                ).fetchone()
+                if row is None:
+                    db.execute("COMMIT")
+                    return None
+
+                if row["attempts"] >= config.JOB_MAX_ATTEMPTS:
+                    db.execute(
+                        "UPDATE jobs SET status = ?, finished = ?, error = ? WHERE id = ?",
+                        (FAILED, now, row["error"] or f"lease expired on {row['worker']}", row["id"]),
+                    )
+                    db.execute("COMMIT")
+                    continue
+
+                db.execute(
+                    "UPDATE jobs SET status = ?, attempts = attempts + 1, worker = ?, lease_until = ?, "
+                    "started = ? WHERE id = ?",
+                    (RUNNING, worker, now + lease_seconds, now, row["id"]),
+                )
+                db.execute("COMMIT")
+                return Job(row["id"], row["label"], row["idea"], row["task"], row["attempts"] + 1)
+
+    def renew(self, job_id: int, worker: str, lease_seconds: float) -> bool:
+        """Extend our lease. False if the job is no longer ours."""
+        with closing(self._connect()) as db:
+            cursor = db.execute(
+                "UPDATE jobs SET lease_until = ? WHERE id = ? AND worker = ? AND status = ?",
+                (time.time() + lease_seconds, job_id, worker, RUNNING),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker: str, result_path: str) -> bool:
+        """Record the result. False if the lease was lost (someone else has the job)."""
+        with closing(self._connect()) as db:
+            cursor = db.execute(
+                "UPDATE jobs SET status = ?, finished = ?, result_path = ?, error = NULL, lease_until = NULL "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (DONE, time.time(), result_path, job_id, worker, RUNNING),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, job_id: int, worker: str, error: str):
+        """Record an error: back in the queue if it has attempts left, else failed."""
+        with closing(self._connect()) as db:
+            db.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts < ? THEN ? ELSE ? END, "
+                "finished = ?, error = ?, lease_until = NULL WHERE id = ? AND worker = ? AND status = ?",
+                (config.JOB_MAX_ATTEMPTS, QUEUED, FAILED, time.time(), error, job_id, worker, RUNNING),
+            )
+
+    def status(self) -> dict:
+        """Counts by status (expired leases counted separately), and every job."""
+        now = time.time()
+        with closing(self._connect()) as db:
+            jobs = [dict(row) for row in db.execute(
+                "SELECT id, label, task, status, attempts, worker, lease_until, started, finished, "
+                "result_path, error FROM jobs ORDER BY id"
+            )]
+        counts = {QUEUED: 0, RUNNING: 0, "expired": 0, DONE: 0, FAILED: 0}
+        for job in jobs:
+            if job["status"] == RUNNING and job["lease_until"] < now:
+                counts["expired"] += 1
+            else:
+                counts[job["status"]] += 1
+        return {"counts": counts, "jobs": jobs}
+
+
+def worker_name() -> str:
+    """host:pid - unique across the machines sharing a queue."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _keep_leased(queue: JobQueue, job: Job, worker: str, stop: threading.Event):
+    """Renew the lease every third of its length until the job finishes."""
+    while not stop.wait(config.JOB_LEASE_SECONDS / 3):
+        if not queue.renew(job.id, worker, config.JOB_LEASE_SECONDS):
+            print(f"⚠️  [{worker}] Lost the lease on job {job.id}; another worker has it")
+            return
+
+
+def _run_job(queue: JobQueue, job: Job, worker: str, skills: dict, pool: ThreadPoolExecutor, results_dir: str) -> bool:
+    """Run one leased job to completion. True if it succeeded."""
+    from orchestrator import Orchestrator
+
+    stop = threading.Event()
+    threading.Thread(target=_keep_leased, args=(queue, job, worker, stop), daemon=True).start()
+    started = time.perf_counter()
+    try:
+        agent = Orchestrator(skills=skills, quiet=True, shared_pool=pool, priority=scheduler.BATCH)
+        agent.run(job.idea, job.task)
+        result_path = str(Path(results_dir) / f"job{job.id:05d}_{job.task}.json")
+        agent.save_chat(filepath=result_path, format="json")
+    except Exception as e:
+        queue.fail(job.id, worker, f"{type(e).__name__}: {e}")
+        print(f"❌ [{worker}] Job {job.id} ({job.label} × {job.task}) failed "
+              f"on attempt {job.attempts}: {e}")
+        return False
+    finally:
+        stop.set()
+
+    if queue.complete(job.id, worker, result_path):
+        print(f"✅ [{worker}] Job {job.id} ({job.label} × {job.task}) done "
+              f"in {time.perf_counter() - started:.1f}s → {result_path}")
+        return True
+    print(f"⚠️  [{worker}] Job {job.id} finished after its lease was taken over; result kept at {result_path}")
+    return False
+
+
+def run_worker(
+    queue: JobQueue,
+    parallel: int = 1,
+    results_dir: str = "chats/queue",
+    wait: bool = False,
+    max_jobs: int | None = None,
+) -> dict:
+    """
+    Take jobs from the queue until it's empty (or forever, with wait=True).
+
+    Args:
+        queue: The queue to work on
+        parallel: Sessions to run at once in this process
+        results_dir: Where each job's chat JSON is written
+        wait: Keep polling for new jobs instead of exiting when none are left
+        max_jobs: Stop after claiming this many jobs
+
+    Returns:
+        {"done", "failed", "seconds", "dedup"} for this worker
+    """
+    from skill_loader import load_all_skills
+
+    worker = worker_name()
+    skills = load_all_skills(verbose=False)
+    print(f"👷 Worker {worker}: {parallel} at a time, results in {results_dir}/")
+
+    started = time.perf_counter()
+    counts = {"done": 0, "failed": 0}
+    counts_lock = threading.Lock()
+    claimed = 0
+    claimed_lock = threading.Lock()
+
+    def next_job() -> Job | None:
+        nonlocal claimed
+        while True:
+            with claimed_lock:
+                if max_jobs is not None and claimed >= max_jobs:
+                    return None
+                job = queue.claim(worker, config.JOB_LEASE_SECONDS)
+                if job is not None:
+                    claimed += 1
+                    return job
+            if not wait:
+                return None
+            time.sleep(config.JOB_POLL_SECONDS)
+
+    def runner(pool: ThreadPoolExecutor):
+        while (job := next_job()) is not None:
+            ok = _run_job(queue, job, worker, skills, pool, results_dir)
+            with counts_lock:
+                counts["done" if ok else "failed"] += 1
+
+    with ThreadPoolExecutor(max_workers=config.MAX_PARALLEL_CALLS) as calls, \
+            ThreadPoolExecutor(max_workers=parallel) as runners:
+        for future in [runners.submit(runner, calls) for _ in range(parallel)]:
+            future.result()
+
+    seconds = time.perf_counter() - started
+    print(f"👷 Worker {worker} finished: {counts['done']} done, {counts['failed']} failed in {seconds:.1f}s")
+    duplicates = dedup.dedup_stats()
+    if duplicates["checked"]:
+        print(f"♻️  Near-duplicates: {duplicates['reused']} reused, {duplicates['seeded']} seeded "
+              f"of {duplicates['checked']} sessions, ~{duplicates['tokens_saved']} tokens saved")
+    return {**counts, "seconds": seconds, "dedup": duplicates}
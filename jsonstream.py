@@ -0,0 +1,114 @@
+"""
+JSON Stream - Read fields of a JSON object while it's still being generated.
+
+The moderator answers with a JSON object, but the loop only needs two of its
+fields: should_ask and question. Both come first in the schema, so once
+they're complete the rest of the reply (the reasoning) is just latency.
+
+JsonFieldParser is fed the streamed chunks and exposes each top-level field
+as soon as its value is complete:
+
+    parser = JsonFieldParser()
+    for chunk in llm.stream(system_prompt, user_message, json_mode=True):
+        parser.feed(chunk)
+        if "should_ask" in parser.fields:
+            break
+
+KEY CONCEPT: A value is only reported once it can't change. A string is
+complete at its closing quote, an object or array at its closing bracket,
+but a number isn't complete until something other than a digit, sign,
+point or exponent follows it ("12" may become "125").
+"""
+
+import json
+import re
+
+_WHITESPACE = re.compile(r"\s*")
+_NUMBER_CHARS = "0123456789.eE+-"
+_decoder = json.JSONDecoder()
+
+
+class JsonFieldParser:
+    """
+    Incremental parser for the top level of one JSON object.
+
+    Attributes:
+        fields: Every top-level field whose value is complete, in order
+        done: The closing brace has been seen
+        failed: The text isn't a JSON object (fall back to json.loads)
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.fields = {}
+        self.done = False
+        self.failed = False
+        self._pos = 0  # Everything before this has been parsed
+        self._opened = False
+        self._need_comma = False  # A field was parsed, so the next one needs a comma
+
+    def feed(self, chunk: str):
+        """Add the next chunk and parse any fields it completed."""
+        self.text += chunk
+        while not (self.done or self.failed) and self._parse_next():
+            pass
+
+    def _skip_whitespace(self, pos: int) -> int:
+        return _WHITESPACE.match(self.text, pos).end()
+
+    def _parse_next(self) -> bool:
+        """Parse one more piece (the opening brace or a field). False if we need more text."""
+        pos = self._skip_whitespace(self._pos)
+        if pos >= len(self.text):
+            return False
+
+        if not self._opened:
+            if self.text[pos] != "{":
+                self.failed = True
+                return False
+            self._opened = True
+            self._pos = pos + 1
+            return True
+
+        if self.text[pos] == "}":
+            self.done = True
+            self._pos = pos + 1
+            return False
+        if self._need_comma:
+            if self.text[pos] != ",":
+                self.failed = True
+                return False
+            pos = self._skip_whitespace(pos + 1)
+            if pos >= len(self.text):
+                return False
+
+        # "key" : value - only consumed once all of it is here
+        if self.text[pos] != '"':
+            self.failed = True
+            return False
+        try:
+            key, pos = _decoder.raw_decode(self.text, pos)
+        except json.JSONDecodeError:
+            return False  # Key still streaming
+        pos = self._skip_whitespace(pos)
+        if pos >= len(self.text):
+            return False
+        if self.text[pos] != ":":
+            self.failed = True
+            return False
+        pos = self._skip_whitespace(pos + 1)
+        if pos >= len(self.text):
+            return False
+
+        try:
+            value, end = _decoder.raw_decode(self.text, pos)
+        except json.JSONDecodeError:
+            return False  # Value still streaming (or malformed - json.loads will tell)
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and \
+                (end >= len(self.text) or self.text[end] in _NUMBER_CHARS):
+            return False  # More of the number may follow ("1.5" of "1.5e3")
+
+        self.fields[key] = value
+        self._pos = end
+        self._need_comma = True
+        return True
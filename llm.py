@@ -1,23 +1,63 @@
 """
-LLM wrapper for OpenAI API.
+LLM wrapper - the one place the agent calls the model from.
 
 This module handles all communication with the LLM.
 Key concept: Every call can have a different system prompt -
 this is how we "inject" skills to change behavior.
-"""
 
-from openai import OpenAI
-import config
+Where a call goes is decided by the backend (see backends.py): OpenAI, a
+self-hosted OpenAI-compatible server, or an offline scripted backend. A
+`role` ("selector", "moderator", ...) lets some calls use a different
+backend than the personas.
+
+Optional request hedging (config.HEDGE_REQUESTS): if a call hasn't produced
+its first token by the p95 of recent first-token times, we fire a duplicate
+and keep whichever answers first. A budget caps how many extra calls we make.
+Streamed calls are hedged too - the winner's chunks are passed on as they
+arrive. The async calls (achat, astream) aren't hedged.
+
+Calls made inside `with llm.reasoning_effort("low"):` ask the model for that
+reasoning effort (session budgets use this to spend less as they run low).
+
+Optional conversation state (config.CONVERSATION_STATE): a Conversation
+keeps one persona's thread going, so each call only uploads what's new.
 
+Every upstream call waits for a slot from the scheduler (scheduler.py),
+which caps concurrency across sessions and keeps them fair.
 
-def get_client() -> OpenAI:
-    """Create OpenAI client."""
-    return OpenAI(api_key=config.OPENAI_API_KEY)
+Request coalescing (config.COALESCE_REQUESTS, on by default): identical
+calls that are in flight at the same time share one upstream request.
+Every caller gets the same answer; streamed chunks are fanned out to each
+subscriber, and late subscribers replay what they missed.
+"""
+
+import json
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import config
+from backends import (
+    ConversationExpired,
+    LLMBackend,
+    TextStream,
+    UnsupportedFeature,
+    all_backends,
+    current_reasoning_effort,
+    get_backend,
+    reasoning_effort,
+)
+from metrics import percentile
+from scheduler import Session, bind, current_session, recording_charges, scheduler
 
 
 def chat(
     system_prompt: str,
     user_message: str,
+    role: str | None = None,
 ) -> str:
     """
     Send a message to the LLM and get a response.
@@ -25,6 +65,7 @@ def chat(
     Args:
         system_prompt: Instructions that shape LLM behavior (this is where skills get injected!)
         user_message: The actual user input or task
+        role: Which part of the agent is calling (picks the backend, see config.ROLE_BACKENDS)
 
     Returns:
         The LLM's response text
@@ -32,37 +73,618 @@ def chat(
     KEY INSIGHT: By changing system_prompt, we change how the LLM behaves.
     Same LLM, different personality based on what instructions we inject.
     """
-    client = get_client()
-
-    response = client.chat.completions.create(
-        model=config.MODEL,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_message}
-        ]
-    )
-
-    return response.choices[0].message.content
+    backend = get_backend(role)
+    if config.HEDGE_REQUESTS:
+        call = lambda: _hedged_completion(backend, system_prompt, user_message)
+    else:
+        call = lambda: backend.chat(system_prompt, user_message)
+    return _single_flight.call((backend.name, "chat", current_reasoning_effort(), system_prompt, user_message), call, kind=role)
 
 
 def chat_json(
     system_prompt: str,
     user_message: str,
+    role: str | None = None,
 ) -> str:
     """
     Same as chat(), but requests JSON output.
 
     Used for structured responses like skill selection.
     """
-    client = get_client()
+    backend = get_backend(role)
+    if config.HEDGE_REQUESTS:
+        call = lambda: _hedged_completion(backend, system_prompt, user_message, json_mode=True)
+    else:
+        call = lambda: backend.chat_json(system_prompt, user_message)
+    return _single_flight.call((backend.name, "chat_json", current_reasoning_effort(), system_prompt, user_message), call, kind=role)
 
-    response = client.chat.completions.create(
-        model=config.MODEL,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_message}
-        ],
-        response_format={"type": "json_object"}
+
+def stream(
+    system_prompt: str,
+    user_message: str,
+    role: str | None = None,
+    json_mode: bool = False,
+) -> TextStream:
+    """
+    Same as chat(), but yields the response as it's generated.
+
+    Identical streams in flight at the same time share one upstream stream.
+    """
+    backend = get_backend(role)
+    if config.HEDGE_REQUESTS:
+        open_stream = lambda: _hedged_stream(backend, system_prompt, user_message, json_mode)
+    else:
+        open_stream = lambda: backend.stream(system_prompt, user_message, json_mode=json_mode)
+    return _single_flight.stream(
+        (backend.name, "stream", current_reasoning_effort(), system_prompt, user_message, json_mode),
+        open_stream,
+        kind=role,
     )
 
-    return response.choices[0].message.content
+
+@asynccontextmanager
+async def _async_slot(role: str | None):
+    """scheduler.slot() for coroutines: the wait happens off the event loop."""
+    import asyncio
+
+    ticket = await asyncio.to_thread(scheduler.acquire, role or "default")
+    try:
+        yield ticket
+    finally:
+        scheduler.release(ticket)
+
+
+async def achat(system_prompt: str, user_message: str, role: str | None = None) -> str:
+    """Async version of chat() (no hedging)."""
+    async with _async_slot(role):
+        return await get_backend(role).achat(system_prompt, user_message)
+
+
+async def achat_json(system_prompt: str, user_message: str, role: str | None = None) -> str:
+    """Async version of chat_json() (no hedging)."""
+    async with _async_slot(role):
+        return await get_backend(role).achat_json(system_prompt, user_message)
+
+
+async def astream(
+    system_prompt: str,
+    user_message: str,
+    role: str | None = None,
+    json_mode: bool = False,
+) -> AsyncIterator[str]:
+    """Async version of stream()."""
+    async with _async_slot(role):
+        async for chunk in get_backend(role).astream(system_prompt, user_message, json_mode=json_mode):
+            yield chunk
+
+
+def prewarm() -> float:
+    """
+    Create every configured backend and warm its connection. Returns seconds.
+
+    Meant to run in a background thread while the user is still typing: the
+    first real call then skips importing the SDK and the DNS/TLS handshake.
+    """
+    started = time.perf_counter()
+    for role in {None, *config.ROLE_BACKENDS}:
+        try:
+            get_backend(role).prewarm()
+        except Exception:
+            pass  # A real call will raise the same error, with context
+    return time.perf_counter() - started
+
+
+def usage_stats() -> dict:
+    """Calls and tokens per backend, plus totals, for this process."""
+    by_backend = {kind: backend.usage() for kind, backend in all_backends().items()}
+    totals = {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0}
+    for usage in by_backend.values():
+        for key in totals:
+            totals[key] += usage.get(key, 0)
+    return {**totals, "by_backend": by_backend}
+
+
+# ----------------------------------------------------------------------------
+# Request coalescing (single-flight)
+# ----------------------------------------------------------------------------
+
+class _Flight:
+    """One upstream call in progress; joiners wait on `done`."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.charges = []  # (prompt, completion) charged for the upstream call
+
+
+class _StreamFlight:
+    """
+    One upstream stream in progress, fanned out to every subscriber.
+
+    A pump thread reads the upstream stream into a shared buffer. Each
+    subscriber reads the buffer from the start, so someone who joins late
+    still gets the whole reply. The upstream stream is closed once every
+    subscriber has closed theirs.
+
+    The leader's session is charged by the backend as usual; once the
+    stream is done, every session that joined is charged the same usage.
+    """
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.chunks = []
+        self.finished = False
+        self.error = None
+        self.subscribers = 0
+        self.upstream = None
+        self.joiners = []  # Sessions of the subscribers after the first
+        self.charges = []  # (prompt, completion) charged for the upstream stream
+
+    def pump(self, open_stream, on_finish, kind: str):
+        try:
+            with scheduler.slot(kind), recording_charges(self.charges):
+                self._pump(open_stream)
+        except Exception as e:
+            self.error = e
+        finally:
+            on_finish()  # No one joins after this
+            for session in self.joiners:
+                _charge_joined(session, self.charges)
+            with self.cond:
+                self.finished = True
+                self.cond.notify_all()
+
+    def _pump(self, open_stream):
+        upstream = open_stream()
+        with self.cond:
+            self.upstream = upstream
+            abandoned = self.subscribers == 0
+        if abandoned:
+            upstream.close()
+        for chunk in upstream:
+            with self.cond:
+                self.chunks.append(chunk)
+                self.cond.notify_all()
+
+    def subscribe(self) -> TextStream:
+        with self.cond:
+            self.subscribers += 1
+        closed = threading.Event()
+
+        def chunks():
+            index = 0
+            while True:
+                with self.cond:
+                    while index >= len(self.chunks) and not self.finished and not closed.is_set():
+                        self.cond.wait()
+                    if closed.is_set():
+                        return
+                    if index < len(self.chunks):
+                        chunk = self.chunks[index]
+                        index += 1
+                    elif self.error is not None:
+                        raise self.error
+                    else:
+                        return
+                yield chunk
+
+        def unsubscribe():
+            with self.cond:
+                closed.set()
+                self.subscribers -= 1
+                last = self.subscribers == 0 and not self.finished
+                upstream = self.upstream
+                self.cond.notify_all()
+            if last and upstream is not None:
+                upstream.close()
+
+        return TextStream(chunks(), on_close=unsubscribe)
+
+
+def _charge_joined(session: Session, charges: list[tuple[int, int]]):
+    """Charge a caller that joined an identical call with what that call used."""
+    session.charge(sum(prompt for prompt, _ in charges), sum(completion for _, completion in charges),
+                   coalesced=True)
+
+
+class _SingleFlight:
+    """
+    Process-wide table of in-flight requests, keyed by everything that
+    determines the answer (backend, call type, reasoning effort, prompts).
+
+    The first caller for a key makes the upstream call; anyone asking the
+    same thing before it finishes waits for that result instead of making
+    their own.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.flights = {}
+        self.streams = {}
+        self.requests = 0
+        self.upstream_calls = 0
+        self.coalesced = 0
+
+    def _count(self, joined: bool):
+        self.requests += 1
+        if joined:
+            self.coalesced += 1
+        else:
+            self.upstream_calls += 1
+
+    def call(self, key: tuple, call, kind: str | None = None):
+        kind = kind or "default"
+        if not config.COALESCE_REQUESTS:
+            with scheduler.slot(kind):
+                return call()
+
+        with self.lock:
+            flight = self.flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.flights[key] = _Flight()
+            self._count(joined=not leader)
+
+        if not leader:
+            flight.done.wait()
+            _charge_joined(current_session(), flight.charges)
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            with scheduler.slot(kind), recording_charges(flight.charges):
+                flight.result = call()
+            return flight.result
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.flights[key]
+            flight.done.set()
+
+    def stream(self, key: tuple, open_stream, kind: str | None = None) -> TextStream:
+        coalesce = config.COALESCE_REQUESTS
+
+        with self.lock:
+            flight = self.streams.get(key) if coalesce else None
+            leader = flight is None
+            if leader:
+                flight = _StreamFlight()
+                if coalesce:
+                    self.streams[key] = flight
+            if coalesce:
+                self._count(joined=not leader)
+            if not leader:
+                flight.joiners.append(current_session())
+            # Subscribe before the pump starts, so it can't finish unobserved
+            subscription = flight.subscribe()
+
+        if leader:
+            def finish():
+                with self.lock:
+                    if self.streams.get(key) is flight:
+                        del self.streams[key]
+
+            pump = bind(flight.pump, open_stream, finish, kind or "default")
+            threading.Thread(target=pump, daemon=True).start()
+        return subscription
+
+
+_single_flight = _SingleFlight()
+
+
+def coalescing_stats() -> dict:
+    """How many requests were answered by joining one already in flight."""
+    with _single_flight.lock:
+        requests = _single_flight.requests
+        upstream = _single_flight.upstream_calls
+        coalesced = _single_flight.coalesced
+    return {
+        "enabled": config.COALESCE_REQUESTS,
+        "requests": requests,
+        "upstream_calls": upstream,
+        "coalesced": coalesced,
+        "coalesced_ratio": coalesced / requests if requests else 0.0,
+    }
+
+
+# ----------------------------------------------------------------------------
+# Request hedging
+# ----------------------------------------------------------------------------
+
+class _HedgeStats:
+    """
+    Process-wide hedging bookkeeping, shared by every call.
+
+    Tracks recent time-to-first-token samples (to compute the hedge
+    threshold) and how many extra calls we've spent against the budget.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.first_token_times = deque(maxlen=200)
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def threshold(self) -> float:
+        """Seconds to wait for a first token before hedging."""
+        with self.lock:
+            samples = list(self.first_token_times)
+        if len(samples) < config.HEDGE_MIN_SAMPLES:
+            return config.HEDGE_DEFAULT_DELAY
+        return percentile(samples, 95)
+
+    def record_call(self):
+        with self.lock:
+            self.calls += 1
+
+    def try_spend_hedge(self) -> bool:
+        """Reserve one extra call if the budget allows it."""
+        with self.lock:
+            if self.hedges + 1 > self.calls * config.HEDGE_BUDGET:
+                return False
+            self.hedges += 1
+            return True
+
+    def record_first_token(self, seconds: float, hedged: bool):
+        with self.lock:
+            self.first_token_times.append(seconds)
+            if hedged:
+                self.hedge_wins += 1
+
+
+_hedge_stats = _HedgeStats()
+
+
+class _HedgeRace:
+    """
+    One logical request, raced across a primary and (maybe) a hedge attempt.
+
+    Each attempt streams in its own thread. The first attempt to produce a
+    token wins; the other attempt's stream is closed. The winner's chunks
+    also go to `deltas` as they arrive (None marks the end).
+    """
+
+    def __init__(self, backend: LLMBackend, system_prompt: str, user_message: str, json_mode: bool):
+        self.backend = backend
+        self.request = (system_prompt, user_message, json_mode)
+        self.lock = threading.Lock()
+        self.settled = threading.Event()  # First token seen, or everything failed
+        self.done = threading.Event()
+        self.attempts = 0
+        self.streams = {}
+        self.winner = None
+        self.result = None
+        self.error = None
+        self.failures = 0
+        self.deltas = queue.Queue()
+
+    def launch(self):
+        with self.lock:
+            index = self.attempts
+            self.attempts += 1
+        threading.Thread(target=bind(self._run, index), daemon=True).start()
+
+    def _claim(self, index: int, started: float) -> bool:
+        """Try to become the winner. Closes the other attempts on success."""
+        with self.lock:
+            if self.winner is not None or self.done.is_set():
+                return self.winner == index
+            self.winner = index
+            losers = [s for i, s in self.streams.items() if i != index]
+
+        _hedge_stats.record_first_token(time.monotonic() - started, hedged=index > 0)
+        self.settled.set()
+        for stream in losers:
+            stream.close()
+        return True
+
+    def _run(self, index: int):
+        started = time.monotonic()
+        try:
+            stream = self.backend.stream(*self.request)
+            with self.lock:
+                lost = self.winner is not None or self.done.is_set()
+                self.streams[index] = stream
+            if lost:
+                stream.close()
+                return
+
+            parts = []
+            for delta in stream:
+                if not delta:
+                    continue
+                if not parts and not self._claim(index, started):
+                    stream.close()
+                    return
+                parts.append(delta)
+                self.deltas.put(delta)
+
+            # A stream can finish without any content
+            if not parts and not self._claim(index, started):
+                return
+
+            self.result = ''.join(parts)
+            self.done.set()
+            self.deltas.put(None)
+
+        except Exception as e:
+            with self.lock:
+                self.failures += 1
+                is_winner = self.winner == index
+                all_failed = self.winner is None and self.failures == self.attempts
+            if is_winner or all_failed:
+                self.error = e
+                self.settled.set()
+                self.done.set()
+                self.deltas.put(None)
+
+    def cancel(self):
+        """Close every attempt (the reader stopped listening)."""
+        with self.lock:
+            self.done.set()
+            streams = list(self.streams.values())
+        self.settled.set()
+        self.deltas.put(None)
+        for stream in streams:
+            stream.close()
+
+
+def _hedged_completion(
+    backend: LLMBackend,
+    system_prompt: str,
+    user_message: str,
+    json_mode: bool = False
+) -> str:
+    """
+    Run a completion with a hedge: if no first token arrives by the p95
+    threshold, issue one duplicate and keep whichever answers first.
+    """
+    _hedge_stats.record_call()
+    race = _HedgeRace(backend, system_prompt, user_message, json_mode)
+    race.launch()
+
+    if not race.settled.wait(_hedge_stats.threshold()):
+        if _hedge_stats.try_spend_hedge():
+            race.launch()
+
+    race.done.wait()
+    if race.error is not None:
+        raise race.error
+    return race.result
+
+
+def _hedged_stream(
+    backend: LLMBackend,
+    system_prompt: str,
+    user_message: str,
+    json_mode: bool = False
+) -> TextStream:
+    """
+    Same race as _hedged_completion, but the winner's chunks are passed on
+    as they arrive. Closing the stream closes every attempt.
+    """
+    _hedge_stats.record_call()
+    race = _HedgeRace(backend, system_prompt, user_message, json_mode)
+    started = time.monotonic()
+    race.launch()
+
+    def chunks():
+        wait = _hedge_stats.threshold() - (time.monotonic() - started)
+        if not race.settled.wait(max(0.0, wait)):
+            if _hedge_stats.try_spend_hedge():
+                race.launch()
+        while (delta := race.deltas.get()) is not None:
+            yield delta
+        if race.error is not None:
+            raise race.error
+
+    return TextStream(chunks(), on_close=race.cancel)
+
+
+def hedging_stats() -> dict:
+    """Report how hedging has behaved so far in this process."""
+    with _hedge_stats.lock:
+        calls = _hedge_stats.calls
+        hedges = _hedge_stats.hedges
+        wins = _hedge_stats.hedge_wins
+    return {
+        "enabled": config.HEDGE_REQUESTS,
+        "calls": calls,
+        "hedges": hedges,
+        "hedge_wins": wins,
+        "extra_call_ratio": hedges / calls if calls else 0.0,
+        "threshold_seconds": _hedge_stats.threshold(),
+    }
+
+
+# ----------------------------------------------------------------------------
+# Conversation state
+# ----------------------------------------------------------------------------
+
+class Conversation:
+    """
+    One persona's ongoing thread with the model.
+
+    The full message history is always kept locally. When the backend
+    supports the Responses API, a call uploads only the new message and the
+    server continues from previous_response_id. Otherwise - or if the server
+    has forgotten the thread - the whole history is sent instead.
+    """
+
+    def __init__(self, system_prompt: str, role: str | None = None):
+        self.system_prompt = system_prompt
+        self.role = role
+        self.messages = []  # {"role": "user"|"assistant", "content": str}
+        self.previous_response_id = None
+        self.last_request_bytes = 0  # Size of the last request we uploaded
+
+    def send(self, user_message: str) -> str:
+        """Add a user message to the thread and return the model's reply."""
+        self.messages.append({"role": "user", "content": user_message})
+        with scheduler.slot(self.role or "default"):
+            reply = _continue_conversation(self, get_backend(self.role))
+        self.messages.append({"role": "assistant", "content": reply})
+        return reply
+
+
+_conversation_lock = threading.Lock()
+_responses_unsupported = set()  # Backends that rejected the Responses API
+_conversation_counts = {"stateful": 0, "resent": 0, "stateless": 0}
+
+
+def _count_conversation_call(kind: str):
+    with _conversation_lock:
+        _conversation_counts[kind] += 1
+
+
+def _continue_conversation(conversation: Conversation, backend: LLMBackend) -> str:
+    """Pick the cheapest way to continue the thread that the backend allows."""
+    if backend.name not in _responses_unsupported:
+        try:
+            try:
+                return _responses_call(conversation, backend, only_new=conversation.previous_response_id is not None)
+            except ConversationExpired:
+                # The server lost (or expired) the thread: resend everything
+                conversation.previous_response_id = None
+                return _responses_call(conversation, backend, only_new=False)
+        except UnsupportedFeature:
+            # No Responses API on this backend: stay stateless from now on
+            _responses_unsupported.add(backend.name)
+
+    return _stateless_call(conversation, backend)
+
+
+def _request_bytes(*parts) -> int:
+    return sum(len((part if isinstance(part, str) else json.dumps(part)).encode()) for part in parts)
+
+
+def _responses_call(conversation: Conversation, backend: LLMBackend, only_new: bool) -> str:
+    # Instructions are not carried over by previous_response_id, so they're always sent
+    new_input = conversation.messages[-1:] if only_new else conversation.messages
+    previous = conversation.previous_response_id if only_new else None
+
+    conversation.last_request_bytes = _request_bytes(conversation.system_prompt, new_input)
+    response_id, text = backend.respond(conversation.system_prompt, new_input, previous)
+    conversation.previous_response_id = response_id
+    _count_conversation_call("stateful" if only_new else "resent")
+    return text
+
+
+def _stateless_call(conversation: Conversation, backend: LLMBackend) -> str:
+    conversation.last_request_bytes = _request_bytes(conversation.system_prompt, conversation.messages)
+    text = backend.chat_messages(conversation.system_prompt, conversation.messages)
+    _count_conversation_call("stateless")
+    return text
+
+
+def conversation_stats() -> dict:
+    """How conversation calls were served: continued, resent in full, or stateless."""
+    with _conversation_lock:
+        counts = dict(_conversation_counts)
+    counts["responses_unsupported"] = sorted(_responses_unsupported)
+    return counts
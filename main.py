@@ -9,17 +9,42 @@ Usage:
     python main.py                          # Interactive mode
     python main.py --idea product.txt       # Read idea from file
     python main.py --idea product.txt -t 2  # From file, brainstorm mode
+    python main.py --matrix a.md b.md       # Every variant × every task
+    python main.py enqueue a.md b.md        # Queue jobs for batch workers
+    python main.py worker                   # Run queued jobs (start several)
+    python main.py status                   # Queue progress
+    python main.py report chats/            # Meta-report over saved sessions
 
 Environment:
     OPENAI_API_KEY - Your OpenAI API key
+    HOTSEAT_BACKEND - openai (default), openai-compatible or scripted
 
 Learn more about how this works by reading the code comments!
 """
 
-import argparse
-import sys
-from pathlib import Path
-from orchestrator import Orchestrator
+import time
+
+_STARTED = time.perf_counter()  # Before any other import, to measure startup
+
+import argparse  # noqa: E402
+import atexit  # noqa: E402
+import re  # noqa: E402
+import sys  # noqa: E402
+import threading  # noqa: E402
+from pathlib import Path  # noqa: E402
+from typing import TYPE_CHECKING  # noqa: E402
+
+import config  # noqa: E402
+import events  # noqa: E402
+import tracing  # noqa: E402
+
+if TYPE_CHECKING:
+    from orchestrator import Orchestrator
+
+# KEY INSIGHT: The orchestrator (and through it llm.py, and the OpenAI SDK on
+# the first call) is only imported once the arguments are parsed, and the SDK
+# import plus the connection handshake happen in the background while the
+# user is typing - not after they press Enter.
 
 
 def print_banner():
@@ -65,7 +90,7 @@ def ask_yes_no(prompt: str, default: bool = False) -> bool:
     return response in ('y', 'yes')
 
 
-def ask_save_chat(agent: Orchestrator):
+def ask_save_chat(agent: "Orchestrator"):
     """Ask user if they want to save the chat."""
     if not ask_yes_no("\n💾 Save this discussion?", default=False):
         return
@@ -146,6 +171,87 @@ def read_idea_from_file(filepath: str) -> str:
     return content
 
 
+def read_idea_family(filepath: str) -> list[str]:
+    """
+    Read an idea family: variants of one idea, separated by lines of ---.
+
+    The first variant is the base idea the panel is picked for.
+    """
+    content = read_idea_from_file(filepath)
+    variants = [v.strip() for v in re.split(r'^---\s*$', content, flags=re.MULTILINE)]
+    variants = [v for v in variants if v]
+    print(f"   ({len(variants)} variant{'s' if len(variants) != 1 else ''})")
+    return variants
+
+
+def run_matrix(agent: "Orchestrator", args):
+    """Run every idea variant against every task and save the comparison."""
+    families = {}
+    for filepath in args.matrix:
+        variants = read_idea_family(filepath)
+        if variants:
+            families[Path(filepath).stem] = variants
+
+    if not families:
+        print("❌ No ideas found in the matrix files.")
+        sys.exit(1)
+
+    tasks = [t.strip() for t in args.tasks.split(",") if t.strip()]
+    agent.run_matrix(families, tasks)
+    agent.save_matrix_report(filepath=args.save, format=args.format)
+
+
+def run_queue_command(args):
+    """enqueue, worker or status, against the SQLite job queue."""
+    from jobqueue import JobQueue, run_worker
+
+    queue = JobQueue(args.queue)
+
+    if args.command == 'enqueue':
+        tasks = [t.strip() for t in args.tasks.split(",") if t.strip()]
+        jobs = []
+        for filepath in args.files:
+            variants = read_idea_family(filepath)
+            for number, variant in enumerate(variants, 1):
+                label = Path(filepath).stem if len(variants) == 1 else f"{Path(filepath).stem} #{number}"
+                jobs.extend((label, variant, task) for task in tasks)
+        ids = queue.enqueue(jobs)
+        print(f"📥 Queued {len(ids)} jobs in {args.queue}")
+
+    elif args.command == 'worker':
+        run_worker(queue, parallel=args.parallel, results_dir=args.results,
+                   wait=args.wait, max_jobs=args.max_jobs)
+
+    else:
+        status = queue.status()
+        counts = status["counts"]
+        total = sum(counts.values())
+        print(f"📋 {args.queue}: {total} jobs · " + " · ".join(f"{n} {name}" for name, n in counts.items()))
+        for job in status["jobs"]:
+            where = job["result_path"] or job["error"] or job["worker"] or ""
+            print(f"   {job['id']:>5}  {job['status']:<8} {job['attempts']}×  "
+                  f"{job['label'][:30]:<30} {job['task']:<11} {where}")
+
+
+def start_prewarm():
+    """Create the backends and open their connections on a background thread."""
+    import llm
+
+    threading.Thread(target=llm.prewarm, name="prewarm", daemon=True).start()
+
+
+def write_traces(chrome_path: str | None, otel_path: str | None):
+    """Write recorded spans to the requested files (runs at exit)."""
+    for name, entry in sorted(tracing.summary().items(), key=lambda item: -item[1]["seconds"]):
+        print(f"   {name:<20} {entry['count']:>4}× {entry['seconds']:>7.2f}s  peak overlap {entry['peak_concurrency']}")
+    if chrome_path:
+        count = tracing.export_chrome(chrome_path)
+        print(f"🧭 Trace ({count} spans) saved to: {chrome_path}")
+    if otel_path:
+        count = tracing.export_otel(otel_path)
+        print(f"🧭 OpenTelemetry trace ({count} spans) saved to: {otel_path}")
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -157,9 +263,46 @@ Examples:
   python main.py --idea product.txt     # Read idea from file
   python main.py -i idea.md -t 2        # From file, brainstorm mode
   python main.py -i idea.md -t 3 --no-interactive
+  python main.py --matrix pets.md fintech.md --tasks critique,find-pmf
+  python main.py enqueue pets.md fintech.md --tasks critique,find-pmf
+  python main.py --backend openai worker --parallel 4
+  python main.py status
+  python main.py --save portfolio.md report chats/queue/
+
+Global options go before the command (enqueue, worker, status, report).
         """
     )
 
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+
+    enqueue = commands.add_parser('enqueue', help='Add idea files to the job queue')
+    enqueue.add_argument('files', nargs='+', metavar='FILE',
+                         help='Idea files (variants separated by --- lines become separate jobs)')
+    enqueue.add_argument('--tasks', default='critique',
+                         help='Comma-separated tasks; one job per idea × task (default: critique)')
+
+    worker = commands.add_parser('worker', help='Run jobs from the queue')
+    worker.add_argument('--parallel', type=int, default=1, metavar='N',
+                        help='Sessions to run at once in this process (default: 1)')
+    worker.add_argument('--results', default='chats/queue', metavar='DIR',
+                        help='Where to write each job\'s chat JSON (default: chats/queue)')
+    worker.add_argument('--wait', action='store_true',
+                        help='Keep waiting for new jobs instead of exiting when the queue is empty')
+    worker.add_argument('--max-jobs', type=int, metavar='N', help='Stop after N jobs')
+
+    commands.add_parser('status', help='Show queue progress')
+
+    report = commands.add_parser('report', help='Meta-report over saved sessions (chat JSON files)')
+    report.add_argument('paths', nargs='+', metavar='PATH',
+                        help='Chat JSON files or directories of them (matrix reports count per cell)')
+
+    parser.add_argument(
+        '--queue',
+        metavar='PATH',
+        default=config.JOB_QUEUE,
+        help=f'Job queue file for enqueue / worker / status (default: {config.JOB_QUEUE})'
+    )
+
     parser.add_argument(
         '-i', '--idea',
         type=str,
@@ -194,6 +337,119 @@ Examples:
         help='Format for saved chat (default: markdown)'
     )
 
+    parser.add_argument(
+        '--matrix',
+        nargs='+',
+        metavar='FILE',
+        help='Idea family files (variants separated by --- lines); runs every variant × task'
+    )
+
+    parser.add_argument(
+        '--tasks',
+        default='critique,brainstorm,find-pmf',
+        help='Comma-separated tasks for --matrix (default: all three)'
+    )
+
+    parser.add_argument(
+        '--personas',
+        type=int,
+        metavar='N',
+        help=f'Panel size to ask the skill selector for (default: {config.NUM_PERSONAS})'
+    )
+
+    parser.add_argument(
+        '--subpanel-size',
+        type=int,
+        metavar='N',
+        help='Split panels bigger than N into sub-panels of about N (hierarchical discussion)'
+    )
+
+    parser.add_argument(
+        '--stagger',
+        type=int,
+        metavar='K',
+        help='Staggered rounds: a persona speaks again once K others have (no barrier per round)'
+    )
+
+    parser.add_argument(
+        '--condense-skills',
+        choices=['off', 'strip', 'llm'],
+        help='Shorter skill text in persona prompts from round 2 on '
+             f'(default: {config.SKILL_CONDENSE})'
+    )
+
+    parser.add_argument(
+        '--dedup',
+        choices=['off', 'seed', 'reuse'],
+        help='For near-duplicates of earlier ideas: reuse their result (same task) or start from their panel '
+             f'(default: {config.DEDUP_MODE})'
+    )
+
+    parser.add_argument(
+        '--time-budget',
+        type=float,
+        metavar='SECONDS',
+        help='Finish each session (summary included) within this many seconds'
+    )
+
+    parser.add_argument(
+        '--token-budget',
+        type=int,
+        metavar='N',
+        help='Use at most about N tokens per session (summary included)'
+    )
+
+    parser.add_argument(
+        '--max-concurrent',
+        type=int,
+        metavar='N',
+        help=f'Max LLM calls in flight across all sessions (default: {config.MAX_CONCURRENT_CALLS})'
+    )
+
+    parser.add_argument(
+        '--trace',
+        metavar='PATH',
+        help='Record spans and write a Chrome trace (open in ui.perfetto.dev) on exit'
+    )
+
+    parser.add_argument(
+        '--trace-otel',
+        metavar='PATH',
+        help='Also (or instead) write the spans as OpenTelemetry OTLP/JSON'
+    )
+
+    parser.add_argument(
+        '--events',
+        metavar='PATH',
+        help='Append every session event (turns, decisions, summary) to PATH as JSON lines'
+    )
+
+    parser.add_argument(
+        '--events-sse',
+        type=int,
+        metavar='PORT',
+        help='Serve session events as Server-Sent Events at http://127.0.0.1:PORT/events '
+             '(persona replies stream token by token)'
+    )
+
+    parser.add_argument(
+        '--backend',
+        choices=['openai', 'openai-compatible', 'scripted'],
+        help='LLM backend (default: config.LLM_BACKEND / HOTSEAT_BACKEND)'
+    )
+
+    parser.add_argument(
+        '--hedge',
+        action='store_true',
+        help='Hedge slow LLM calls with a duplicate request (cuts tail latency)'
+    )
+
+    parser.add_argument(
+        '--conversation-state',
+        action='store_true',
+        help='Keep a thread per persona and only send new turns each round'
+    )
+
     return parser.parse_args()
 
 
@@ -201,7 +457,69 @@ def main():
     """Main entry point."""
     args = parse_args()
 
-    print_banner()
+    if not args.command:
+        print_banner()
+
+    if args.backend:
+        config.LLM_BACKEND = args.backend
+    if args.hedge:
+        config.HEDGE_REQUESTS = True
+    if args.conversation_state:
+        config.CONVERSATION_STATE = True
+    if args.personas:
+        config.NUM_PERSONAS = args.personas
+    if args.subpanel_size is not None:
+        config.SUBPANEL_SIZE = args.subpanel_size
+    if args.stagger is not None:
+        config.STAGGER_TURNS = args.stagger
+    if args.condense_skills:
+        config.SKILL_CONDENSE = args.condense_skills
+    if args.dedup:
+        config.DEDUP_MODE = args.dedup
+    if args.max_concurrent:
+        config.MAX_CONCURRENT_CALLS = args.max_concurrent
+    if args.events or args.events_sse is not None:
+        events.configure(jsonl=args.events, sse_port=args.events_sse)
+    if args.trace or args.trace_otel:
+        tracing.enable()
+        atexit.register(write_traces, args.trace, args.trace_otel)
+    if args.time_budget:
+        config.SESSION_TIME_BUDGET = args.time_budget
+    if args.token_budget:
+        config.SESSION_TOKEN_BUDGET = args.token_budget
+
+    if args.command == 'report':
+        from metareport import build_meta_report, save_meta_report
+
+        save_meta_report(build_meta_report(args.paths), filepath=args.save, format=args.format)
+        return
+    if args.command:
+        run_queue_command(args)
+        return
+
+    from orchestrator import Orchestrator
+    imported = time.perf_counter() - _STARTED
+    if config.PREWARM_CONNECTIONS:
+        start_prewarm()
+
+    # Matrix mode is never interactive: run everything, save the report, exit
+    if args.matrix:
+        try:
+            run_matrix(Orchestrator(), args)
+        except Exception as e:
+            print(f"❌ Error during matrix run: {e}")
+            import traceback
+            traceback.print_exc()
+            sys.exit(1)
+        return
+
+    # Initialize orchestrator (skills load in the background)
+    try:
+        agent = Orchestrator(background=True)
+    except Exception as e:
+        print(f"❌ Failed to initialize agent: {e}")
+        sys.exit(1)
+    ready = time.perf_counter() - _STARTED
 
     # Determine interactive mode
     if args.idea and args.no_interactive:
@@ -210,15 +528,10 @@ def main():
         interactive = False
     else:
         interactive = ask_yes_no("🗣️  Enable interactive mode? (interject anytime between rounds)", default=True)
+    agent.interactive = interactive
 
-    # Initialize orchestrator (loads all skills)
-    try:
-        agent = Orchestrator(interactive=interactive)
-    except Exception as e:
-        print(f"❌ Failed to initialize agent: {e}")
-        sys.exit(1)
-
-    print(f"✅ Agent ready! {'Interactive mode ON' if interactive else 'Personas will ask when needed'}\n")
+    print(f"✅ Agent ready! {'Interactive mode ON' if interactive else 'Personas will ask when needed'}")
+    print(f"🚀 Started in {ready:.2f}s (imports {imported:.2f}s)\n")
     print("ℹ️  Discussion runs until personas conclude or you type 'stop'\n")
 
     # If idea provided via CLI, run once and exit
@@ -236,8 +549,8 @@ def main():
             else:
                 ask_save_chat(agent)
 
-        except Exception as e:
-            print(f"❌ Error during discussion: {e}")
+        except Exception:
+            # The orchestrator has already reported the error
             import traceback
             traceback.print_exc()
             sys.exit(1)
@@ -264,8 +577,8 @@ def main():
             # Offer to save
             ask_save_chat(agent)
 
-        except Exception as e:
-            print(f"❌ Error during discussion: {e}")
+        except Exception:
+            # The orchestrator has already reported the error
             import traceback
             traceback.print_exc()
 
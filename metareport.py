@@ -0,0 +1,346 @@
+"""
+Meta-Report - What hundreds of saved sessions say, taken together.
+
+A batch leaves a directory of chat JSON files. No single prompt can hold
+them all, so the report is built map-reduce style:
+
+1. Map: each session is read from disk on its own and an LLM extracts
+   structured findings (verdict, score, objections per persona, risks,
+   strengths). Sessions run in parallel, and only a bounded number are
+   loaded at a time.
+2. Reduce: rankings and per-persona groupings are plain code. Objections
+   and risks are merged into recurring themes by LLM calls over groups of
+   findings, then over groups of those results, until one list is left.
+
+KEY CONCEPT: Findings are cached on disk by a hash of the session file's
+contents. Re-running the report after adding fifty sessions to a batch of
+five hundred only maps the fifty new ones.
+"""
+
+import hashlib
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+import config
+import llm
+import scheduler
+
+# Bump when the prompts change, so old findings aren't reused
+_PROMPT_VERSION = 1
+
+# Best first - how the ranking orders ideas before their scores
+_VERDICTS = ["strong", "promising", "mixed", "weak", "no-go"]
+
+_MAP_PROMPT = """You extract structured findings from one product feedback session,
+where a panel of personas discussed a product idea.
+
+Respond with JSON:
+{
+    "idea": "The idea in at most 8 words",
+    "verdict": "strong" | "promising" | "mixed" | "weak" | "no-go",
+    "score": 1-10 (how convinced the panel was overall),
+    "objections": [{"persona": "name", "objection": "one sentence"}],
+    "risks": ["one short phrase per risk"],
+    "strengths": ["one short phrase per strength"]
+}
+
+Only include what the discussion actually says."""
+
+_REDUCE_PROMPT = """You merge lists of {kind} from many product feedback sessions into recurring themes.
+
+Each input item has a "text" and a "count" (how many sessions raised it).
+Group items that are about the same thing, name each theme in a short
+phrase, and add up the counts.
+
+Respond with JSON:
+{{"themes": [{{"text": "theme", "count": total, "example": "one representative item"}}]}}
+
+Order themes by count, highest first. Keep at most {limit} themes."""
+
+
+def iter_sessions(paths: list[str]) -> Iterator[tuple[str, dict]]:
+    """
+    Yield (source, session) for every saved chat under `paths`, one file at
+    a time. Matrix reports yield one session per cell.
+    """
+    for path in paths:
+        path = Path(path)
+        files = sorted(path.rglob("*.json")) if path.is_dir() else [path]
+        for file in files:
+            try:
+                data = json.loads(file.read_text())
+            except (OSError, ValueError):
+                continue
+            if "cells" in data:
+                for cell in data["cells"]:
+                    if cell.get("summary"):
+                        yield f"{file}#{cell['family']}-{cell['variant']}-{cell['task']}", {
+                            "product_idea": cell["idea"],
+                            "task_type": cell["task"],
+                            "summary": cell["summary"],
+                            "discussion": cell["discussion"],
+                        }
+            elif "discussion" in data and "product_idea" in data:
+                yield str(file), data
+
+
+def _session_text(session: dict) -> str:
+    """What the map step reads: the idea, the summary, then the turns (capped)."""
+    turns = "\n".join(f"- {turn['persona']}: {turn['message']}" for turn in session["discussion"])
+    if len(turns) > config.META_SESSION_CHARS:
+        turns = turns[:config.META_SESSION_CHARS] + "\n[... discussion truncated ...]"
+    return f"""Product idea: {session['product_idea']}
+Task: {session.get('task_type', '')}
+
+Summary:
+{session.get('summary') or '(none)'}
+
+Discussion:
+{turns}"""
+
+
+def _cache_path(text: str) -> Path:
+    digest = hashlib.sha256(f"{_PROMPT_VERSION}\x00{text}".encode()).hexdigest()
+    return Path(config.CACHE_DIR) / "findings" / f"{digest}.json"
+
+
+def _normalize(findings: dict, session: dict) -> dict:
+    """Fill in anything the model left out, so the reduce step can rely on every key."""
+    try:
+        score = float(findings.get("score") or 0)
+    except (TypeError, ValueError):
+        score = 0.0
+    return {
+        "idea": findings.get("idea") or session["product_idea"][:60],
+        "verdict": findings.get("verdict") or "unknown",
+        "score": score,
+        "objections": [o for o in findings.get("objections") or [] if isinstance(o, dict) and o.get("objection")],
+        "risks": [r for r in findings.get("risks") or [] if isinstance(r, str)],
+        "strengths": [s for s in findings.get("strengths") or [] if isinstance(s, str)],
+    }
+
+
+def extract_findings(session: dict) -> tuple[dict, bool]:
+    """
+    Map one session to its findings. Returns (findings, from_cache).
+
+    Only usable replies are cached: a session whose reply didn't parse gets
+    placeholder findings this time and is mapped again on the next run.
+    """
+    text = _session_text(session)
+    path = _cache_path(text)
+    try:
+        return json.loads(path.read_text()), True
+    except (OSError, ValueError):
+        pass
+
+    try:
+        raw = json.loads(llm.chat_json(_MAP_PROMPT, text, role="summary"))
+    except json.JSONDecodeError:
+        raw = None
+    if not isinstance(raw, dict) or not raw:
+        return _normalize({}, session), False
+    findings = _normalize(raw, session)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(findings))
+    except OSError:
+        pass  # Caching is an optimization
+    return findings, False
+
+
+def _rank_key(entry: dict) -> tuple[int, float]:
+    """Verdict first (strong → no-go, then anything unrecognized), then score, highest first."""
+    verdict = entry["verdict"]
+    return (_VERDICTS.index(verdict) if verdict in _VERDICTS else len(_VERDICTS), -entry["score"])
+
+
+def _reduce_themes(items: list[dict], kind: str, pool: ThreadPoolExecutor) -> tuple[list[dict], int]:
+    """
+    Merge {"text", "count"} items into themes, config.META_REDUCE_FANIN items
+    per call, level by level (groups in a level run in parallel).
+
+    Returns (themes, LLM calls made).
+    """
+    calls = 0
+    limit = config.META_THEMES
+    while items:
+        groups = [items[i:i + config.META_REDUCE_FANIN] for i in range(0, len(items), config.META_REDUCE_FANIN)]
+        futures = [pool.submit(scheduler.bind(_merge, group, kind, limit)) for group in groups]
+        merged = [theme for future in futures for theme in future.result()]
+        calls += len(groups)
+        if len(groups) == 1 or len(merged) >= len(items):
+            items = merged  # One list left (or no longer shrinking)
+            break
+        items = merged
+    return sorted(items, key=lambda theme: -theme["count"])[:limit], calls
+
+
+def _merge(items: list[dict], kind: str, limit: int) -> list[dict]:
+    """One reduce call. Falls back to the items themselves if the reply is unusable."""
+    reply = llm.chat_json(
+        _REDUCE_PROMPT.format(kind=kind, limit=limit),
+        json.dumps([{"text": item["text"], "count": item["count"]} for item in items]),
+        role="summary",
+    )
+    try:
+        themes = json.loads(reply).get("themes") or []
+        themes = [
+            {"text": str(t["text"]), "count": int(t.get("count") or 1), "example": str(t.get("example") or "")}
+            for t in themes if isinstance(t, dict) and t.get("text")
+        ]
+    except (ValueError, AttributeError, TypeError, KeyError):
+        themes = []
+    return themes or [{**item, "example": item.get("example", item["text"])} for item in items[:limit]]
+
+
+def build_meta_report(paths: list[str]) -> dict:
+    """
+    Map every saved session under `paths` to findings, then reduce them
+    into one portfolio report. Prints progress and throughput.
+    """
+    started = time.perf_counter()
+    session = scheduler.Session("meta-report", scheduler.BATCH)
+    window = config.MAX_PARALLEL_CALLS * 2  # Sessions loaded at once
+    results = []  # (source, findings)
+    failed = []  # (source, error) - sessions whose map call raised
+    cached = 0
+
+    def collect(future, source: str):
+        nonlocal cached
+        try:
+            findings, hit = future.result()
+        except Exception as e:
+            failed.append((source, f"{type(e).__name__}: {e}"))
+            print(f"   ⚠️  Skipped {source}: {e}")
+            return
+        results.append((source, findings))
+        cached += hit
+
+    with scheduler.session_scope(session), ThreadPoolExecutor(max_workers=config.MAX_PARALLEL_CALLS) as pool:
+        print(f"🗺️  Mapping sessions ({config.MAX_PARALLEL_CALLS} at a time)...")
+        pending = {}
+        for source, chat in iter_sessions(paths):
+            if len(pending) >= window:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future, pending.pop(future))
+            pending[pool.submit(scheduler.bind(extract_findings, chat))] = source
+        for future in list(pending):
+            collect(future, pending.pop(future))
+        map_seconds = time.perf_counter() - started
+        print(f"   {len(results)} sessions in {map_seconds:.1f}s "
+              f"({len(results) / max(map_seconds, 1e-9):.1f}/s, {cached} from cache"
+              f"{f', {len(failed)} failed' if failed else ''})")
+
+        print("🧩 Reducing findings...")
+        reduce_started = time.perf_counter()
+        by_persona = {}
+        for _, findings in results:
+            for objection in findings["objections"]:
+                by_persona.setdefault(objection.get("persona") or "unknown", []).append(
+                    {"text": objection["objection"], "count": 1})
+        risks = [{"text": risk, "count": 1} for _, findings in results for risk in findings["risks"]]
+
+        # One reducer per list (risks, each persona's objections); their calls share the pool
+        lists = {None: (risks, "risks")}
+        lists.update({persona: (objections, f"objections raised by {persona}")
+                      for persona, objections in sorted(by_persona.items())})
+        with ThreadPoolExecutor(max_workers=min(len(lists), config.MAX_PARALLEL_CALLS)) as reducers:
+            futures = {name: reducers.submit(scheduler.bind(_reduce_themes, items, kind, pool))
+                       for name, (items, kind) in lists.items()}
+            reduced = {name: future.result() for name, future in futures.items()}
+        reduce_calls = sum(calls for _, calls in reduced.values())
+        risk_themes = reduced.pop(None)[0]
+        persona_objections = {persona: themes for persona, (themes, _) in reduced.items()}
+        reduce_seconds = time.perf_counter() - reduce_started
+
+    ranking = sorted(
+        ({"source": source, "idea": f["idea"], "verdict": f["verdict"], "score": f["score"],
+          "strengths": f["strengths"][:3]} for source, f in results),
+        key=_rank_key,
+    )
+    wall = time.perf_counter() - started
+    stats = {
+        "sessions": len(results),
+        "cached": cached,
+        "failed": len(failed),
+        "mapped": len(results) - cached,
+        "reduce_calls": reduce_calls,
+        "map_seconds": map_seconds,
+        "reduce_seconds": reduce_seconds,
+        "wall_seconds": wall,
+        "sessions_per_second": len(results) / wall if wall else 0.0,
+        "usage": dict(session.usage),
+    }
+    print(f"✅ Meta-report: {len(results)} sessions in {wall:.1f}s ({stats['sessions_per_second']:.1f} sessions/s) · "
+          f"{reduce_calls} reduce calls · {stats['usage']['prompt_tokens']} in / "
+          f"{stats['usage']['completion_tokens']} out tokens"
+          f"{f' · {len(failed)} sessions failed' if failed else ''}")
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "sources": paths,
+        "ranking": ranking,
+        "risk_themes": risk_themes,
+        "persona_objections": persona_objections,
+        "failed": [{"source": source, "error": error} for source, error in failed],
+        "stats": stats,
+    }
+
+
+def save_meta_report(report: dict, filepath: str | None = None, format: str = "markdown") -> str:
+    """Write the report as markdown or JSON. Returns the path."""
+    if filepath is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filepath = f"chats/{timestamp}_meta.{'md' if format == 'markdown' else 'json'}"
+
+    if format == "json":
+        content = json.dumps(report, indent=2)
+    else:
+        content = _format_markdown(report)
+
+    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    Path(filepath).write_text(content)
+    print(f"💾 Meta-report saved to: {filepath}")
+    return filepath
+
+
+def _format_markdown(report: dict) -> str:
+    stats = report["stats"]
+    lines = [
+        "# Portfolio Meta-Report",
+        "",
+        f"*{report['timestamp']} · {stats['sessions']} sessions · {stats['wall_seconds']:.1f}s*",
+        "",
+        "## Ideas by Verdict",
+        "",
+        "| # | Idea | Verdict | Score | Strengths | Session |",
+        "|---|------|---------|-------|-----------|---------|",
+    ]
+    for rank, entry in enumerate(report["ranking"], 1):
+        idea = entry["idea"].replace("|", "\\|")
+        strengths = "; ".join(entry["strengths"]).replace("|", "\\|")
+        session = Path(entry["source"]).name.replace("|", "\\|")
+        lines.append(f"| {rank} | {idea} | {entry['verdict']} | {entry['score']:g} | {strengths} | {session} |")
+
+    lines += ["", "## Common Risk Themes", ""]
+    lines += [f"- **{theme['text']}** ({theme['count']} sessions)" for theme in report["risk_themes"]] or ["(none)"]
+
+    lines += ["", "## Recurring Objections by Persona", ""]
+    for persona, themes in report["persona_objections"].items():
+        lines.append(f"### {persona}")
+        lines.append("")
+        lines += [f"- {theme['text']} ({theme['count']})" for theme in themes]
+        lines.append("")
+
+    if report.get("failed"):
+        lines += ["## Sessions Not Included", ""]
+        lines += [f"- {Path(entry['source']).name}: {entry['error']}" for entry in report["failed"]]
+        lines.append("")
+
+    return "\n".join(lines)
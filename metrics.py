@@ -0,0 +1,49 @@
+"""
+Metrics - Small helpers for measuring and reporting latency.
+
+The agent makes many LLM calls per session, and the slowest one usually
+decides how long you wait. These helpers turn lists of timings into the
+percentiles we print at the end of a session.
+"""
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """
+    Return the pct-th percentile of values (linear interpolation).
+
+    Returns None when there are no values yet.
+    """
+    if not values:
+        return None
+
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+
+    rank = (pct / 100) * (len(ordered) - 1)
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    fraction = rank - low
+    return ordered[low] + (ordered[high] - ordered[low]) * fraction
+
+
+def latency_summary(values: list[float]) -> dict:
+    """Summarize timings as {"count", "p50", "p95", "p99"} (seconds)."""
+    return {
+        "count": len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+    }
+
+
+def format_latency_summary(label: str, values: list[float]) -> str:
+    """Format a latency summary as a single printable line."""
+    summary = latency_summary(values)
+    if not summary["count"]:
+        return f"{label}: no samples"
+
+    return (
+        f"{label}: p50 {summary['p50']:.2f}s · p95 {summary['p95']:.2f}s · "
+        f"p99 {summary['p99']:.2f}s ({summary['count']} samples)"
+    )
@@ -12,13 +12,102 @@ skill content injected into the system prompt. Same model, different behavior.
 """
 
 import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
 import config
+import dedup
+import events
 import llm
-from skill_loader import Skill, load_all_skills
+import metrics
+import scheduler
+import tracing
+from budget import RoundPlan, SessionBudget
+from digest import IdeaDigest, digest_idea
+from jsonstream import JsonFieldParser
+from skill_loader import Skill, condense_skill, load_all_skills
 from skill_selector import select_skills, generate_dynamic_persona
+from transcript import Transcript, Turn
+
+
+@dataclass
+class Panel:
+    """
+    The personas for an idea family, resolved once and reused across runs.
+
+    Attributes:
+        personas: Persona skills, including any generated dynamic personas
+        reasoning: Why the selector picked them
+    """
+    personas: list[Skill]
+    reasoning: str = ""
+
+
+@dataclass
+class SubPanel:
+    """
+    A group of personas that deliberate together in a hierarchical discussion.
+
+    Attributes:
+        name: How its position is labelled ("PANEL A")
+        members: Persona skills (futures until round 1 resolves them)
+        transcript: What members read - their own turns plus everyone's positions
+    """
+    name: str
+    members: list
+    transcript: Transcript = field(default_factory=Transcript)
+
+
+class _ThinkTime:
+    """
+    Background work started while the founder is typing.
+
+    Work checks `cancelled` between steps and registers its LLM streams, so
+    cancel() stops whatever hasn't finished the moment the answer arrives.
+    """
+
+    def __init__(self):
+        self.cancelled = threading.Event()
+        self.lock = threading.Lock()
+        self.streams = []
+        self.finished = []  # Names of the pieces of work that completed in time
+
+    def open_stream(self, *args, **kwargs):
+        """llm.stream(), closed by cancel() if it's still running."""
+        stream = llm.stream(*args, **kwargs)
+        with self.lock:
+            self.streams.append(stream)
+            if self.cancelled.is_set():
+                stream.close()
+        return stream
+
+    def finish(self, name: str) -> bool:
+        """Mark a piece of work done - unless we were cancelled first. True if it counts."""
+        with self.lock:
+            if self.cancelled.is_set():
+                return False
+            self.finished.append(name)
+            return True
+
+    def cancel(self):
+        with self.lock:
+            self.cancelled.set()
+            streams = list(self.streams)
+        for stream in streams:
+            stream.close()
+
+
+def _resolved(value) -> Future:
+    """A future that is already done."""
+    future = Future()
+    future.set_result(value)
+    return future
 
 
 class Orchestrator:
@@ -33,52 +122,215 @@ class Orchestrator:
     - Saves chat history
     """
 
-    def __init__(self, interactive: bool = False):
+    def __init__(
+        self,
+        interactive: bool = False,
+        skills: dict[str, Skill] | None = None,
+        quiet: bool = False,
+        shared_pool: ThreadPoolExecutor | None = None,
+        priority: str = scheduler.INTERACTIVE,
+        background: bool = False,
+        bus: events.EventBus | None = None,
+    ):
         """
         Load all skills at initialization.
 
         Args:
             interactive: If True, allow user to interject between rounds
+            skills: Already-loaded skills to reuse instead of reading skills/ again
+            quiet: If True, don't print the discussion (matrix cells)
+            shared_pool: Run LLM calls on this pool instead of a per-session one,
+                so several sessions share one concurrency limit
+            priority: scheduler.INTERACTIVE (someone is waiting) or scheduler.BATCH
+            background: Load skills on a background thread and return right
+                away; the first run() waits for them if they're not done yet
+            bus: Where this orchestrator's events go (default: the console
+                bus, or nowhere if quiet)
         """
-        print("🔧 Loading skills...")
-        self.all_skills = load_all_skills()
+        self.quiet = quiet
+        self.bus = bus if bus is not None else (events.NULL_BUS if quiet else events.default_bus())
+        self.shared_pool = shared_pool
+        self.priority = priority
+        self.session = None  # scheduler.Session for the current run
+        self.founder_available = not quiet  # Can we stop and ask the founder a question?
+        self.open_questions = []  # Founder questions nobody was around to answer
+        if skills is not None:
+            self._skills = _resolved(skills)
+        elif background:
+            self._skills = Future()
+            threading.Thread(target=self._load_skills, name="skill-loader", daemon=True).start()
+        else:
+            self._log("🔧 Loading skills...")
+            with events.bus_scope(self.bus):
+                self._skills = _resolved(load_all_skills())
         self.interactive = interactive
         self.last_chat = None  # Stores the last discussion for saving
-        print(f"✅ Loaded {len(self.all_skills)} skills\n")
+        self.last_transcript = None  # The last discussion as a Transcript (for rendering)
+        self.round_latencies = []  # Seconds each round's persona turns took
+        self.time_to_first_message = None  # Seconds from run() start to the first persona reply
+        self.conversations = {}  # Persona name -> llm.Conversation (conversation-state mode)
+        self.seen = {}  # Persona name -> transcript length when they last spoke
+        self.upload_bytes = []  # Request size of every persona call
+        self.budget = None  # SessionBudget for the current run
+        self.last_matrix = None  # The last run_matrix() results, for the report
+        self.plenary = None  # What the moderator and summary read (the discussion, or sub-panel positions)
+        self.idea_digest = None  # IdeaDigest: the brief routine prompts use for the idea
+        self.idea_sends = 0  # Routine prompts that included the idea (brief)
+        self.running_summary = None  # (turns covered, text): the plenary summarized while the founder typed
+        self.prepared_prompts = {}  # (persona, round) -> system prompt built while the founder typed
+        self.think_time = []  # One {"seconds", "finished"} per founder wait
+        self.condensed_calls = []  # (skill chars saved, system prompt chars) per persona call using condensed skills
+        self.turn_times = []  # (persona, round, started, finished) per persona turn, for idle time
+        self.discussion_seconds = 0.0  # Wall time of the discussion rounds
+        self.pipeline = "barrier"  # How rounds were scheduled: "barrier" or "staggered"
+        self.dedup = None  # What a near-duplicate earlier session saved this run (see _find_duplicate)
+        self._idea_sends_lock = threading.Lock()
+        if self._skills.done():
+            self._log(f"✅ Loaded {len(self.all_skills)} skills\n")
+
+    @property
+    def all_skills(self) -> dict[str, Skill]:
+        """Every loaded skill by name (waits for a background load to finish)."""
+        return self._skills.result()
+
+    def _load_skills(self):
+        try:
+            self._skills.set_result(load_all_skills(verbose=False))
+        except Exception as e:
+            self._skills.set_exception(e)
+
+    def _log(self, *args, level: str = "info"):
+        """Publish a line of text for humans (the console sink prints it)."""
+        self.bus.publish(events.Notice(" ".join(str(arg) for arg in args), level=level))
+
+    def _call_pool(self):
+        """The pool for this session's LLM calls: the shared one, or a fresh one."""
+        if self.shared_pool is not None:
+            return nullcontext(self.shared_pool)
+        return ThreadPoolExecutor(max_workers=config.MAX_PARALLEL_CALLS)
 
-    def run(self, product_idea: str, task_type: str = "critique"):
+    def _submit(self, fn, *args) -> Future:
+        """Run fn on the call pool, charged to this session."""
+        return self._pool.submit(scheduler.bind(fn, *args))
+
+    def run(
+        self,
+        product_idea: str,
+        task_type: str = "critique",
+        panel: Panel | None = None,
+        time_budget: float | None = None,
+        token_budget: int | None = None,
+    ):
         """
         Run a full discussion about a product idea.
 
         Args:
             product_idea: The product concept to evaluate
             task_type: What to do - "critique", "brainstorm", or "find-pmf"
+            panel: Personas resolved earlier (see resolve_panel). Skips skill
+                selection and dynamic persona generation.
+            time_budget: Seconds the whole session may take (default: config.SESSION_TIME_BUDGET)
+            token_budget: Tokens the whole session may use (default: config.SESSION_TOKEN_BUDGET)
+
+        Every LLM call the run makes is charged to its own scheduler session.
+        With a budget, rounds get cheaper as it runs down and the discussion
+        stops early if needed - the summary's share is always kept back.
         """
-        print(f"\n{'='*60}")
-        print(f"🎯 Task: {task_type}")
-        print(f"💡 Product: {product_idea}")
-        print(f"{'='*60}\n")
-
-        # Step 1: Select relevant skills
-        print("🔍 Selecting relevant skills...")
-        user_request = f"{task_type}: {product_idea}"
-        selection = select_skills(user_request, self.all_skills)
-
-        # Step 2: Gather selected skills
-        active_skills = self._gather_skills(selection, product_idea)
+        self.session = scheduler.Session(f"{task_type}: {product_idea[:40]}", self.priority)
+        self.budget = SessionBudget(
+            self.session,
+            seconds=time_budget if time_budget is not None else config.SESSION_TIME_BUDGET,
+            tokens=token_budget if token_budget is not None else config.SESSION_TOKEN_BUDGET,
+        )
+        with scheduler.session_scope(self.session), events.bus_scope(self.bus), \
+                tracing.span("session", task=task_type, idea=product_idea[:80], priority=self.priority):
+            try:
+                return self._run_session(product_idea, task_type, panel)
+            except Exception as e:
+                self.bus.publish(events.Error(f"Error during discussion: {e}"))
+                raise
+            finally:
+                self.bus.flush()  # Everything shown before the caller carries on
+
+    def _run_session(self, product_idea: str, task_type: str, panel: Panel | None):
+        """The body of run(), inside this session's scheduler and event scope."""
+        self.bus.publish(events.SessionStarted(task_type, product_idea))
+        shortfall = self.budget.shortfall()
+        if shortfall:
+            self._log(f"⚠️  Budget too tight: {shortfall} - expect few, cheap rounds",
+                      level="warning")
+
+        self.round_latencies = []
+        self.session_started = time.perf_counter()
+        self.time_to_first_message = None
+        self.conversations = {}
+        self.seen = {}
+        self.upload_bytes = []
+        self.open_questions = []
+        self.idea_sends = 0
+        self.running_summary = None
+        self.prepared_prompts = {}
+        self.think_time = []
+        self.condensed_calls = []
+        self.turn_times = []
+        self.dedup = None
+
+        # Near-duplicate of an earlier session? Reuse its result or start from its panel.
+        # (Matrix cells come with their family's panel and are left alone.)
+        index_session = config.DEDUP_MODE != "off" and panel is None
+        match = self._find_duplicate(product_idea, task_type) if index_session else None
+        if match is not None and config.DEDUP_MODE == "reuse" and match.task == task_type:
+            return self._reuse_session(match, product_idea)
+        if match is not None:
+            panel = self._seed_panel(match)
+
+        with self._call_pool() as pool:
+            self._pool = pool
+
+            with self.budget.phase("selection"):
+                # Step 1: Condense a long idea (in the background) and select
+                # relevant skills from the full text (unless the panel is known)
+                digest_future = self._submit(digest_idea, product_idea)
+                if panel is None:
+                    self._log("🔍 Selecting relevant skills...")
+                    user_request = f"{task_type}: {product_idea}"
+                    selection = select_skills(user_request, self.all_skills)
+                else:
+                    selection = {"task_skill": task_type, "reasoning": panel.reasoning}
+                self.idea_digest = digest_future.result()
+            if self.idea_digest.condensed:
+                self._log(f"📝 Idea condensed to a {len(self.idea_digest.text)}-character brief "
+                          f"(from {self.idea_digest.full_chars}{', cached' if self.idea_digest.cached else ''})")
+
+            # Step 2: Get task skill (how to approach the task)
+            task_skill = self._get_task_skill(selection, task_type)
+
+            # Step 3: Gather selected skills (dynamic personas generate in the background)
+            if panel is None:
+                persona_futures = self._gather_skills(selection, product_idea)
+            else:
+                persona_futures = [_resolved(skill) for skill in panel.personas]
+
+            # Step 4: Run discussion rounds (dynamic - agent decides when to stop).
+            # Routine prompts get the brief; the summary below gets the full idea.
+            discussion_started = time.perf_counter()
+            discussion = self._run_discussion(
+                product_idea=self.idea_digest.text,
+                task_skill=task_skill,
+                persona_skills=persona_futures
+            )
+            self.discussion_seconds = time.perf_counter() - discussion_started
 
-        # Step 3: Get task skill (how to approach the task)
-        task_skill = self._get_task_skill(selection, task_type)
+        active_skills = [f.result() for f in persona_futures]
 
-        # Step 4: Run discussion rounds (dynamic - agent decides when to stop)
-        discussion = self._run_discussion(
-            product_idea=product_idea,
-            task_skill=task_skill,
-            persona_skills=active_skills
-        )
+        # Step 5: Summarize (from the sub-panel positions, if there were sub-panels)
+        with self.budget.phase("summary"):
+            summary = self._summarize(product_idea, task_type, self.plenary)
+        discussion = discussion.in_round_order()  # Staggered turns were appended as they finished
+        self.last_transcript = discussion
 
-        # Step 5: Summarize
-        summary = self._summarize(product_idea, task_type, discussion)
+        # Step 6: Report where the time went
+        stats = self._report_latency()
 
         # Store full chat for saving
         self.last_chat = {
@@ -87,54 +339,258 @@ class Orchestrator:
             "task_type": task_type,
             "personas": [s.name for s in active_skills],
             "selection_reasoning": selection.get("reasoning", ""),
-            "discussion": discussion,
-            "summary": summary
+            "discussion": discussion.to_dicts(),
+            "summary": summary,
+            "stats": stats
         }
+        if index_session:
+            self._index_session(product_idea, task_type, active_skills, selection)
 
         return summary
 
-    def _gather_skills(self, selection: dict, product_idea: str) -> list[Skill]:
+    def _find_duplicate(self, product_idea: str, task_type: str) -> dedup.Match | None:
+        """The closest earlier session on a near-duplicate idea in the index, if any."""
+        try:
+            match = dedup.IdeaIndex().find(product_idea, task_type)
+        except sqlite3.Error as e:
+            self._log(f"⚠️  Near-duplicate index unavailable: {e}", level="warning")
+            return None
+        if match is None:
+            dedup.record(None)
+        return match
+
+    def _reuse_session(self, match: dedup.Match, product_idea: str) -> str:
+        """Answer with an earlier session's result instead of running a new one."""
+        chat = match.chat
+        dedup.record("reused", match.tokens)
+        self.dedup = {"outcome": "reused", "similarity": match.similarity, "tokens_saved": match.tokens}
+        self._log(f"♻️  Near-duplicate of an idea discussed {chat['timestamp'][:16].replace('T', ' ')} "
+                  f"({match.similarity:.0%} similar) - reusing that session, ~{match.tokens} tokens saved")
+        self._log(f"   Earlier idea: {_one_line(match.idea, 100)}")
+
+        self.last_transcript = Transcript.from_dicts(chat["discussion"])
+        self.plenary = self.last_transcript
+        self.last_chat = {
+            **chat,
+            "timestamp": datetime.now().isoformat(),
+            "product_idea": product_idea,
+            "reused_from": {"idea": match.idea, "timestamp": chat["timestamp"], "similarity": match.similarity},
+            "stats": {"dedup": self.dedup},
+        }
+        self._log(f"\n{'='*60}")
+        self._log("📊 SUMMARY (reused)")
+        self._log(f"{'='*60}\n")
+        self.bus.publish(events.Summary(chat["summary"]))
+        return chat["summary"]
+
+    def _seed_panel(self, match: dedup.Match) -> Panel:
+        """Start from an earlier session's panel: no skill selection, no persona generation."""
+        personas = [
+            self.all_skills.get(p["name"]) or Skill(p["name"], p["description"], p["content"], "<dynamic>")
+            for p in match.panel["personas"]
+        ]
+        dedup.record("seeded", match.panel_tokens)
+        self.dedup = {"outcome": "seeded", "similarity": match.similarity, "tokens_saved": match.panel_tokens}
+        self._log(f"♻️  Near-duplicate of an earlier {match.task} session ({match.similarity:.0%} similar) - "
+                  f"starting from its panel ({', '.join(p.name for p in personas)}), "
+                  f"~{match.panel_tokens} tokens saved")
+        return Panel(personas, match.panel.get("reasoning", ""))
+
+    def _index_session(self, product_idea: str, task_type: str, personas: list[Skill], selection: dict):
+        """
+        Add this session to the near-duplicate index. Its panel cost is the
+        selection phase plus the generated personas' text (~4 characters per token).
+        """
+        generated = sum(len(skill.content) for skill in personas if skill.path == "<dynamic>") // 4
+        panel = {
+            "personas": [{"name": s.name, "description": s.description, "content": s.content} for s in personas],
+            "reasoning": selection.get("reasoning", ""),
+        }
+        try:
+            dedup.IdeaIndex().add(
+                product_idea, task_type, panel, self.last_chat,
+                tokens=self.session.tokens(),
+                panel_tokens=self.budget.phases.get("selection", {}).get("tokens", 0) + generated,
+            )
+        except sqlite3.Error as e:
+            self._log(f"⚠️  Couldn't add the session to the near-duplicate index: {e}", level="warning")
+
+    def resolve_panel(self, product_idea: str, tasks: list[str]) -> Panel:
+        """
+        Select and build the personas for an idea once, for reuse across runs.
+
+        The selector sees every task at once, so the panel suits all of them.
+        Dynamic personas are generated here, in parallel.
+        """
+        self._log(f"🔍 Selecting a panel for: {product_idea[:60]}")
+        selection = select_skills(f"{' / '.join(tasks)}: {product_idea}", self.all_skills)
+
+        with self._call_pool() as pool:
+            self._pool = pool
+            personas = [f.result() for f in self._gather_skills(selection, product_idea)]
+
+        return Panel(personas=personas, reasoning=selection.get("reasoning", ""))
+
+    def run_matrix(self, families: dict[str, list[str]], tasks: list[str]) -> list[dict]:
+        """
+        Run every variant of every idea family against every task.
+
+        Args:
+            families: Family name -> idea variants (the first is the base idea)
+            tasks: Task types, e.g. ["critique", "brainstorm", "find-pmf"]
+
+        Returns:
+            One result dict per cell (family, variant, task, chat, seconds, error)
+
+        KEY INSIGHT: Skill selection and dynamic personas depend on the idea,
+        not the exact wording of a variant or the task. So each family picks its
+        panel once, and every cell reuses it. Cells run concurrently, and all
+        their LLM calls share one pool, so the whole matrix respects one limit.
+        """
+        started = time.perf_counter()
+        usage_at_start = llm.usage_stats()
+        num_cells = sum(len(variants) for variants in families.values()) * len(tasks)
+        self._log(f"\n🧮 Matrix: {len(families)} idea families × {len(tasks)} tasks = {num_cells} runs\n")
+
+        with ThreadPoolExecutor(max_workers=config.MAX_PARALLEL_CALLS) as calls, \
+                ThreadPoolExecutor(max_workers=config.MATRIX_PARALLEL_CELLS) as runners:
+            self.shared_pool = calls
+            try:
+                with scheduler.session_scope(scheduler.Session("matrix panels", scheduler.BATCH)), \
+                        events.bus_scope(self.bus):
+                    panel_futures = {
+                        family: runners.submit(scheduler.bind(self.resolve_panel, variants[0], tasks))
+                        for family, variants in families.items()
+                    }
+                panels = {family: future.result() for family, future in panel_futures.items()}
+                for family, panel in panels.items():
+                    self._log(f"  🎭 {family}: {', '.join(s.name for s in panel.personas)}")
+                self._log()
+
+                cell_futures = [
+                    runners.submit(self._run_cell, family, number, variant, task, panels[family])
+                    for family, variants in families.items()
+                    for number, variant in enumerate(variants, 1)
+                    for task in tasks
+                ]
+                cells = [future.result() for future in cell_futures]
+            finally:
+                self.shared_pool = None
+
+        wall = time.perf_counter() - started
+        usage = llm.usage_stats()
+        usage = {key: usage[key] - usage_at_start[key] for key in ("calls", "prompt_tokens", "completion_tokens")}
+        stats = {
+            "cells": len(cells),
+            "failed": sum(1 for cell in cells if cell["error"]),
+            "wall_seconds": wall,
+            "cell_seconds": sum(cell["seconds"] for cell in cells),
+            "panels_resolved": len(panels),
+            "usage": usage,
+        }
+
+        self._log(f"\n✅ Matrix done: {stats['cells']} runs in {wall:.1f}s "
+              f"({stats['cell_seconds']:.1f}s of run time, {stats['failed']} failed)")
+        self._log(f"🎭 Panels selected {len(panels)} times instead of {len(cells)}")
+        self._log(f"🔢 Tokens: {usage['prompt_tokens']} in / {usage['completion_tokens']} out over {usage['calls']} calls")
+        self.bus.flush()
+
+        self.last_matrix = {
+            "timestamp": datetime.now().isoformat(),
+            "tasks": tasks,
+            "panels": {
+                family: {"personas": [s.name for s in panel.personas], "reasoning": panel.reasoning}
+                for family, panel in panels.items()
+            },
+            "cells": cells,
+            "stats": stats,
+        }
+        return cells
+
+    def _run_cell(self, family: str, number: int, idea: str, task: str, panel: Panel) -> dict:
+        """One matrix cell: a quiet, non-interactive run with a shared panel."""
+        agent = Orchestrator(skills=self.all_skills, quiet=True, shared_pool=self.shared_pool,
+                             priority=scheduler.BATCH)
+        started = time.perf_counter()
+        error = None
+        try:
+            agent.run(idea, task, panel=panel)
+        except Exception as e:
+            error = str(e)
+        seconds = time.perf_counter() - started
+
+        chat = agent.last_chat if error is None else None
+        rounds = max((turn["round"] for turn in chat["discussion"]), default=0) if chat else 0
+        if error:
+            self.bus.publish(events.Error(f"{family} #{number} × {task}: {error}"))
+        else:
+            self._log(f"  ✅ {family} #{number} × {task}: {rounds} rounds in {seconds:.1f}s")
+
+        return {
+            "family": family,
+            "variant": number,
+            "idea": idea,
+            "task": task,
+            "rounds": rounds,
+            "seconds": seconds,
+            "open_questions": agent.open_questions,
+            "summary": chat["summary"] if chat else None,
+            "discussion": chat["discussion"] if chat else [],
+            "error": error,
+        }
+
+    @tracing.traced("gather_skills")
+    def _gather_skills(self, selection: dict, product_idea: str) -> list[Future]:
         """
         Gather all persona skills - both pre-defined and dynamically generated.
 
         This shows how skills can be:
         1. Loaded from files (pre-defined)
         2. Generated on-the-fly (dynamic)
+
+        Returns one future per persona, resolving to its Skill. Pre-defined
+        personas are ready immediately; dynamic ones are generated in parallel,
+        so round 1 can start before every persona exists.
         """
-        active_skills = []
+        persona_futures = []
 
         # Load pre-defined persona skills
         for skill_name in selection.get("persona_skills", []):
             if skill_name in self.all_skills:
-                active_skills.append(self.all_skills[skill_name])
-                print(f"  ✅ Loaded persona: {skill_name}")
+                persona_futures.append(_resolved(self.all_skills[skill_name]))
+                self._log(f"  ✅ Loaded persona: {skill_name}")
             else:
-                print(f"  ⚠️  Persona not found: {skill_name}")
+                self._log(f"  ⚠️  Persona not found: {skill_name}", level="warning")
 
         # Generate dynamic personas
         for dynamic in selection.get("dynamic_personas", []):
-            print(f"  🔨 Generating dynamic persona: {dynamic['name']}")
+            self._log(f"  🔨 Generating dynamic persona: {dynamic['name']}")
+            persona_futures.append(
+                self._submit(self._generate_persona_skill, dynamic, product_idea)
+            )
+
+        return persona_futures
+
+    def _generate_persona_skill(self, dynamic: dict, product_idea: str) -> Skill:
+        """Generate a dynamic persona and wrap it in a Skill object."""
+        with tracing.span("generate_persona", persona=dynamic["name"]):
             content = generate_dynamic_persona(
                 name=dynamic["name"],
                 description=dynamic["description"],
                 product_context=product_idea
             )
-            # Create a Skill object for the dynamic persona
-            skill = Skill(
-                name=dynamic["name"],
-                description=dynamic["description"],
-                content=content,
-                path="<dynamic>"
-            )
-            active_skills.append(skill)
-
-        return active_skills
+        return Skill(
+            name=dynamic["name"],
+            description=dynamic["description"],
+            content=content,
+            path="<dynamic>"
+        )
 
     def _get_task_skill(self, selection: dict, fallback: str) -> Skill | None:
         """Get the task skill (critique, brainstorm, or find-pmf)."""
         task_name = selection.get("task_skill", fallback)
         if task_name in self.all_skills:
-            print(f"  ✅ Using task skill: {task_name}")
+            self._log(f"  ✅ Using task skill: {task_name}")
             return self.all_skills[task_name]
         return None
 
@@ -142,115 +598,728 @@ class Orchestrator:
         self,
         product_idea: str,
         task_skill: Skill | None,
-        persona_skills: list[Skill],
-    ) -> list[dict]:
+        persona_skills: list[Future],
+    ) -> Transcript:
         """
         Run the round-table discussion with dynamic stopping.
 
+        persona_skills are futures (see _gather_skills): round 1 starts each
+        persona's turn as soon as its skill is ready.
+
         The discussion continues until:
         - Agent decides no more founder input needed for 3 consecutive rounds
         - User manually stops (types 'stop')
         - Max rounds reached (safety limit)
 
+        With config.STAGGER_TURNS set, rounds overlap instead of waiting for
+        each other (see _run_staggered_discussion).
+
         KEY INSIGHT: The agent has agency to decide when to engage the founder.
         This makes conversations more natural and focused.
         """
-        discussion = []  # List of {persona, round, message}
+        discussion = Transcript()
         silent_rounds = 0  # Rounds without asking founder
         round_num = 0
 
+        # Big panels deliberate in sub-panels; the plenary holds their positions
+        subpanels = self._split_into_subpanels(persona_skills)
+        plenary = Transcript() if subpanels else discussion
+        self.plenary = plenary
+        self.pipeline = "barrier"
+
+        if config.STAGGER_TURNS > 0 and subpanels:
+            self._log("  ⚠️  Staggered rounds don't apply to sub-panels; using a barrier per round", level="warning")
+        elif config.STAGGER_TURNS > 0:
+            self.pipeline = "staggered"
+            discussion, round_num = self._run_staggered_discussion(product_idea, task_skill, persona_skills)
+            self.plenary = discussion
+            if round_num >= config.MAX_TOTAL_ROUNDS:
+                self._log(f"\n⚠️ Reached maximum rounds ({config.MAX_TOTAL_ROUNDS}). Wrapping up.")
+            return discussion
+
         while round_num < config.MAX_TOTAL_ROUNDS:
+            # Budget check: how (and whether) to run the next round
+            plan = self.budget.plan_round(round_num + 1, len(plenary.summary_text()))
+            if plan.stop:
+                self._log(f"\n💰 Budget: stopping after {round_num} rounds - {plan.reason}.")
+                break
+            if plan.mode != "normal":
+                self._log(f"\n💰 Budget: {plan.mode} round ({plan.reason})")
+
             round_num += 1
+            self.bus.publish(events.RoundStarted(round_num))
 
-            print(f"\n{'─'*40}")
-            print(f"📢 ROUND {round_num}")
-            print(f"{'─'*40}")
+            round_started = time.perf_counter()
+            tokens_at_round_start = self.session.tokens()
+            turns = self._run_planned_round(plan, product_idea, task_skill, persona_skills,
+                                            subpanels, discussion, plenary, round_num)
+            discussion.extend(turns)
+            self.round_latencies.append(time.perf_counter() - round_started)
 
-            # Each persona speaks
-            for persona_skill in persona_skills:
-                system_prompt = self._build_persona_prompt(
-                    persona_skill=persona_skill,
-                    task_skill=task_skill,
-                    round_num=round_num
-                )
+            if round_num == 1:
+                persona_skills = [f.result() for f in persona_skills]
+                self._prepare_condensed([task_skill, *persona_skills])
+
+            # Agent decides: should we ask the founder?
+            if plan.skip_moderator:
+                decision = {"should_ask": False, "question": None}
+            else:
+                moderator_started = time.perf_counter()
+                with self.budget.phase("moderator"):
+                    decision = self._should_ask_founder(product_idea, plenary, round_num)
+                self.budget.record_call(time.perf_counter() - moderator_started)
+
+            self.budget.record_round(round_num, plan.mode, time.perf_counter() - round_started,
+                                     self.session.tokens() - tokens_at_round_start)
+
+            silent_rounds = self._checkpoint(decision, discussion, plenary, subpanels, persona_skills,
+                                             task_skill, round_num, silent_rounds)
+            if silent_rounds is None:
+                break
+
+        if round_num >= config.MAX_TOTAL_ROUNDS:
+            self._log(f"\n⚠️ Reached maximum rounds ({config.MAX_TOTAL_ROUNDS}). Wrapping up.")
+
+        return discussion
+
+    def _checkpoint(
+        self,
+        decision: dict,
+        discussion: Transcript,
+        plenary: Transcript,
+        subpanels: list | None,
+        persona_skills: list[Skill],
+        task_skill: Skill | None,
+        round_num: int,
+        silent_rounds: int
+    ) -> int | None:
+        """
+        The founder checkpoint after a round: put the moderator's question to
+        the founder (or, interactively, offer the floor) and add the answer.
+
+        Returns the updated count of rounds without founder input, or None
+        when the discussion should end.
+        """
+        self.bus.publish(events.ModeratorDecision(
+            round_num, bool(decision["should_ask"]), decision.get("question"),
+            asked_founder=bool(decision["should_ask"]) and self.founder_available,
+        ))
+        if decision["should_ask"] and not self.founder_available:
+            # Nobody to answer (matrix cells): note the question, keep going
+            self.open_questions.append(decision["question"])
+            decision = {"should_ask": False, "question": None}
+
+        if decision["should_ask"]:
+            silent_rounds = 0  # Reset counter
+            user_input = self._founder_input(plenary, discussion, persona_skills, task_skill, round_num)
+
+            if user_input is None:  # User typed 'stop'
+                self._log("\n🛑 Stopping discussion at your request.")
+                return None
+
+            if user_input:
+                self._add_founder_turn(discussion, subpanels, round_num, user_input)
+        else:
+            silent_rounds += 1
+            self._log(f"\n💭 Personas continuing discussion... (no question for founder, {silent_rounds}/{config.MAX_SILENT_ROUNDS})")
+
+            # Check if we should auto-stop
+            if silent_rounds >= config.MAX_SILENT_ROUNDS:
+                self._log(f"\n✅ Discussion complete - personas reached conclusion after {round_num} rounds.")
+                return None
+
+            # Give user option to interject anyway or stop
+            if self.interactive:
+                self._log('   Press Enter to continue, type input to add thoughts, or \'stop\' to end.')
+                self._log('   Use \"\"\" for multi-line input.')
+                user_input = self._founder_input(plenary, discussion, persona_skills, task_skill, round_num,
+                                                 allow_empty=True)
+
+                if user_input is None:  # User typed 'stop'
+                    self._log("\n🛑 Stopping discussion at your request.")
+                    return None
+                elif user_input:
+                    silent_rounds = 0  # User input resets the counter
+                    self._add_founder_turn(discussion, subpanels, round_num, user_input)
 
-                user_message = self._build_discussion_context(
+        return silent_rounds
+
+    def _run_staggered_discussion(
+        self,
+        product_idea: str,
+        task_skill: Skill | None,
+        persona_skills: list[Future],
+    ) -> tuple[Transcript, int]:
+        """
+        Run the discussion without a barrier between rounds.
+
+        Each persona keeps its own count: its Nth turn is round N. It starts
+        that turn as soon as its previous one is done and at least
+        config.STAGGER_TURNS turns from others (personas or the founder) have
+        come in since it last started - it has something new to respond to.
+        Nobody waits for the slowest persona of the round.
+
+        Checkpoints still run per round: once every persona has spoken in
+        round N, the moderator decides whether to ask the founder, and the
+        budget plan, silent-round count and 'stop' apply as usual. When the
+        founder can be asked, nobody starts round N + 1 until checkpoint N is
+        done: the question isn't interleaved with new turns, and the answer
+        comes before the next round. Unattended (matrix cells, workers),
+        personas run up to one round ahead of the last checkpoint - except
+        when the pending checkpoint would end the discussion if nobody has a
+        question; turns already under way when it ends are kept.
+
+        KEY INSIGHT: Turns are appended as they finish, so what a persona
+        reads is always current. The transcript stays in that order (the
+        moderator, running summary and summary index into it); only the
+        saved chat is put back in round order.
+
+        Returns (the transcript, the last round that reached its checkpoint).
+        """
+        discussion = Transcript()
+        needed = min(config.STAGGER_TURNS, len(persona_skills) - 1)  # Never wait for more turns than others can give
+        skills = []  # Resolved personas, in the panel's order
+        spoken = {}  # Persona name -> rounds spoken
+        seen = {}  # Persona name -> transcript length when its last turn started
+        waiting = []  # Personas between turns
+        running = {}  # Turn future -> (persona, round, submitted)
+        resolving = {future: i for i, future in enumerate(persona_skills)}
+        plans = {}  # Round -> RoundPlan
+        round_started = {}  # Round -> when its first turn started
+        tokens_at_checkpoint = self.session.tokens()
+        checkpointed = 0  # Last round whose checkpoint is done
+        last_round = config.MAX_TOTAL_ROUNDS  # No turn starts after this round
+        moderating = None  # The moderator's future, for round checkpointed + 1
+        silent_rounds = 0
+
+        def plan_for(round_num: int) -> RoundPlan | None:
+            """The budget plan for a round, made when its first turn starts (None: don't start it)."""
+            nonlocal last_round
+            if round_num not in plans:
+                plan = self.budget.plan_round(round_num, len(discussion.summary_text()))
+                if plan.stop:
+                    self._log(f"\n💰 Budget: no round {round_num} - {plan.reason}.")
+                    last_round = min(last_round, round_num - 1)
+                    return None
+                if plan.mode != "normal":
+                    self._log(f"\n💰 Budget: {plan.mode} round ({plan.reason})")
+                plans[round_num] = plan
+                round_started[round_num] = time.perf_counter()
+                self.bus.publish(events.RoundStarted(round_num, staggered=True))
+            return plans[round_num]
+
+        def can_start(persona: Skill, ignore_turns: bool = False) -> bool:
+            round_num = spoken[persona.name] + 1
+            if round_num > last_round:
+                return False
+            # One round ahead of the checkpoint - unless that checkpoint may put a question to the
+            # founder (their answer must come before the next round) or may well end the discussion
+            ahead = 1 if self.founder_available or silent_rounds + 1 >= config.MAX_SILENT_ROUNDS else 2
+            if round_num > checkpointed + ahead:
+                return False
+            if round_num == 1 or ignore_turns:
+                return True
+            new_turns = sum(1 for turn in discussion.turns[seen[persona.name]:] if turn.persona != persona.name)
+            return new_turns >= needed
+
+        def start(persona: Skill):
+            round_num = spoken[persona.name] + 1
+            plan = plan_for(round_num)
+            if plan is None:
+                return
+            waiting.remove(persona)
+            seen[persona.name] = len(discussion)
+            snapshot = Transcript(discussion.turns[:])  # What this persona reads, frozen
+            future = self._submit(self._staggered_turn, plan, product_idea, task_skill, persona, snapshot, round_num)
+            running[future] = (persona, round_num, time.perf_counter())
+
+        with self.budget.phase("rounds"):
+            while True:
+                for persona in list(waiting):
+                    if can_start(persona):
+                        start(persona)
+                if not (running or resolving or moderating):
+                    # Nothing left that could bring new turns: let waiting personas go anyway
+                    stuck = [persona for persona in waiting if can_start(persona, ignore_turns=True)]
+                    if not stuck:
+                        break
+                    for persona in stuck:
+                        start(persona)
+                    continue
+
+                done, _ = wait(set(running) | set(resolving) | ({moderating} if moderating else set()),
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in resolving:
+                        resolving.pop(future)
+                        persona = future.result()
+                        spoken[persona.name] = 0
+                        waiting.append(persona)
+                    elif future is moderating:
+                        moderating = None
+                        round_num = checkpointed + 1
+                        silent_rounds = self._checkpoint(future.result(), discussion, discussion, None, skills,
+                                                         task_skill, round_num, silent_rounds)
+                        checkpointed = round_num
+                        if silent_rounds is None:
+                            last_round = min(last_round, round_num)
+                    else:
+                        persona, round_num, submitted = running.pop(future)
+                        turn = future.result()
+                        self.turn_times.append((persona.name, round_num, submitted, time.perf_counter()))
+                        self.budget.record_call(time.perf_counter() - submitted)
+                        if self.time_to_first_message is None:
+                            self.time_to_first_message = time.perf_counter() - self.session_started
+                        self.bus.publish(events.TurnComplete(turn.persona, round_num, turn.message))
+                        discussion.extend([turn])
+                        spoken[persona.name] = round_num
+                        waiting.append(persona)
+
+                # Checkpoint the next round once everyone has spoken in it
+                round_num = checkpointed + 1
+                if moderating or resolving or round_num > last_round or \
+                        any(spoken[persona.name] < round_num for persona in waiting + [p for p, _, _ in running.values()]):
+                    continue
+                if round_num == 1:
+                    skills = [future.result() for future in persona_skills]
+                    self._prepare_condensed([task_skill, *skills])
+                seconds = time.perf_counter() - round_started[round_num]
+                self.round_latencies.append(seconds)
+                self.budget.record_round(round_num, plans[round_num].mode, seconds,
+                                         self.session.tokens() - tokens_at_checkpoint)
+                tokens_at_checkpoint = self.session.tokens()
+                if plans[round_num].skip_moderator:
+                    moderating = _resolved({"should_ask": False, "question": None})
+                else:
+                    moderating = self._submit(self._should_ask_founder, product_idea, discussion, round_num)
+
+        return discussion, checkpointed
+
+    def _staggered_turn(
+        self,
+        plan: RoundPlan,
+        product_idea: str,
+        task_skill: Skill | None,
+        persona_skill: Skill,
+        discussion: Transcript,
+        round_num: int
+    ) -> Turn:
+        """One persona's turn in a staggered discussion, at its round's reasoning effort."""
+        with llm.reasoning_effort(plan.reasoning_effort), \
+                tracing.span("round", round=round_num, mode=plan.mode, persona=persona_skill.name):
+            return self._persona_turn(product_idea, task_skill, persona_skill, discussion, round_num,
+                                      compact=plan.compact)
+
+    def _run_planned_round(
+        self,
+        plan: RoundPlan,
+        product_idea: str,
+        task_skill: Skill | None,
+        persona_skills: list,
+        subpanels: list | None,
+        discussion: Transcript,
+        plenary: Transcript,
+        round_num: int
+    ) -> list[Turn]:
+        """Each persona speaks (all at once, against the same snapshot), as the budget plan says."""
+        with self.budget.phase("rounds"), llm.reasoning_effort(plan.reasoning_effort), \
+                tracing.span("round", round=round_num, mode=plan.mode):
+            if subpanels:
+                return self._run_hierarchical_round(
                     product_idea=product_idea,
-                    discussion=discussion,
-                    current_persona=persona_skill.name,
-                    round_num=round_num
+                    task_skill=task_skill,
+                    subpanels=subpanels,
+                    plenary=plenary,
+                    round_num=round_num,
+                    compact=plan.compact
                 )
+            return self._run_round(
+                product_idea=product_idea,
+                task_skill=task_skill,
+                persona_skills=persona_skills,
+                discussion=discussion,
+                round_num=round_num,
+                compact=plan.compact
+            )
 
-                print(f"\n🎭 {persona_skill.name}:")
-                response = llm.chat(system_prompt, user_message)
-                print(f"   {response}\n")
+    def _add_founder_turn(self, discussion: Transcript, subpanels: list | None, round_num: int, message: str):
+        """The founder's answer goes to everyone: the discussion, the plenary and every sub-panel."""
+        self.bus.publish(events.TurnComplete("FOUNDER", round_num, message, kind="founder"))
+        turn = discussion.append("FOUNDER", round_num, message)
+        if subpanels:
+            self.plenary.extend([turn])
+            for subpanel in subpanels:
+                subpanel.transcript.extend([turn])
 
-                discussion.append({
-                    "persona": persona_skill.name,
-                    "round": round_num,
-                    "message": response
-                })
+    def _split_into_subpanels(self, persona_skills: list) -> list["SubPanel"] | None:
+        """
+        Split a big panel into sub-panels of about config.SUBPANEL_SIZE.
 
-            # Agent decides: should we ask the founder?
-            decision = self._should_ask_founder(product_idea, discussion, round_num)
+        Returns None (a flat discussion) when sub-panels are off or the panel
+        is small enough. Members are dealt round-robin so sizes differ by at
+        most one.
+        """
+        size = config.SUBPANEL_SIZE
+        if size <= 0 or len(persona_skills) <= size:
+            return None
 
-            if decision["should_ask"]:
-                silent_rounds = 0  # Reset counter
-                print(f"\n{'─'*40}")
-                print(f"❓ PERSONAS WANT TO ASK YOU:")
-                print(f"   {decision['question']}")
-                print(f'\n   (Type \'stop\' to end, or answer. Use \"\"\" for multi-line)')
+        count = -(-len(persona_skills) // size)  # Ceiling division
+        subpanels = [
+            SubPanel(name=f"PANEL {chr(ord('A') + i)}", members=persona_skills[i::count])
+            for i in range(count)
+        ]
+        self._log(f"  🏛️  {len(persona_skills)} personas → {count} sub-panels of ~{size}")
+        return subpanels
 
-                user_input = self._get_founder_input()
+    def _run_hierarchical_round(
+        self,
+        product_idea: str,
+        task_skill: Skill | None,
+        subpanels: list["SubPanel"],
+        plenary: Transcript,
+        round_num: int,
+        compact: bool = False
+    ) -> list[Turn]:
+        """
+        Run one round of a hierarchical discussion.
 
-                if user_input is None:  # User typed 'stop'
-                    print("\n🛑 Stopping discussion at your request.")
-                    break
+        1. Every sub-panel deliberates at the same time. A persona reads only
+           its own sub-panel's turns plus the positions from earlier plenaries.
+        2. Each sub-panel's turns are condensed into a position (in parallel).
+        3. Plenary: the positions are shared with the plenary and every
+           sub-panel, so next round everyone responds to them.
+
+        KEY INSIGHT: A persona's context grows with sub-panel size plus the
+        number of sub-panels, not with the whole panel.
+
+        Returns every member turn followed by the positions.
+        """
+        members = [member for subpanel in subpanels for member in subpanel.members]
+        contexts = [subpanel.transcript for subpanel in subpanels for _ in subpanel.members]
+        turns = self._run_round(
+            product_idea=product_idea,
+            task_skill=task_skill,
+            persona_skills=members,
+            discussion=plenary,
+            round_num=round_num,
+            contexts=contexts,
+            compact=compact
+        )
+
+        # Every member has spoken, so every future has resolved
+        for subpanel in subpanels:
+            subpanel.members = [m.result() if isinstance(m, Future) else m for m in subpanel.members]
+        owner = {m.name: subpanel for subpanel in subpanels for m in subpanel.members}
+        for turn in turns:
+            owner[turn.persona].transcript.extend([turn])
+
+        position_futures = [
+            self._submit(self._condense_position, product_idea, subpanel, round_num)
+            for subpanel in subpanels
+        ]
+        positions = [future.result() for future in position_futures]
+
+        self._log(f"\n🏛️  PLENARY (round {round_num})")
+        for position in positions:
+            self.bus.publish(events.TurnComplete(position.persona, round_num, position.message, kind="position"))
+
+        plenary.extend(positions)
+        for subpanel in subpanels:
+            # Their own position is already reflected in their turns
+            subpanel.transcript.extend([p for p in positions if p.persona != subpanel.name])
+
+        return turns + positions
+
+    def _condense_position(self, product_idea: str, subpanel: "SubPanel", round_num: int) -> Turn:
+        """Condense a sub-panel's turns this round into one position statement."""
+        system_prompt = """You are the rapporteur for one sub-panel of a product feedback discussion.
+
+Condense what your sub-panel said this round into its position, for the other sub-panels:
+- Overall stance on the idea
+- The strongest arguments, with who made them
+- Where the sub-panel disagrees internally
+
+Write 3-5 sentences. Do not add opinions of your own."""
+
+        members = ', '.join(m.name for m in subpanel.members)
+        this_round = '\n'.join(
+            f"- {turn.persona}: {turn.message}"
+            for turn in subpanel.transcript.round(round_num)
+            if turn.persona != "FOUNDER"
+        )
+        self._count_idea_send()
+        user_message = f"""Product idea: {product_idea}
+Sub-panel: {subpanel.name} ({members})
+Round: {round_num}
+
+What the sub-panel said:
+{this_round}
+
+State the sub-panel's position."""
+
+        with tracing.span("condense_position", subpanel=subpanel.name, round=round_num):
+            position = llm.chat(system_prompt, user_message, role="summary")
+        return Turn(subpanel.name, round_num, position)
 
-                if user_input:
-                    print(f"\n👤 FOUNDER:")
-                    for line in user_input.split('\n'):
-                        print(f"   {line}")
-                    print()
-                    discussion.append({
-                        "persona": "FOUNDER",
-                        "round": round_num,
-                        "message": user_input
-                    })
+    def _run_round(
+        self,
+        product_idea: str,
+        task_skill: Skill | None,
+        persona_skills: list[Skill | Future],
+        discussion: Transcript,
+        round_num: int,
+        contexts: list[Transcript] | None = None,
+        compact: bool = False
+    ) -> list[Turn]:
+        """
+        Run one round: every persona responds to the discussion so far.
+
+        Turns run concurrently, so a round takes as long as its slowest
+        persona rather than the sum of all of them. Personas given as futures
+        join the round as soon as they resolve. Turns are returned (and
+        printed) in the order they finish.
+
+        Nothing is appended to the transcript until the round is over, so
+        every persona sees the same discussion. `contexts`, if given, is the
+        transcript each persona reads instead (their sub-panel's). `compact`:
+        the budget is low, personas only read the latest turns.
+        """
+        contexts = contexts or [discussion] * len(persona_skills)
+        pending_skills = {}  # Future -> the transcript that persona will read
+        pending_turns = {}  # Future -> when it was submitted
+
+        for persona, context in zip(persona_skills, contexts):
+            if isinstance(persona, Future):
+                pending_skills[persona] = context
             else:
-                silent_rounds += 1
-                print(f"\n💭 Personas continuing discussion... (no question for founder, {silent_rounds}/{config.MAX_SILENT_ROUNDS})")
+                pending_turns[self._submit(
+                    self._persona_turn, product_idea, task_skill, persona, context, round_num, compact
+                )] = time.perf_counter()
+
+        turns = []
+        while pending_skills or pending_turns:
+            done, _ = wait(set(pending_skills) | set(pending_turns), return_when=FIRST_COMPLETED)
+
+            for future in done:
+                if future in pending_skills:
+                    context = pending_skills.pop(future)
+                    pending_turns[self._submit(
+                        self._persona_turn, product_idea, task_skill, future.result(), context, round_num, compact
+                    )] = time.perf_counter()
+                    continue
+
+                submitted = pending_turns.pop(future)
+                turn = future.result()
+                self.turn_times.append((turn.persona, round_num, submitted, time.perf_counter()))
+                self.budget.record_call(time.perf_counter() - submitted)
+                if self.time_to_first_message is None:
+                    self.time_to_first_message = time.perf_counter() - self.session_started
+
+                self.bus.publish(events.TurnComplete(turn.persona, round_num, turn.message))
+                turns.append(turn)
+
+        return turns
+
+    def _persona_turn(
+        self,
+        product_idea: str,
+        task_skill: Skill | None,
+        persona_skill: Skill,
+        discussion: Transcript,
+        round_num: int,
+        compact: bool = False
+    ) -> Turn:
+        """One persona's turn: a single LLM call with their skill injected."""
+        if config.CONVERSATION_STATE:
+            return self._persona_turn_in_thread(
+                product_idea, task_skill, persona_skill, discussion, round_num, compact
+            )
 
-                # Check if we should auto-stop
-                if silent_rounds >= config.MAX_SILENT_ROUNDS:
-                    print(f"\n✅ Discussion complete - personas reached conclusion after {round_num} rounds.")
-                    break
+        system_prompt = self.prepared_prompts.pop((persona_skill.name, round_num), None) or \
+            self._build_persona_prompt(
+                persona_skill=persona_skill,
+                task_skill=task_skill,
+                round_num=round_num
+            )
 
-                # Give user option to interject anyway or stop
-                if self.interactive:
-                    print('   Press Enter to continue, type input to add thoughts, or \'stop\' to end.')
-                    print('   Use \"\"\" for multi-line input.')
-                    user_input = self._get_founder_input(allow_empty=True)
+        user_message = self._build_discussion_context(
+            product_idea=product_idea,
+            discussion=discussion,
+            current_persona=persona_skill.name,
+            round_num=round_num,
+            compact=compact
+        )
 
-                    if user_input is None:  # User typed 'stop'
-                        print("\n🛑 Stopping discussion at your request.")
-                        break
-                    elif user_input:
-                        silent_rounds = 0  # User input resets the counter
-                        print(f"\n👤 FOUNDER:")
-                        for line in user_input.split('\n'):
-                            print(f"   {line}")
-                        print()
-                        discussion.append({
-                            "persona": "FOUNDER",
-                            "round": round_num,
-                            "message": user_input
-                        })
+        request_bytes = len(system_prompt.encode()) + len(user_message.encode())
+        self.upload_bytes.append(request_bytes)
+        saved = sum(len(skill.content) - len(self._skill_text(skill, round_num))
+                    for skill in (persona_skill, task_skill) if skill is not None)
+        if saved:
+            self.condensed_calls.append((saved, len(system_prompt)))
+        with tracing.span("persona_turn", persona=persona_skill.name, round=round_num, request_bytes=request_bytes):
+            if self.bus.wants_tokens:
+                response = self._stream_turn(system_prompt, user_message, persona_skill.name, round_num)
+            else:
+                response = llm.chat(system_prompt, user_message)
 
-        if round_num >= config.MAX_TOTAL_ROUNDS:
-            print(f"\n⚠️ Reached maximum rounds ({config.MAX_TOTAL_ROUNDS}). Wrapping up.")
+        return Turn(persona_skill.name, round_num, response)
 
-        return discussion
+    def _stream_turn(self, system_prompt: str, user_message: str, persona: str, round_num: int) -> str:
+        """
+        A persona call streamed, publishing each piece as a PersonaToken.
+
+        Only used when a sink wants tokens.
+        """
+        pieces = []
+        for piece in llm.stream(system_prompt, user_message):
+            pieces.append(piece)
+            self.bus.publish(events.PersonaToken(persona, round_num, piece))
+        return "".join(pieces)
+
+    def _persona_turn_in_thread(
+        self,
+        product_idea: str,
+        task_skill: Skill | None,
+        persona_skill: Skill,
+        discussion: Transcript,
+        round_num: int,
+        compact: bool = False
+    ) -> Turn:
+        """
+        One persona's turn, continuing that persona's own conversation.
+
+        The first turn sends the usual context. After that, the persona
+        already has the earlier discussion (and its own replies) in its
+        thread, so we only send the turns that are new since it last spoke.
+        """
+        name = persona_skill.name
+        conversation = self.conversations.get(name)
+
+        if conversation is None:
+            conversation = llm.Conversation(self._build_persona_prompt(
+                persona_skill=persona_skill,
+                task_skill=task_skill,
+                round_num=None
+            ))
+            self.conversations[name] = conversation
+            user_message = self._build_discussion_context(
+                product_idea=product_idea,
+                discussion=discussion,
+                current_persona=name,
+                round_num=round_num,
+                compact=compact
+            )
+        else:
+            user_message = self._build_thread_update(discussion, name, round_num)
+
+        self.seen[name] = len(discussion)
+        with tracing.span("persona_turn", persona=name, round=round_num, thread=True) as span:
+            response = conversation.send(user_message)
+            span.set(request_bytes=conversation.last_request_bytes)
+        self.upload_bytes.append(conversation.last_request_bytes)
+
+        return Turn(name, round_num, response)
+
+    def _build_thread_update(self, discussion: Transcript, current_persona: str, round_num: int) -> str:
+        """Build the user message for a persona thread: only what's new."""
+        parts = [f"Round {round_num}."]
+
+        new_turns = discussion.history_since(self.seen[current_persona], exclude=current_persona)
+        if new_turns:
+            parts.append("New in the discussion since you last spoke:")
+            parts.append(new_turns)
+            parts.append("")
+
+        parts.append("Respond to what others have said. Build on good points, challenge weak ones.")
+        return '\n'.join(parts)
+
+    def _founder_input(
+        self,
+        plenary: Transcript,
+        discussion: Transcript,
+        persona_skills: list[Skill],
+        task_skill: Skill | None,
+        round_num: int,
+        allow_empty: bool = False
+    ) -> str | None:
+        """
+        _get_founder_input(), putting the wait to use.
+
+        KEY INSIGHT: The founder takes tens of seconds to type; the process
+        would otherwise sit idle. Meanwhile we bring the running summary up
+        to date (so the final summary has less to read), build next round's
+        persona prompts and renderings, and re-warm the API connection.
+        Whatever isn't done when the answer arrives is cancelled.
+        """
+        if not config.THINK_TIME_PRECOMPUTE:
+            return self._get_founder_input(allow_empty=allow_empty)
+
+        work = _ThinkTime()
+        self._submit(self._update_running_summary, plenary, work)
+        self._submit(self._prepare_round, discussion, plenary, persona_skills, task_skill, round_num + 1, work)
+        self._submit(llm.prewarm)
+        started = time.perf_counter()
+        try:
+            return self._get_founder_input(allow_empty=allow_empty)
+        finally:
+            work.cancel()
+            self.think_time.append({"seconds": time.perf_counter() - started, "finished": list(work.finished)})
+
+    def _update_running_summary(self, plenary: Transcript, work: _ThinkTime):
+        """Fold the turns since the last running summary into it (one streamed call)."""
+        covered, previous = self.running_summary or (0, "")
+        turns = len(plenary)
+        if turns == covered:
+            work.finish("running summary")
+            return
+
+        system_prompt = """You keep running notes on a product feedback discussion for the moderator
+who will write the final summary.
+
+Update the notes with the new turns. Keep, per point, who raised it:
+1. What the personas agree on
+2. Where they disagree
+3. Open questions and concrete suggestions
+
+Be specific and brief. Return the complete updated notes."""
+        user_message = f"""Notes so far:
+{previous or "(none yet)"}
+
+New turns:
+{plenary.summary_since(covered)}"""
+
+        parts = []
+        try:
+            for chunk in work.open_stream(system_prompt, user_message, role="summary"):
+                parts.append(chunk)
+        except Exception:
+            return  # Best effort: the final summary reads the full discussion instead
+        if work.finish("running summary"):
+            self.running_summary = (turns, "".join(parts))
+
+    def _prepare_round(
+        self,
+        discussion: Transcript,
+        plenary: Transcript,
+        persona_skills: list[Skill],
+        task_skill: Skill | None,
+        round_num: int,
+        work: _ThinkTime
+    ):
+        """Build next round's persona system prompts and bring the transcript renderings up to date."""
+        discussion.history_text()
+        plenary.summary_text()
+        if config.CONVERSATION_STATE:
+            work.finish("renderings")
+            return  # Thread prompts are built once, on the first turn
+
+        prompts = {}
+        for persona in persona_skills:
+            if work.cancelled.is_set():
+                return
+            prompts[(persona.name, round_num)] = self._build_persona_prompt(persona, task_skill, round_num)
+        if work.finish("persona prompts"):
+            self.prepared_prompts.update(prompts)
 
     def _get_founder_input(self, allow_empty: bool = False) -> str | None:
         """
@@ -266,6 +1335,7 @@ class Orchestrator:
             Type \"\"\" to start, then type your response across multiple lines.
             Type \"\"\" on its own line to finish.
         """
+        self.bus.flush()  # The question has to be on screen before the prompt
         first_line = input("> ").strip()
 
         # Check for stop
@@ -274,7 +1344,8 @@ class Orchestrator:
 
         # Check for multi-line mode
         if first_line == '"""':
-            print('📝 Multi-line mode. Type your response, then \"\"\" to finish:')
+            self._log('📝 Multi-line mode. Type your response, then \"\"\" to finish:')
+            self.bus.flush()
             lines = []
             while True:
                 try:
@@ -295,7 +1366,7 @@ class Orchestrator:
     def _should_ask_founder(
         self,
         product_idea: str,
-        discussion: list[dict],
+        discussion: Transcript,
         round_num: int
     ) -> dict:
         """
@@ -321,18 +1392,16 @@ Do NOT ask if:
 - Previous questions have already covered the key points
 - The personas are close to reaching useful conclusions
 
-Respond with JSON:
+Respond with JSON, with the fields in exactly this order (decision first):
 {
     "should_ask": true/false,
     "question": "The specific question to ask the founder" or null,
     "reasoning": "Brief explanation of your decision"
 }"""
 
-        discussion_text = '\n'.join([
-            f"- {d['persona']}: {d['message']}"
-            for d in discussion[-10:]  # Last 10 messages for context
-        ])
+        discussion_text = discussion.recent_text(10)  # Last 10 messages for context
 
+        self._count_idea_send()
         user_message = f"""Product idea: {product_idea}
 Round: {round_num}
 
@@ -341,21 +1410,51 @@ Recent discussion:
 
 Should we ask the founder a question, or let the discussion continue?"""
 
-        response = llm.chat_json(system_prompt, user_message)
+        with tracing.span("should_ask_founder", round=round_num) as span:
+            if config.MODERATOR_EARLY_DECISION:
+                result = self._stream_decision(system_prompt, user_message)
+                span.set(early=result is not None)
+            else:
+                result = None
+            if result is None:
+                try:
+                    result = json.loads(llm.chat_json(system_prompt, user_message, role="moderator"))
+                except json.JSONDecodeError:
+                    result = {}
 
+        if result.get("should_ask") and result.get("question"):
+            return {"should_ask": True, "question": result["question"]}
+        return {"should_ask": False, "question": None}
+
+    def _stream_decision(self, system_prompt: str, user_message: str) -> dict | None:
+        """
+        Stream the moderator's JSON and stop reading as soon as the decision
+        is known: should_ask is false, or it's true and the question is
+        complete. The rest (the reasoning) is never waited for.
+
+        Returns the fields read so far, or None if the reply wasn't usable
+        JSON (the caller falls back to a regular call).
+        """
+        parser = JsonFieldParser()
+        stream = llm.stream(system_prompt, user_message, role="moderator", json_mode=True)
         try:
-            result = json.loads(response)
-            if result.get("should_ask") and result.get("question"):
-                return {"should_ask": True, "question": result["question"]}
-            return {"should_ask": False, "question": None}
-        except json.JSONDecodeError:
-            return {"should_ask": False, "question": None}
+            for chunk in stream:
+                parser.feed(chunk)
+                fields = parser.fields
+                if "should_ask" in fields and (not fields["should_ask"] or "question" in fields):
+                    return fields
+                if parser.failed:
+                    break
+        finally:
+            stream.close()
+
+        return parser.fields if parser.done else None
 
     def _build_persona_prompt(
         self,
         persona_skill: Skill,
         task_skill: Skill | None,
-        round_num: int
+        round_num: int | None
     ) -> str:
         """
         Build system prompt with skill injection.
@@ -363,22 +1462,28 @@ Should we ask the founder a question, or let the discussion continue?"""
         THIS IS THE CORE OF HOW SKILLS WORK:
         We inject the skill content into the system prompt.
         The LLM reads these instructions and follows them.
+
+        round_num is None for persona threads, whose system prompt must stay
+        the same across rounds (the round goes in the user message instead).
         """
         parts = []
 
         # Base context
         parts.append("You are participating in a product feedback discussion.")
-        parts.append(f"This is round {round_num} of the discussion.\n")
+        if round_num is not None:
+            parts.append(f"This is round {round_num} of the discussion.\n")
+        else:
+            parts.append("")
 
         # Inject task skill (how to approach the evaluation)
         if task_skill:
             parts.append("## YOUR TASK")
-            parts.append(task_skill.content)
+            parts.append(self._skill_text(task_skill, round_num))
             parts.append("")
 
         # Inject persona skill (who you are)
         parts.append("## YOUR PERSONA")
-        parts.append(persona_skill.content)
+        parts.append(self._skill_text(persona_skill, round_num))
         parts.append("")
 
         # Discussion guidelines
@@ -391,22 +1496,53 @@ Should we ask the founder a question, or let the discussion continue?"""
 
         return '\n'.join(parts)
 
+    def _prepare_condensed(self, skills: list[Skill | None]):
+        """Later rounds use the condensed skills - prepare them now (in the background)."""
+        mode = config.SKILL_CONDENSE
+        if mode == "off":
+            return
+        for skill in skills:
+            if skill is not None and mode not in skill.condensed:
+                self._submit(condense_skill, skill, mode)
+
+    @staticmethod
+    def _skill_text(skill: Skill, round_num: int | None) -> str:
+        """
+        The skill text for a persona prompt: the condensed form (for the
+        current SKILL_CONDENSE mode) from round 2 on, once it's ready. Round 1
+        (and persona threads, whose system prompt is sent once) get the full skill.
+        """
+        if round_num is not None and round_num > 1:
+            return skill.condensed.get(config.SKILL_CONDENSE, skill.content)
+        return skill.content
+
     def _build_discussion_context(
         self,
         product_idea: str,
-        discussion: list[dict],
+        discussion: Transcript,
         current_persona: str,
-        round_num: int
+        round_num: int,
+        compact: bool = False
     ) -> str:
-        """Build the user message with discussion history."""
+        """
+        Build the user message with discussion history.
+
+        compact comes from the round's budget plan (rounds overlap when
+        staggered, so it's passed along rather than kept on the orchestrator).
+        """
         parts = []
 
+        self._count_idea_send()
         parts.append(f"Product idea: {product_idea}\n")
 
-        if discussion:
+        if discussion and compact:
+            # Budget is running low: only the latest turns
+            parts.append("Recent discussion (earlier turns left out):")
+            parts.append(discussion.recent_text(config.BUDGET_COMPACT_TURNS))
+            parts.append("")
+        elif discussion:
             parts.append("Previous discussion:")
-            for entry in discussion:
-                parts.append(f"- {entry['persona']} (round {entry['round']}): {entry['message']}")
+            parts.append(discussion.history_text())
             parts.append("")
 
         if round_num == 1:
@@ -416,11 +1552,12 @@ Should we ask the founder a question, or let the discussion continue?"""
 
         return '\n'.join(parts)
 
-    def _summarize(self, product_idea: str, task_type: str, discussion: list[dict]) -> str:
+    @tracing.traced("summarize")
+    def _summarize(self, product_idea: str, task_type: str, discussion: Transcript) -> str:
         """Generate a summary of the discussion."""
-        print(f"\n{'='*60}")
-        print("📊 SUMMARY")
-        print(f"{'='*60}\n")
+        self._log(f"\n{'='*60}")
+        self._log("📊 SUMMARY")
+        self._log(f"{'='*60}\n")
 
         system_prompt = """You are a neutral moderator summarizing a product feedback discussion.
 
@@ -431,10 +1568,16 @@ Provide a concise summary that includes:
 
 Be specific and reference the actual discussion points."""
 
-        discussion_text = '\n'.join([
-            f"- {d['persona']}: {d['message']}"
-            for d in discussion
-        ])
+        if self.running_summary and self.running_summary[0] <= len(discussion):
+            # Notes on the earlier turns were written while the founder typed
+            covered, notes = self.running_summary
+            discussion_text = f"""Notes on the first {covered} turns:
+{notes}
+
+Turns since then:
+{discussion.summary_since(covered) or "(none)"}"""
+        else:
+            discussion_text = discussion.summary_text()
 
         user_message = f"""Product: {product_idea}
 Task: {task_type}
@@ -444,10 +1587,150 @@ Discussion:
 
 Summarize the key takeaways."""
 
-        summary = llm.chat(system_prompt, user_message)
-        print(summary)
+        summary = llm.chat(system_prompt, user_message, role="summary")
+        self.bus.publish(events.Summary(summary))
         return summary
 
+    def _report_latency(self) -> dict:
+        """
+        Print time-to-first-message, round latency, hedging, upload, queue-wait
+        and coalescing stats.
+
+        Run once with hedging on (--hedge) and once without to compare
+        the tail: hedging should mostly move p95/p99, not p50.
+        """
+        hedging = llm.hedging_stats()
+        label = "Round latency (hedged)" if hedging["enabled"] else "Round latency"
+        mode = "conversation state" if config.CONVERSATION_STATE else "stateless"
+        upload_kb = sum(self.upload_bytes) / 1024
+
+        if self.time_to_first_message is not None:
+            self._log(f"\n⚡ Time to first persona message: {self.time_to_first_message:.2f}s")
+        self._log(f"⏱️  {metrics.format_latency_summary(label, self.round_latencies)}")
+        if hedging["enabled"]:
+            self._log(f"   Hedges: {hedging['hedges']}/{hedging['calls']} calls "
+                  f"({hedging['extra_call_ratio']:.0%} extra), "
+                  f"{hedging['hedge_wins']} won, threshold {hedging['threshold_seconds']:.2f}s")
+        self._log(f"📤 Persona uploads ({mode}): {upload_kb:.1f} KB over {len(self.upload_bytes)} calls")
+
+        usage = self._session_usage()
+        shared = f" ({usage['coalesced']} shared with identical calls in flight)" if usage["coalesced"] else ""
+        self._log(f"🔢 Tokens: {usage['prompt_tokens']} in / {usage['completion_tokens']} out "
+              f"over {usage['calls']} calls{shared}")
+
+        waits = [call["wait"] for call in self.session.waits]
+        self._log(f"🚦 {metrics.format_latency_summary(f'Queue wait ({self.priority})', waits)}")
+
+        budget = self.budget.report()
+        if self.budget.enabled:
+            limits = budget["limits"]
+            spent = budget["spent"]
+            limit_text = " · ".join(
+                text for text in (
+                    limits["seconds"] and f"{spent['seconds']:.0f}s of {limits['seconds']:.0f}s",
+                    limits["tokens"] and f"{spent['tokens']} of {limits['tokens']} tokens",
+                ) if text
+            )
+            self._log(f"💰 Budget: {limit_text}")
+            self._log("   " + " · ".join(
+                f"{name} {phase['seconds']:.1f}s/{phase['tokens']} tok" for name, phase in budget["phases"].items()
+            ))
+            for note in budget["adaptations"]:
+                self._log(f"   ↳ {note}")
+
+        idea_digest = self._idea_digest_stats()
+        if idea_digest:
+            self._log(f"📝 Idea brief: {idea_digest['brief_chars']} chars instead of {idea_digest['full_chars']} "
+                      f"in {idea_digest['sends']} prompts, ~{idea_digest['tokens_saved']} tokens saved")
+
+        if self.condensed_calls:
+            saved = sum(chars for chars, _ in self.condensed_calls)
+            prompt_chars = sum(chars for _, chars in self.condensed_calls)
+            self._log(f"✂️  Condensed skills ({config.SKILL_CONDENSE}): {len(self.condensed_calls)} calls, "
+                      f"~{saved // 4 // len(self.condensed_calls)} prompt tokens saved per call "
+                      f"({saved / (saved + prompt_chars):.0%} of the system prompt)")
+
+        idle = self._idle_seconds()
+        pipeline = f"staggered, K={config.STAGGER_TURNS}" if self.pipeline == "staggered" else "barrier"
+        self._log(f"🔀 Rounds ({pipeline}): discussion {self.discussion_seconds:.1f}s, "
+                  f"personas idle {idle:.1f}s between turns")
+
+        if self.think_time:
+            finished = {}
+            for wait in self.think_time:
+                for name in wait["finished"]:
+                    finished[name] = finished.get(name, 0) + 1
+            self._log(f"🧠 Founder think time: {len(self.think_time)} waits, "
+                      f"{sum(wait['seconds'] for wait in self.think_time):.1f}s - finished meanwhile: "
+                      + (", ".join(f"{name} ×{count}" for name, count in finished.items()) or "nothing"))
+
+        coalescing = llm.coalescing_stats()
+        if coalescing["coalesced"]:
+            self._log(f"🔗 Coalesced requests: {coalescing['coalesced']}/{coalescing['requests']} "
+                  f"shared an in-flight call ({coalescing['upstream_calls']} went upstream)")
+
+        return {
+            "time_to_first_message": self.time_to_first_message,
+            "round_latency": metrics.latency_summary(self.round_latencies),
+            "hedging": hedging,
+            "persona_upload_bytes": sum(self.upload_bytes),
+            "usage": usage,
+            "coalescing": coalescing,
+            "budget": budget,
+            "idea_digest": idea_digest,
+            "think_time": self.think_time,
+            "dedup": self.dedup,
+            "pipeline": {
+                "mode": self.pipeline,
+                "stagger_turns": config.STAGGER_TURNS if self.pipeline == "staggered" else None,
+                "discussion_seconds": self.discussion_seconds,
+                "idle_seconds": idle,
+            },
+            "condensed_skills": {
+                "mode": config.SKILL_CONDENSE,
+                "calls": len(self.condensed_calls),
+                "chars_saved": sum(chars for chars, _ in self.condensed_calls),
+            },
+            "queue_wait": {
+                "priority": self.priority,
+                "summary": metrics.latency_summary(waits),
+                "calls": self.session.waits,
+            },
+            "conversation": llm.conversation_stats() if config.CONVERSATION_STATE else None,
+        }
+
+    def _idle_seconds(self) -> float:
+        """Seconds personas spent between turns (one turn's end to their next start), summed over personas."""
+        idle = 0.0
+        finished = {}  # Persona -> when their last turn ended
+        for persona, _, started, ended in sorted(self.turn_times, key=lambda times: times[2]):
+            if persona in finished:
+                idle += max(0.0, started - finished[persona])
+            finished[persona] = ended
+        return idle
+
+    def _count_idea_send(self):
+        with self._idea_sends_lock:
+            self.idea_sends += 1
+
+    def _idea_digest_stats(self) -> dict | None:
+        """What sending the brief instead of the full idea saved (~4 characters per token)."""
+        digest = self.idea_digest
+        if digest is None or not digest.condensed:
+            return None
+        return {
+            "full_chars": digest.full_chars,
+            "brief_chars": len(digest.text),
+            "cached": digest.cached,
+            "sends": self.idea_sends,
+            "tokens_saved": self.idea_sends * digest.chars_saved // 4 - digest.tokens_spent,
+        }
+
+    def _session_usage(self) -> dict:
+        """Calls and tokens charged to this session (all backends)."""
+        return dict(self.session.usage)
+
+    @tracing.traced("save_chat")
     def save_chat(self, filepath: str | None = None, format: str = "json") -> str:
         """
         Save the last discussion to a file.
@@ -465,7 +1748,7 @@ Summarize the key takeaways."""
         - Build a library of product feedback
         """
         if not self.last_chat:
-            print("❌ No chat to save. Run a discussion first.")
+            self.bus.publish(events.Error("No chat to save. Run a discussion first."))
             return ""
 
         # Auto-generate filepath if not provided
@@ -486,7 +1769,8 @@ Summarize the key takeaways."""
         with open(filepath, "w") as f:
             f.write(content)
 
-        print(f"💾 Chat saved to: {filepath}")
+        self._log(f"💾 Chat saved to: {filepath}")
+        self.bus.flush()
         return filepath
 
     def _format_as_markdown(self) -> str:
@@ -502,22 +1786,128 @@ Summarize the key takeaways."""
         if chat.get("selection_reasoning"):
             lines.append(f"\n**Why these personas:** {chat['selection_reasoning']}")
 
+        if chat.get("reused_from"):
+            source = chat["reused_from"]
+            lines.append(f"\n**Reused from:** the {source['timestamp'][:16].replace('T', ' ')} session on a "
+                         f"near-duplicate idea ({source['similarity']:.0%} similar): {source['idea']}")
+
         lines.append("\n---\n")
         lines.append("## Discussion\n")
 
-        current_round = 0
-        for entry in chat["discussion"]:
-            if entry["round"] != current_round:
-                current_round = entry["round"]
-                lines.append(f"\n### Round {current_round}\n")
-
-            persona = entry["persona"]
-            emoji = "👤" if persona == "USER" else "🎭"
-            lines.append(f"**{emoji} {persona}:**")
-            lines.append(f"{entry['message']}\n")
+        transcript = self.last_transcript or Transcript.from_dicts(chat["discussion"])
+        if transcript:
+            lines.append(transcript.markdown_text())
 
         lines.append("\n---\n")
         lines.append("## Summary\n")
         lines.append(chat["summary"])
 
         return "\n".join(lines)
+
+    def save_matrix_report(self, filepath: str | None = None, format: str = "markdown") -> str:
+        """
+        Save the last matrix run as a side-by-side comparison report.
+
+        Args:
+            filepath: Where to save. If None, auto-generates based on timestamp.
+            format: "json" or "markdown"
+
+        Returns:
+            The filepath where the report was saved.
+        """
+        if not self.last_matrix:
+            self.bus.publish(events.Error("No matrix to save. Run a matrix first."))
+            return ""
+
+        if not filepath:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            ext = "md" if format == "markdown" else "json"
+            filepath = f"chats/{timestamp}_matrix.{ext}"
+
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+
+        if format == "markdown":
+            content = self._format_matrix_as_markdown()
+        else:
+            content = json.dumps(self.last_matrix, indent=2)
+
+        with open(filepath, "w") as f:
+            f.write(content)
+
+        self._log(f"💾 Matrix report saved to: {filepath}")
+        self.bus.flush()
+        return filepath
+
+    def _format_matrix_as_markdown(self) -> str:
+        """
+        Format the matrix as markdown: per family and task, one column per variant.
+
+        Reading across a row compares how the variants fared on the same task.
+        """
+        matrix = self.last_matrix
+        stats = matrix["stats"]
+        lines = []
+
+        lines.append("# Product Feedback Matrix")
+        lines.append(f"\n**Date:** {matrix['timestamp']}")
+        lines.append(f"**Tasks:** {', '.join(matrix['tasks'])}")
+        lines.append(f"**Runs:** {stats['cells']} in {stats['wall_seconds']:.1f}s "
+                     f"({stats['cell_seconds']:.1f}s of run time, {stats['failed']} failed)")
+        lines.append(f"**Tokens:** {stats['usage']['prompt_tokens']} in / "
+                     f"{stats['usage']['completion_tokens']} out over {stats['usage']['calls']} calls")
+
+        for family, panel in matrix["panels"].items():
+            cells = [cell for cell in matrix["cells"] if cell["family"] == family]
+            variants = sorted({cell["variant"] for cell in cells})
+
+            lines.append(f"\n---\n\n## {family}\n")
+            lines.append(f"**Personas:** {', '.join(panel['personas'])}")
+            if panel["reasoning"]:
+                lines.append(f"\n**Why these personas:** {panel['reasoning']}")
+
+            lines.append("\n**Variants:**\n")
+            for number in variants:
+                idea = next(cell["idea"] for cell in cells if cell["variant"] == number)
+                lines.append(f"{number}. {_one_line(idea, 200)}")
+
+            for task in matrix["tasks"]:
+                by_variant = {cell["variant"]: cell for cell in cells if cell["task"] == task}
+                lines.append(f"\n### {task}\n")
+                lines.append("| | " + " | ".join(f"Variant {n}" for n in variants) + " |")
+                lines.append("|---|" + "---|" * len(variants))
+                lines.append("| Takeaway | " + " | ".join(
+                    _table_cell(by_variant[n]["error"] and f"❌ {by_variant[n]['error']}"
+                                or _first_sentence(by_variant[n]["summary"]))
+                    for n in variants) + " |")
+                lines.append("| Rounds | " + " | ".join(str(by_variant[n]["rounds"]) for n in variants) + " |")
+                lines.append("| Time | " + " | ".join(f"{by_variant[n]['seconds']:.1f}s" for n in variants) + " |")
+                lines.append("| Open questions | " + " | ".join(
+                    _table_cell("; ".join(by_variant[n]["open_questions"]) or "-") for n in variants) + " |")
+
+            lines.append("\n### Summaries\n")
+            for cell in cells:
+                if cell["summary"]:
+                    lines.append(f"#### Variant {cell['variant']} × {cell['task']}\n")
+                    lines.append(cell["summary"] + "\n")
+
+        return "\n".join(lines)
+
+
+def _one_line(text: str, limit: int) -> str:
+    """Collapse whitespace and cut to `limit` characters."""
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+
+def _first_sentence(summary: str | None) -> str:
+    """The first real sentence of a summary (skipping headings), for a table cell."""
+    for line in (summary or "").splitlines():
+        line = line.strip().lstrip("#*-0123456789. ").strip("*")
+        if len(line) > 20:
+            return _one_line(line.split(". ")[0], 160)
+    return _one_line(summary or "-", 160)
+
+
+def _table_cell(text: str) -> str:
+    """Make text safe for a markdown table cell."""
+    return _one_line(text, 400).replace("|", "\\|")
@@ -0,0 +1,216 @@
+"""
+Scheduler - Decides which LLM call goes next when sessions share a process.
+
+Several sessions can run in one process (matrix mode, a server): a batch of
+fifteen runs and a founder waiting on a question all draw from the same API
+quota. Every upstream LLM call asks the scheduler for a slot first.
+
+- Global cap: at most config.MAX_CONCURRENT_CALLS calls run at once
+- Priority: interactive sessions go before batch sessions
+- Fairness: within a priority, sessions take turns (round-robin), so one
+  session with fifty queued calls can't starve one with a single call
+- Aging: a batch call that has waited config.BATCH_MAX_WAIT seconds goes
+  next anyway, so batch work always makes progress
+
+KEY CONCEPT: The session is carried in a context variable, not passed
+through every function. The orchestrator sets it once per run, and copies
+the context into the threads it starts.
+
+Every call records how long it queued, so the cap can be tuned.
+"""
+
+import contextvars
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+import config
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+
+@dataclass(eq=False)
+class Session:
+    """
+    One discussion (or batch job) competing for LLM calls.
+
+    Attributes:
+        name: For logs and stats
+        priority: INTERACTIVE (someone is waiting) or BATCH
+        waits: One {"kind", "wait"} record per call, in order
+        usage: Calls and tokens charged to this session (by the backends);
+            "coalesced" counts the calls answered by joining an identical
+            call already in flight, whose tokens are charged here too
+    """
+    name: str
+    priority: str = INTERACTIVE
+    waits: list[dict] = field(default_factory=list)
+    usage: dict = field(default_factory=lambda: {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0,
+                                                 "coalesced": 0})
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def charge(self, prompt_tokens: int, completion_tokens: int, coalesced: bool = False):
+        with self._lock:
+            self.usage["calls"] += 1
+            self.usage["prompt_tokens"] += prompt_tokens
+            self.usage["completion_tokens"] += completion_tokens
+            if coalesced:
+                self.usage["coalesced"] += 1
+        charges = _recorded_charges.get()
+        if charges is not None and not coalesced:
+            charges.append((prompt_tokens, completion_tokens))
+
+    def tokens(self) -> int:
+        """Prompt plus completion tokens so far."""
+        with self._lock:
+            return self.usage["prompt_tokens"] + self.usage["completion_tokens"]
+
+
+@dataclass(eq=False)
+class _Ticket:
+    """A call waiting for (or holding) a slot."""
+    session: Session
+    kind: str
+    enqueued: float
+    granted: threading.Event = field(default_factory=threading.Event)
+
+
+_default_session = Session("default")
+_current_session = contextvars.ContextVar("hotseat_session", default=_default_session)
+_recorded_charges = contextvars.ContextVar("hotseat_recorded_charges", default=None)
+
+
+def current_session() -> Session:
+    """The session calls on this thread are charged to."""
+    return _current_session.get()
+
+
+@contextmanager
+def session_scope(session: Session):
+    """Charge every LLM call made inside this block to `session`."""
+    token = _current_session.set(session)
+    try:
+        yield session
+    finally:
+        _current_session.reset(token)
+
+
+@contextmanager
+def recording_charges(charges: list):
+    """
+    Append (prompt_tokens, completion_tokens) to `charges` for every call
+    charged inside this block, whichever session pays - how a coalesced
+    call finds out what to charge the callers that joined it.
+    """
+    token = _recorded_charges.set(charges)
+    try:
+        yield charges
+    finally:
+        _recorded_charges.reset(token)
+
+
+def bind(fn, *args):
+    """
+    fn(*args) as a no-argument callable that runs in the current context
+    (session included).
+
+    Threads don't inherit context variables, so anything handed to a pool or
+    a Thread should be bound first.
+    """
+    context = contextvars.copy_context()
+    return lambda: context.run(fn, *args)
+
+
+class CallScheduler:
+    """
+    Process-wide slots for upstream LLM calls.
+
+    Waiting calls sit in one FIFO per session; sessions sit in a round-robin
+    order per priority. When a slot frees up it's handed straight to the
+    next call, so the running count never dips and rises again.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.queues = {INTERACTIVE: OrderedDict(), BATCH: OrderedDict()}  # session -> deque of tickets
+        self.calls = 0
+        self.queued = 0
+
+    def acquire(self, kind: str = "default") -> _Ticket:
+        """Block until this call may run. Returns the ticket to release."""
+        ticket = _Ticket(current_session(), kind, time.monotonic())
+
+        with self.lock:
+            if self.running < config.MAX_CONCURRENT_CALLS and not self._waiting():
+                self.running += 1
+                ticket.granted.set()
+            else:
+                self.queued += 1
+                self.queues[ticket.session.priority].setdefault(ticket.session, deque()).append(ticket)
+            self.calls += 1
+
+        ticket.granted.wait()
+        ticket.session.waits.append({"kind": kind, "wait": time.monotonic() - ticket.enqueued})
+        return ticket
+
+    def release(self, ticket: _Ticket):
+        """Give the slot to the next waiting call, or free it."""
+        with self.lock:
+            following = self._next()
+            if following is None:
+                self.running -= 1
+        if following is not None:
+            following.granted.set()
+
+    @contextmanager
+    def slot(self, kind: str = "default"):
+        """Hold a slot for the duration of the block."""
+        ticket = self.acquire(kind)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def _waiting(self) -> bool:
+        return any(self.queues.values())
+
+    def _next(self) -> _Ticket | None:
+        """Pick the next call: aged batch, then interactive, then batch - round-robin by session."""
+        batch = self.queues[BATCH]
+        if batch:
+            now = time.monotonic()
+            oldest = min(batch, key=lambda session: batch[session][0].enqueued)
+            if now - batch[oldest][0].enqueued >= config.BATCH_MAX_WAIT:
+                return self._pop(batch, oldest)
+
+        for priority in (INTERACTIVE, BATCH):
+            queues = self.queues[priority]
+            if queues:
+                return self._pop(queues, next(iter(queues)))
+        return None
+
+    @staticmethod
+    def _pop(queues: OrderedDict, session: Session) -> _Ticket:
+        """Take the session's next call and send the session to the back of the line."""
+        tickets = queues.pop(session)
+        ticket = tickets.popleft()
+        if tickets:
+            queues[session] = tickets
+        return ticket
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "max_concurrent": config.MAX_CONCURRENT_CALLS,
+                "running": self.running,
+                "waiting": sum(len(t) for queues in self.queues.values() for t in queues.values()),
+                "calls": self.calls,
+                "queued": self.queued,
+            }
+
+
+scheduler = CallScheduler()
@@ -10,14 +10,23 @@ This is the foundation of the skill system. It:
 KEY CONCEPT: Skills are just text files. The "magic" is that we:
 - Use descriptions to help the LLM choose relevant skills
 - Inject the full content into the system prompt to guide behavior
+
+Skills are re-sent on every persona call, so each one can also have a
+condensed form (condense_skill): the markdown stripped down to its
+instructions, optionally shortened further by a one-off LLM call. LLM
+condensations are cached in a .condensed/ folder next to the skill file,
+keyed by a hash of the content, so they're only redone when the skill changes.
 """
 
+import hashlib
+import json
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import config
+import events
 
 
 @dataclass
@@ -30,11 +39,13 @@ class Skill:
         description: What the skill does / when to use it (LLM reads this to decide)
         content: Full markdown content (gets injected into system prompt)
         path: Where the file lives (for debugging)
+        condensed: Shorter forms of content for later rounds, by condense mode (see condense_skill)
     """
     name: str
     description: str
     content: str
     path: str
+    condensed: dict[str, str] = field(default_factory=dict)
 
 
 def parse_frontmatter(text: str) -> tuple[dict, str]:
@@ -86,7 +97,8 @@ def load_skill(filepath: str) -> Skill | None:
 
     # Require name and description
     if 'name' not in frontmatter or 'description' not in frontmatter:
-        print(f"Warning: Skipping {filepath} - missing name or description in frontmatter")
+        events.publish(events.Notice(f"Warning: Skipping {filepath} - missing name or description in frontmatter",
+                                     level="warning"))
         return None
 
     return Skill(
@@ -97,10 +109,13 @@ def load_skill(filepath: str) -> Skill | None:
     )
 
 
-def load_all_skills() -> dict[str, Skill]:
+def load_all_skills(verbose: bool = True) -> dict[str, Skill]:
     """
     Scan skills directory and load all valid skill files.
 
+    Args:
+        verbose: Announce each skill as it loads (off when loading in the background)
+
     Returns:
         Dictionary mapping skill name -> Skill object
 
@@ -110,7 +125,7 @@ def load_all_skills() -> dict[str, Skill]:
     skills_path = Path(config.SKILLS_DIR)
 
     if not skills_path.exists():
-        print(f"Warning: Skills directory '{config.SKILLS_DIR}' not found")
+        events.publish(events.Notice(f"Warning: Skills directory '{config.SKILLS_DIR}' not found", level="warning"))
         return skills
 
     # Recursively find all .md files
@@ -122,11 +137,109 @@ def load_all_skills() -> dict[str, Skill]:
         skill = load_skill(str(filepath))
         if skill:
             skills[skill.name] = skill
-            print(f"Loaded skill: {skill.name}")
+            if verbose:
+                events.publish(events.Notice(f"Loaded skill: {skill.name}"))
 
     return skills
 
 
+# Bump when strip_markdown or the condensing prompt changes, so caches are redone
+_CONDENSE_VERSION = 2
+
+_CONDENSE_PROMPT = """You shorten instructions for an AI persona without changing them.
+
+Rewrite the instructions below as compactly as possible: keep every rule,
+priority, trait and red flag, and keep the example phrases and quotes that
+show how the persona talks. Drop anecdotes and repetition. Use terse bullet
+points, at most {words} words. Output only the instructions."""
+
+
+def strip_markdown(content: str) -> str:
+    """
+    Deterministic condensing: drop the title, blank lines and code blocks,
+    turn headings into short labels and remove emphasis and quote markers.
+    Every instruction line is kept, and so are example and quote lines -
+    they carry the persona's voice.
+    """
+    lines = []
+    in_code = False
+    for line in content.splitlines():
+        text = line.strip()
+        if text.startswith("```"):
+            in_code = not in_code
+            continue
+        if in_code or not text:
+            continue
+        if re.match(r"^#\s", text):
+            continue  # The title - the prompt already says which skill this is
+        text = re.sub(r"^(>\s*)+", "", text)
+        if not text:
+            continue
+        if text.startswith("#"):
+            lines.append(text.lstrip("#").strip().rstrip(":") + ":")
+            continue
+        text = re.sub(r"(\*\*|__|`)(.+?)\1", r"\2", text)
+        text = re.sub(r"^[*+]\s+", "- ", text)
+        lines.append(text)
+    return "\n".join(lines)
+
+
+def _condensed_cache_path(skill: Skill) -> Path | None:
+    """Where the LLM condensation lives: <skill dir>/.condensed/<file>.json (None for generated skills)."""
+    path = Path(skill.path)
+    if not path.is_file():
+        return None
+    return path.parent / ".condensed" / f"{path.stem}.json"
+
+
+def condense_skill(skill: Skill, mode: str | None = None) -> str:
+    """
+    Give `skill` its condensed form for `mode` (and return it).
+
+    Args:
+        mode: "strip" (deterministic only), "llm" (strip, then a one-off LLM
+            condensation, cached next to the skill) or "off". Defaults to
+            config.SKILL_CONDENSE.
+
+    The condensed form is only kept when it's actually shorter. Each mode's
+    form is kept separately - skills are shared between sessions.
+    """
+    mode = mode or config.SKILL_CONDENSE
+    if mode == "off":
+        return skill.content
+    if mode in skill.condensed:
+        return skill.condensed[mode]
+
+    condensed = strip_markdown(skill.content)
+
+    if mode == "llm":
+        key = hashlib.sha256(f"{_CONDENSE_VERSION}\x00{config.SKILL_CONDENSE_WORDS}\x00{skill.content}".encode()).hexdigest()
+        cache = _condensed_cache_path(skill)
+        cached = None
+        if cache is not None:
+            try:
+                entry = json.loads(cache.read_text())
+                cached = entry["text"] if entry.get("hash") == key else None
+            except (OSError, ValueError, KeyError):
+                pass
+        if cached is None:
+            import llm
+
+            cached = llm.chat(_CONDENSE_PROMPT.format(words=config.SKILL_CONDENSE_WORDS), condensed,
+                              role="summary").strip()
+            if cache is not None and cached:
+                try:
+                    cache.parent.mkdir(exist_ok=True)
+                    cache.write_text(json.dumps({"hash": key, "text": cached}))
+                except OSError:
+                    pass  # Caching is an optimization
+        if cached and len(cached) < len(condensed):
+            condensed = cached
+
+    skill.condensed[mode] = condensed if len(condensed) < len(skill.content) else skill.content
+    return skill.condensed[mode]
+
+
 def get_skill_descriptions(skills: dict[str, Skill]) -> str:
     """
     Format skill descriptions for the LLM to read during selection.
@@ -12,6 +12,8 @@ import json
 
 import llm
 import config
+import events
+import tracing
 from skill_loader import Skill, get_skill_descriptions
 
 
@@ -40,6 +42,7 @@ Respond with JSON in this exact format:
 """
 
 
+@tracing.traced("select_skills")
 def select_skills(
     user_request: str,
     available_skills: dict[str, Skill]
@@ -67,15 +70,25 @@ Available skills:
 
 Select the most relevant skills for this request."""
 
+    # Large panels (market sweeps) need more personas than the library has
+    if config.NUM_PERSONAS > config.BASE_PANEL_SIZE:
+        user_message += (
+            f"\n\nPanel size: {config.NUM_PERSONAS} personas in total. Add as many dynamic "
+            f"personas as needed to reach it, each a distinct segment or stakeholder."
+        )
+
     # Call LLM with JSON mode for structured response
-    response = llm.chat_json(SELECTOR_SYSTEM_PROMPT, user_message)
+    response = llm.chat_json(SELECTOR_SYSTEM_PROMPT, user_message, role="selector")
 
     try:
         selection = json.loads(response)
-        print(f"\n📋 Skill selection reasoning: {selection.get('reasoning', 'N/A')}")
+        events.publish(events.SkillsSelected(
+            selection.get("task_skill"), selection.get("persona_skills") or [], selection.get("reasoning", "N/A"),
+        ))
         return selection
     except json.JSONDecodeError:
-        print(f"Warning: Could not parse skill selection response: {response}")
+        events.publish(events.Notice(f"Warning: Could not parse skill selection response: {response}",
+                                     level="warning"))
         # Fallback to defaults
         return {
             "task_skill": "critique",
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Stand-in OpenAI server for trying the CLI without a real API.
+
+It answers the handful of endpoints Hot Seat uses with canned replies:
+- POST /v1/chat/completions (plain, JSON mode and streaming)
+- POST /v1/responses (including previous_response_id threads)
+- GET  /stats (request counts and bytes received)
+
+Point the CLI at it with OPENAI_BASE_URL. Every request logs how many bytes
+it uploaded, which makes it easy to compare stateless and conversation-state
+runs side by side.
+
+Usage:
+    python standin_server.py                    # Port 8001
+    python standin_server.py --no-responses     # Behave like a server without the Responses API
+    OPENAI_BASE_URL=http://localhost:8001/v1 OPENAI_API_KEY=x python main.py --conversation-state
+"""
+
+import argparse
+import http.server
+import itertools
+import json
+import threading
+import time
+
+PORT = 8001
+
+# One JSON body that satisfies both the skill selector and the moderator
+CANNED_JSON = {
+    "should_ask": False,
+    "question": None,
+    "reasoning": "Stand-in server - no real reasoning here.",
+    "task_skill": "critique",
+    "persona_skills": ["skeptical-vc", "early-adopter", "budget-conscious"],
+    "dynamic_personas": [],
+}
+
+
+class StandInState:
+    """Everything the server remembers: stored responses and counters."""
+
+    def __init__(self, latency: float, responses_api: bool):
+        self.latency = latency
+        self.responses_api = responses_api
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.threads = {}  # response id -> full message list so far
+        self.stats = {"requests": 0, "bytes_received": 0, "by_path": {}}
+
+    def record(self, path: str, size: int):
+        with self.lock:
+            self.stats["requests"] += 1
+            self.stats["bytes_received"] += size
+            entry = self.stats["by_path"].setdefault(path, {"requests": 0, "bytes": 0})
+            entry["requests"] += 1
+            entry["bytes"] += size
+
+
+def estimate_usage(messages: list[dict], text: str) -> tuple[int, int]:
+    """Rough token counts (~4 characters per token)."""
+    prompt = sum(len(str(m.get("content", ""))) for m in messages)
+    return prompt // 4, len(text) // 4
+
+
+def canned_reply(messages: list[dict], json_mode: bool, number: int) -> str:
+    if json_mode:
+        return json.dumps(CANNED_JSON)
+    last = next((m["content"] for m in reversed(messages) if m["role"] == "user"), "")
+    seen = sum(len(str(m["content"])) for m in messages)
+    return f"[stand-in #{number}] I've read {seen} characters. Last thing I saw: {str(last)[-60:]!r}"
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    state: StandInState = None
+
+    def log_message(self, format, *args):
+        pass  # We log our own one-line summary per request
+
+    def _send_json(self, status: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/stats"):
+            with self.state.lock:
+                self._send_json(200, self.state.stats)
+        else:
+            self._send_json(404, {"error": {"message": "Not found"}})
+
+    def do_POST(self):
+        raw = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.state.record(self.path, len(raw))
+        print(f"  POST {self.path} {len(raw):>7} bytes")
+        body = json.loads(raw or b"{}")
+
+        if self.state.latency:
+            time.sleep(self.state.latency)
+
+        if self.path.endswith("/chat/completions"):
+            self._chat_completions(body)
+        elif self.path.endswith("/responses") and self.state.responses_api:
+            self._responses(body)
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown endpoint {self.path}", "type": "invalid_request_error"}})
+
+    def _chat_completions(self, body: dict):
+        number = next(self.state.ids)
+        json_mode = (body.get("response_format") or {}).get("type") == "json_object"
+        text = canned_reply(body.get("messages", []), json_mode, number)
+
+        if not body.get("stream"):
+            self._send_json(200, {
+                "id": f"chatcmpl-{number}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model"),
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": text}}],
+                "usage": dict(zip(("prompt_tokens", "completion_tokens"), estimate_usage(body.get("messages", []), text))),
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        for piece in text.split(" "):
+            chunk = {
+                "id": f"chatcmpl-{number}",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": body.get("model"),
+                "choices": [{"index": 0, "delta": {"content": piece + " "}, "finish_reason": None}],
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+        self.wfile.write(b"data: [DONE]\n\n")
+
+    def _responses(self, body: dict):
+        previous = body.get("previous_response_id")
+        new_input = body.get("input", [])
+        if isinstance(new_input, str):
+            new_input = [{"role": "user", "content": new_input}]
+
+        with self.state.lock:
+            if previous and previous not in self.state.threads:
+                history = None
+            else:
+                history = list(self.state.threads.get(previous, []))
+
+        if history is None:
+            self._send_json(400, {"error": {
+                "message": f"Previous response with id '{previous}' not found.",
+                "type": "invalid_request_error",
+                "code": "previous_response_not_found",
+            }})
+            return
+
+        messages = history + new_input
+        number = next(self.state.ids)
+        text = canned_reply(messages, False, number)
+        response_id = f"resp_{number}"
+
+        with self.state.lock:
+            self.state.threads[response_id] = messages + [{"role": "assistant", "content": text}]
+
+        self._send_json(200, {
+            "id": response_id,
+            "object": "response",
+            "created_at": int(time.time()),
+            "model": body.get("model"),
+            "status": "completed",
+            "output": [{
+                "id": f"msg_{number}",
+                "type": "message",
+                "role": "assistant",
+                "status": "completed",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }],
+            "usage": dict(zip(("input_tokens", "output_tokens"), estimate_usage(messages, text))),
+        })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in OpenAI server for Hot Seat")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to wait before each reply")
+    parser.add_argument("--no-responses", action="store_true", help="Answer /v1/responses with 404")
+    args = parser.parse_args()
+
+    Handler.state = StandInState(latency=args.latency, responses_api=not args.no_responses)
+
+    with http.server.ThreadingHTTPServer(("", args.port), Handler) as httpd:
+        print(f"""
+  Stand-in OpenAI server running at: http://localhost:{args.port}/v1
+  Responses API: {'off' if args.no_responses else 'on'}
+
+  OPENAI_BASE_URL=http://localhost:{args.port}/v1 OPENAI_API_KEY=x python main.py
+
+  Press Ctrl+C to stop the server.
+""")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\n\n  Server stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import backends  # noqa: E402
+import config  # noqa: E402
+
+
+@pytest.fixture
+def scripted(monkeypatch, tmp_path):
+    """Offline sessions: the scripted backend, fresh backends, caches under tmp_path."""
+    monkeypatch.setattr(config, "LLM_BACKEND", "scripted")
+    monkeypatch.setattr(config, "ROLE_BACKENDS", {})
+    monkeypatch.setattr(config, "SKILLS_DIR", str(ROOT / "skills"))
+    monkeypatch.setattr(config, "CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(config, "DEDUP_MODE", "off")
+    monkeypatch.setattr(backends, "_backends", {})
+    return config
@@ -0,0 +1,94 @@
+import time
+
+import pytest
+
+import config
+from budget import SessionBudget
+from scheduler import Session
+
+
+def token_budget(spent: int) -> SessionBudget:
+    """10000 tokens: 1750 held back for a short summary, 8250 to spend on rounds."""
+    budget = SessionBudget(Session("test"), tokens=10000)
+    budget.session.charge(spent, 0)
+    return budget
+
+
+@pytest.mark.parametrize("spent, mode", [
+    (3300, "normal"),  # 60% left
+    (4540, "low-effort"),  # 45%
+    (5780, "compact"),  # 30%
+    (7430, "no-moderator"),  # 10%
+])
+def test_rounds_get_cheaper_as_the_tokens_run_down(spent, mode):
+    budget = token_budget(spent)
+    plan = budget.plan_round(1, 0)
+
+    assert plan.mode == mode
+    assert plan.compact == (mode in ("compact", "no-moderator"))
+    assert plan.skip_moderator == (mode == "no-moderator")
+    assert (plan.reasoning_effort is None) == (mode == "normal")
+
+
+def test_remaining_is_measured_after_the_summary_reserve():
+    assert token_budget(0).remaining(0) == 1.0
+    assert token_budget(4125).remaining(0) == pytest.approx(0.5)
+    assert token_budget(9000).remaining(0) == 0.0
+
+
+def test_stops_when_another_round_would_eat_the_summary():
+    budget = token_budget(6000)
+    budget.record_round(1, "normal", 1.0, 3000)
+
+    plan = budget.plan_round(2, 0)
+
+    assert plan.stop
+    assert "tokens" in plan.reason
+    assert budget.adaptations == [f"round 2: stop ({plan.reason})"]
+
+
+def test_round_one_always_runs():
+    budget = token_budget(9500)  # Nothing left to spend
+
+    assert not budget.plan_round(1, 0).stop
+
+
+def test_time_reserve_follows_the_slowest_call():
+    budget = SessionBudget(Session("test"), seconds=100)
+    assert budget.reserve(0)[0] == config.BUDGET_SUMMARY_SECONDS  # Nothing measured yet
+
+    budget.record_call(2.0)
+    budget.record_call(4.0)
+    budget.record_call(3.0)
+
+    assert budget.reserve(0)[0] == 4.0
+
+
+def test_time_thresholds():
+    budget = SessionBudget(Session("test"), seconds=100)
+    budget.record_call(10.0)  # 90s to spend
+    budget.started = time.perf_counter() - 63  # 30% left
+
+    assert budget.plan_round(1, 0).mode == "compact"
+
+
+def test_a_tight_budget_still_gets_a_round():
+    budget = SessionBudget(Session("test"), seconds=3)
+
+    assert budget.reserve(0)[0] == 1.5  # Capped at half the budget
+    assert budget.remaining(0) > 0.9
+    assert budget.plan_round(1, 0).mode == "normal"
+    assert "3s" in budget.shortfall()
+
+
+def test_token_reserve_is_capped_too():
+    budget = SessionBudget(Session("test"), tokens=2000)
+
+    assert budget.reserve(0)[1] == 1000
+    assert budget.plan_round(1, 0).mode == "normal"
+    assert budget.shortfall()
+
+
+def test_no_shortfall_for_a_roomy_budget():
+    assert SessionBudget(Session("test"), seconds=90, tokens=30000).shortfall() is None
+    assert SessionBudget(Session("test")).shortfall() is None
@@ -0,0 +1,50 @@
+import threading
+
+import llm
+import scheduler
+
+SYSTEM = "You are a skeptical VC."
+MESSAGE = "Pet translator collar, $9/month."
+
+
+def _run_together(call, count: int = 3) -> list[scheduler.Session]:
+    """Run call() at the same time in `count` sessions; return them."""
+    sessions = [scheduler.Session(f"s{i}") for i in range(count)]
+    barrier = threading.Barrier(count)
+    results = []
+
+    def run(session):
+        with scheduler.session_scope(session):
+            barrier.wait()
+            results.append(call())
+
+    threads = [threading.Thread(target=run, args=(session,)) for session in sessions]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(results)) == 1  # Everyone got the same reply
+    return sessions
+
+
+def _check_shared(sessions, backend_calls):
+    assert backend_calls == 1
+    usages = [session.usage for session in sessions]
+    assert sum(usage["coalesced"] for usage in usages) == len(sessions) - 1
+    assert all(usage["calls"] == 1 for usage in usages)
+    assert len({(usage["prompt_tokens"], usage["completion_tokens"]) for usage in usages}) == 1
+    assert usages[0]["prompt_tokens"] > 0
+
+
+def test_joined_calls_are_charged_to_every_session(scripted, monkeypatch):
+    monkeypatch.setattr(scripted, "COALESCE_REQUESTS", True)
+    monkeypatch.setattr(scripted, "SCRIPTED_LATENCY", 0.2)
+    sessions = _run_together(lambda: llm.chat(SYSTEM, MESSAGE))
+    _check_shared(sessions, llm.get_backend().usage()["calls"])
+
+
+def test_joined_streams_are_charged_to_every_session(scripted, monkeypatch):
+    monkeypatch.setattr(scripted, "COALESCE_REQUESTS", True)
+    monkeypatch.setattr(scripted, "SCRIPTED_LATENCY", 0.2)
+    sessions = _run_together(lambda: "".join(llm.stream(SYSTEM, MESSAGE)))
+    _check_shared(sessions, llm.get_backend().usage()["calls"])
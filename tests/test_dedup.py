@@ -0,0 +1,59 @@
+import pytest
+
+import config
+import dedup
+
+IDEA = ("Pet translator collar for busy parents, paid monthly, launched first in big cities "
+        "with a free trial and a referral program")
+REWORDED = ("Pet translator collar for busy parents - paid monthly, launched first in large cities "
+            "with a free trial and a referral program.")
+OTHER = ("Shared EV charger booking for small landlords, paid monthly, launched first in big cities "
+         "with a free trial and a referral program")
+
+
+@pytest.fixture
+def index(tmp_path):
+    return dedup.IdeaIndex(str(tmp_path / "ideas.db"))
+
+
+def _add(index, idea, task, label):
+    return index.add(idea, task, {"personas": [], "reasoning": label}, {"summary": label}, 1000, 100)
+
+
+def test_similarity_estimates_jaccard():
+    a, b = dedup.shingles(IDEA), dedup.shingles(REWORDED)
+    jaccard = len(a & b) / len(a | b)
+    estimate = dedup.similarity(dedup.fingerprint(IDEA), dedup.fingerprint(REWORDED))
+    assert abs(estimate - jaccard) < 0.15  # 128 permutations: standard error ~0.04
+    assert dedup.similarity(dedup.fingerprint(IDEA), dedup.fingerprint(IDEA)) == 1.0
+
+
+def test_case_and_punctuation_do_not_matter():
+    assert dedup.fingerprint(IDEA) == dedup.fingerprint(IDEA.upper().replace(",", " ;"))
+
+
+def test_near_duplicates_are_found_and_others_are_not(index):
+    _add(index, IDEA, "critique", "original")
+    match = index.find(REWORDED, "critique")
+    assert match is not None and match.similarity >= config.DEDUP_THRESHOLD
+    assert match.chat == {"summary": "original"}
+    assert index.find(OTHER, "critique") is None  # Shares the tagline, not the product
+
+
+def test_threshold_is_respected(index, monkeypatch):
+    _add(index, IDEA, "critique", "original")
+    score = dedup.similarity(dedup.fingerprint(IDEA), dedup.fingerprint(REWORDED))
+    monkeypatch.setattr(config, "DEDUP_THRESHOLD", min(score + 0.01, 1.0))
+    assert index.find(REWORDED, "critique") is None
+
+
+def test_same_task_wins_over_higher_similarity(index):
+    _add(index, IDEA, "brainstorm", "exact, other task")
+    _add(index, REWORDED, "critique", "reworded, same task")
+    match = index.find(IDEA, "critique")
+    assert (match.task, match.chat["summary"]) == ("critique", "reworded, same task")
+    assert index.find(IDEA).similarity == 1.0  # Without a task, the closest wins
+
+
+def test_empty_index(index):
+    assert index.find(IDEA, "critique") is None
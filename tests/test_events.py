@@ -0,0 +1,48 @@
+import time
+
+import pytest
+
+import events
+from orchestrator import Orchestrator
+
+
+class SlowSink(events.Sink):
+    """Records notices, slowly - like a terminal that lags behind."""
+
+    def __init__(self):
+        self.seen = []
+
+    def handle(self, event):
+        time.sleep(0.05)
+        if isinstance(event, events.Notice):
+            self.seen.append(event.text)
+
+
+def test_multiline_prompt_is_shown_before_reading(scripted, monkeypatch):
+    sink = SlowSink()
+    agent = Orchestrator(skills={}, bus=events.EventBus([sink]))
+    lines = iter(['"""', "first line", "second line", '"""'])
+    shown_before_reading = []
+
+    def founder(prompt=""):
+        shown_before_reading.append(any("Multi-line mode" in text for text in sink.seen))
+        return next(lines)
+
+    monkeypatch.setattr("builtins.input", founder)
+    assert agent._get_founder_input() == "first line\nsecond line"
+    assert shown_before_reading[1:] == [True, True, True]
+
+
+def test_jsonl_sink_leaves_tokens_out_by_default(tmp_path):
+    sink = events.JsonlSink(str(tmp_path / "events.jsonl"))
+    assert not events.EventBus([sink]).wants_tokens  # So persona calls stay hedged
+    sink.close()
+
+
+def test_sink_without_handle_cant_be_constructed():
+    class Forgetful(events.Sink):
+        def close(self):
+            pass
+
+    with pytest.raises(TypeError):
+        Forgetful()
@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+import config
+import llm
+import scheduler
+from backends import ScriptedBackend
+from metrics import percentile
+
+
+@pytest.fixture
+def stats(monkeypatch):
+    """Fresh process-wide hedging stats."""
+    fresh = llm._HedgeStats()
+    monkeypatch.setattr(llm, "_hedge_stats", fresh)
+    return fresh
+
+
+def test_default_delay_until_enough_samples(stats):
+    for n in range(config.HEDGE_MIN_SAMPLES - 1):
+        stats.record_first_token(0.1 + n / 100, hedged=False)
+    assert stats.threshold() == config.HEDGE_DEFAULT_DELAY
+
+    stats.record_first_token(0.5, hedged=False)
+    assert stats.threshold() == percentile(list(stats.first_token_times), 95)
+    assert stats.threshold() < 0.5
+
+
+def test_threshold_is_the_p95_of_first_tokens(stats):
+    for seconds in range(1, 101):
+        stats.record_first_token(seconds / 100, hedged=False)
+
+    assert stats.threshold() == pytest.approx(0.9505)
+
+
+def test_hedges_stay_within_the_budget(stats):
+    for _ in range(9):
+        stats.record_call()
+    assert not stats.try_spend_hedge()  # 1 extra in 9 calls is over 10%
+
+    stats.record_call()
+    assert stats.try_spend_hedge()
+    assert not stats.try_spend_hedge()
+
+    for _ in range(10):
+        stats.record_call()
+    assert stats.try_spend_hedge()
+    assert stats.hedges == 2
+
+
+def test_streamed_call_is_hedged_and_the_loser_closed(stats, monkeypatch):
+    monkeypatch.setattr(config, "HEDGE_REQUESTS", True)
+    monkeypatch.setattr(config, "HEDGE_BUDGET", 1.0)
+    monkeypatch.setattr(config, "HEDGE_DEFAULT_DELAY", 0.05)
+
+    backend = ScriptedBackend(latency=1.0)
+    delays = iter([5.0, 0.01])  # The primary stalls; the hedge answers at once
+    monkeypatch.setattr(backend, "_delay", lambda *args: next(delays))
+    opened = []
+    open_stream = backend.stream
+    monkeypatch.setattr(backend, "stream", lambda *args, **kwargs: opened.append(open_stream(*args, **kwargs))
+                        or opened[-1])
+    monkeypatch.setattr(llm, "get_backend", lambda role=None: backend)
+
+    started = time.monotonic()
+    with scheduler.session_scope(scheduler.Session("hedged")):
+        text = "".join(llm.stream("You are a persona.", "Round 1", role="persona"))
+
+    assert time.monotonic() - started < 1.0
+    assert text == backend._reply("You are a persona.", "Round 1", False)
+    assert len(opened) == 2
+    assert opened[0]._closed and not opened[1]._closed
+    assert (stats.calls, stats.hedges, stats.hedge_wins) == (1, 1, 1)
+
+
+def test_closing_a_hedged_stream_closes_every_attempt(stats, monkeypatch):
+    monkeypatch.setattr(config, "HEDGE_BUDGET", 1.0)
+    monkeypatch.setattr(config, "HEDGE_DEFAULT_DELAY", 0.01)
+
+    backend = ScriptedBackend(latency=1.0)
+    monkeypatch.setattr(backend, "_delay", lambda *args: 5.0)  # Neither attempt answers
+    opened = []
+    open_stream = backend.stream
+    monkeypatch.setattr(backend, "stream", lambda *args, **kwargs: opened.append(open_stream(*args, **kwargs))
+                        or opened[-1])
+
+    stream = llm._hedged_stream(backend, "You are a persona.", "Round 1")
+    received = []
+    reader = threading.Thread(target=lambda: received.extend(stream))
+    reader.start()
+    while len(opened) < 2:  # The hedge has been sent
+        time.sleep(0.001)
+    stream.close()
+    reader.join(timeout=1.0)
+
+    assert not reader.is_alive() and received == []
+    assert all(attempt._closed for attempt in opened)
@@ -0,0 +1,74 @@
+import time
+
+import pytest
+
+import config
+from jobqueue import DONE, FAILED, QUEUED, RUNNING, JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "JOB_MAX_ATTEMPTS", 2)
+    return JobQueue(str(tmp_path / "jobs.db"))
+
+
+def _status(queue: JobQueue, job_id: int) -> str:
+    return next(job["status"] for job in queue.status()["jobs"] if job["id"] == job_id)
+
+
+def test_claims_are_exclusive_and_in_order(queue):
+    first, second = queue.enqueue([("pets", "idea one", "critique"), ("pets", "idea two", "find-pmf")])
+    assert queue.claim("a", 60).id == first
+    assert queue.claim("b", 60).id == second
+    assert queue.claim("c", 60) is None
+
+
+def test_expired_lease_is_taken_over(queue):
+    [job_id] = queue.enqueue([("pets", "idea", "critique")])
+    job = queue.claim("a", 0.05)
+    assert queue.claim("b", 60) is None  # Still leased
+    time.sleep(0.1)
+    assert queue.status()["counts"]["expired"] == 1
+
+    retry = queue.claim("b", 60)
+    assert (retry.id, retry.attempts) == (job_id, 2)
+    assert not queue.renew(job.id, "a", 60)  # The old worker learns it lost the job
+    assert not queue.complete(job.id, "a", "stale.json")  # ...and can't overwrite the result
+    assert queue.complete(retry.id, "b", "fresh.json")
+    assert _status(queue, job_id) == DONE
+    assert queue.status()["jobs"][0]["result_path"] == "fresh.json"
+
+
+def test_renewed_lease_is_kept(queue):
+    queue.enqueue([("pets", "idea", "critique")])
+    job = queue.claim("a", 0.2)
+    time.sleep(0.1)
+    assert queue.renew(job.id, "a", 0.2)
+    time.sleep(0.15)
+    assert queue.claim("b", 60) is None  # Past the first lease, inside the renewed one
+
+
+def test_jobs_fail_after_their_attempts(queue):
+    [job_id] = queue.enqueue([("pets", "idea", "critique")])
+    job = queue.claim("a", 60)
+    queue.fail(job.id, "a", "RuntimeError: boom")
+    assert _status(queue, job_id) == QUEUED  # One attempt left
+
+    job = queue.claim("b", 60)
+    assert job.attempts == 2
+    queue.fail(job.id, "b", "RuntimeError: boom again")
+    assert _status(queue, job_id) == FAILED
+    assert queue.claim("c", 60) is None
+
+
+def test_expired_lease_on_the_last_attempt_fails_the_job(queue):
+    [job_id] = queue.enqueue([("pets", "idea", "critique")])
+    queue.claim("a", 0.01)
+    time.sleep(0.05)
+    queue.claim("b", 0.01)
+    assert _status(queue, job_id) == RUNNING
+    time.sleep(0.05)
+    assert queue.claim("c", 60) is None
+    job = queue.status()["jobs"][0]
+    assert job["status"] == FAILED
+    assert "lease expired on b" in job["error"]
@@ -0,0 +1,61 @@
+import json
+
+from jsonstream import JsonFieldParser
+
+REPLY = '{"should_ask": true, "question": "Who pays \\"today\\"?", "score": 12.5, ' \
+        '"tags": ["a", {"b": 1}], "reasoning": "long"}'
+
+
+def _fields_after_each_char(text: str) -> list[dict]:
+    parser = JsonFieldParser()
+    snapshots = []
+    for char in text:
+        parser.feed(char)
+        snapshots.append(dict(parser.fields))
+    return snapshots
+
+
+def test_fields_match_json_loads_when_fed_one_character_at_a_time():
+    parser = JsonFieldParser()
+    for char in REPLY:
+        parser.feed(char)
+    assert parser.done and not parser.failed
+    assert parser.fields == json.loads(REPLY)
+
+
+def test_a_field_appears_only_once_its_value_is_complete():
+    snapshots = _fields_after_each_char(REPLY)
+    question_end = REPLY.index('?"') + 1
+    assert "question" not in snapshots[question_end - 1]
+    assert snapshots[question_end]["question"] == 'Who pays "today"?'
+    # Every snapshot is a prefix of the final fields, with final values
+    final = json.loads(REPLY)
+    for snapshot in snapshots:
+        assert all(final[key] == value for key, value in snapshot.items())
+
+
+def test_numbers_wait_for_the_next_character():
+    parser = JsonFieldParser()
+    parser.feed('{"score": 1')
+    assert "score" not in parser.fields
+    parser.feed("2")
+    assert "score" not in parser.fields  # "12" may become "125"
+    parser.feed("e1")
+    assert "score" not in parser.fields
+    parser.feed(", ")
+    assert parser.fields["score"] == 120.0
+
+
+def test_booleans_and_whitespace():
+    parser = JsonFieldParser()
+    parser.feed('  {\n  "should_ask" :\tfalse')
+    assert parser.fields == {"should_ask": False}
+    parser.feed("\n}")
+    assert parser.done
+
+
+def test_non_object_replies_fail():
+    for text in ("[1, 2]", 'Sure! {"a": 1}', '{"a": 1 "b": 2}', '{, "a": 1}', '{"a": 1,}', "{a: 1}"):
+        parser = JsonFieldParser()
+        parser.feed(text)
+        assert parser.failed and not parser.done, text
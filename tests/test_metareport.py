@@ -0,0 +1,54 @@
+import json
+
+import llm
+import metareport
+
+
+def _save(path, idea):
+    path.write_text(json.dumps({"product_idea": idea, "task_type": "critique", "summary": "ok",
+                                "discussion": [{"persona": "skeptical-vc", "round": 1, "message": idea}]}))
+
+
+def test_unusable_replies_are_retried_and_failures_reported(scripted, monkeypatch, tmp_path):
+    sessions = tmp_path / "chats"
+    sessions.mkdir()
+    for name in ("good", "garbled", "broken"):
+        _save(sessions / f"{name}.json", f"{name} idea")
+
+    replies = {"good": '{"verdict": "promising", "score": 6}', "garbled": "not json"}
+    calls = []
+
+    def chat_json(system_prompt, user_message, role=None):
+        if "Product idea:" not in user_message:
+            return json.dumps({"themes": []})  # Reduce calls
+        name = user_message.split("Product idea: ")[1].split(" ")[0]
+        calls.append(name)
+        if name == "broken":
+            raise RuntimeError("upstream timed out")
+        return replies[name]
+
+    monkeypatch.setattr(llm, "chat_json", chat_json)
+
+    report = metareport.build_meta_report([str(sessions)])
+    assert report["stats"]["sessions"] == 2
+    assert report["stats"]["failed"] == 1
+    assert [entry["source"] for entry in report["failed"]] == [str(sessions / "broken.json")]
+    assert "Sessions Not Included" in metareport._format_markdown(report)
+
+    calls.clear()
+    report = metareport.build_meta_report([str(sessions)])
+    assert sorted(calls) == ["broken", "garbled"]  # Only the good one came from the cache
+    assert report["stats"]["cached"] == 1
+
+
+def test_ranking_is_by_verdict_then_score():
+    entries = [
+        {"verdict": "mixed", "score": 9.0},
+        {"verdict": "strong", "score": 6.0},
+        {"verdict": "unknown", "score": 10.0},
+        {"verdict": "strong", "score": 8.0},
+        {"verdict": "no-go", "score": 2.0},
+    ]
+    ranked = sorted(entries, key=metareport._rank_key)
+    assert [(e["verdict"], e["score"]) for e in ranked] == [
+        ("strong", 8.0), ("strong", 6.0), ("mixed", 9.0), ("no-go", 2.0), ("unknown", 10.0)]
@@ -0,0 +1,65 @@
+import threading
+import time
+
+import pytest
+
+import config
+import scheduler
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """A one-slot scheduler, and a helper that queues named calls behind a held slot."""
+    monkeypatch.setattr(config, "MAX_CONCURRENT_CALLS", 1)
+    slots = scheduler.CallScheduler()
+    order = []
+    threads = []
+
+    def queue_call(name: str, session: scheduler.Session):
+        def run():
+            with scheduler.session_scope(session), slots.slot():
+                order.append(name)
+
+        waiting = slots.stats()["waiting"]
+        thread = threading.Thread(target=run)
+        thread.start()
+        threads.append(thread)
+        while slots.stats()["waiting"] == waiting:  # Queued, in this order
+            time.sleep(0.001)
+
+    held = slots.acquire()
+
+    def release_and_join() -> list[str]:
+        slots.release(held)
+        for thread in threads:
+            thread.join(timeout=5)
+        return order
+
+    return queue_call, release_and_join
+
+
+def test_interactive_first_then_sessions_take_turns(calls, monkeypatch):
+    monkeypatch.setattr(config, "BATCH_MAX_WAIT", 60)
+    queue_call, release_and_join = calls
+    batch = scheduler.Session("matrix", scheduler.BATCH)
+    busy = scheduler.Session("busy")
+    founder = scheduler.Session("founder")
+
+    queue_call("batch-1", batch)
+    queue_call("busy-1", busy)
+    queue_call("busy-2", busy)
+    queue_call("busy-3", busy)
+    queue_call("founder-1", founder)
+    queue_call("batch-2", batch)
+
+    assert release_and_join() == ["busy-1", "founder-1", "busy-2", "busy-3", "batch-1", "batch-2"]
+
+
+def test_batch_calls_that_waited_too_long_go_next(calls, monkeypatch):
+    monkeypatch.setattr(config, "BATCH_MAX_WAIT", 0.05)
+    queue_call, release_and_join = calls
+    queue_call("batch-1", scheduler.Session("matrix", scheduler.BATCH))
+    queue_call("founder-1", scheduler.Session("founder"))
+    time.sleep(0.1)
+
+    assert release_and_join() == ["batch-1", "founder-1"]
@@ -0,0 +1,46 @@
+from skill_loader import strip_markdown
+
+SKILL = """# Skeptical VC
+
+## How You Think
+
+- **First question:** "Why will this fail?"
+> "I've seen this pitch a hundred times."
+
+For example: "Who pays, and why now?"
+
+```
+scratch notes
+```
+"""
+
+
+def test_strip_keeps_instructions_examples_and_quotes():
+    assert strip_markdown(SKILL).splitlines() == [
+        "How You Think:",
+        '- First question: "Why will this fail?"',
+        '"I\'ve seen this pitch a hundred times."',
+        'For example: "Who pays, and why now?"',
+    ]
+
+
+
+def test_each_mode_keeps_its_own_condensed_form(monkeypatch, tmp_path):
+    """Skills are shared between sessions, so a strip session mustn't get an llm condensation."""
+    import config
+    import llm
+    from orchestrator import Orchestrator
+    from skill_loader import Skill, condense_skill
+
+    monkeypatch.setattr(llm, "chat", lambda *args, **kwargs: "Ask why it will fail.")
+    skill = Skill("skeptical-vc", "", SKILL, str(tmp_path / "skeptical-vc.md"))
+    stripped = strip_markdown(SKILL)
+
+    assert condense_skill(skill, "strip") == stripped
+    assert condense_skill(skill, "llm") == "Ask why it will fail."
+    assert condense_skill(skill, "strip") == stripped
+
+    for mode, text in [("strip", stripped), ("llm", "Ask why it will fail."), ("off", SKILL)]:
+        monkeypatch.setattr(config, "SKILL_CONDENSE", mode)
+        assert Orchestrator._skill_text(skill, 2) == text
+        assert Orchestrator._skill_text(skill, 1) == SKILL
@@ -0,0 +1,121 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import events
+import llm
+from budget import RoundPlan
+from orchestrator import Orchestrator
+from skill_loader import load_all_skills
+from transcript import Transcript, Turn
+
+ANSWER = "We already have forty paying pilot customers."
+
+
+def test_summary_reads_founder_answer_after_running_ahead(scripted, monkeypatch):
+    monkeypatch.setattr(scripted, "SCRIPTED_LATENCY", 0.05)
+    monkeypatch.setattr(scripted, "STAGGER_TURNS", 1)
+    monkeypatch.setattr(scripted, "MAX_TOTAL_ROUNDS", 4)
+    monkeypatch.setattr(scripted, "MAX_SILENT_ROUNDS", 4)
+    monkeypatch.setattr(scripted, "THINK_TIME_PRECOMPUTE", True)
+
+    answers = iter([ANSWER])
+
+    def founder(prompt=""):
+        answer = next(answers, "")
+        if answer:
+            time.sleep(0.5)  # Long enough for the running summary and the next round to finish
+        return answer  # Later checkpoints return at once, so their notes are cancelled
+
+    monkeypatch.setattr("builtins.input", founder)
+
+    summary_prompts = []
+    chat = llm.chat
+
+    def recording_chat(system_prompt, user_message, **kwargs):
+        if kwargs.get("role") == "summary":
+            summary_prompts.append(user_message)
+        return chat(system_prompt, user_message, **kwargs)
+
+    monkeypatch.setattr(llm, "chat", recording_chat)
+
+    agent = Orchestrator(interactive=True, skills=load_all_skills(verbose=False), bus=events.NULL_BUS)
+    agent.run("AI pet translator for dogs and cats", "critique")
+
+    assert agent.running_summary is not None  # The final summary started from the notes
+    covered = agent.running_summary[0]
+    assert covered < len(agent.plenary)
+    turns_since = agent.plenary.summary_since(covered)
+    assert ANSWER in turns_since
+    assert summary_prompts[-1].count(ANSWER) == 1
+    assert summary_prompts[-1].count(turns_since) == 1
+
+    # The saved chat still reads round by round
+    rounds = [turn["round"] for turn in agent.last_chat["discussion"]]
+    assert rounds == sorted(rounds)
+
+
+def test_compaction_follows_each_turns_own_round_plan(scripted, monkeypatch):
+    monkeypatch.setattr(scripted, "BUDGET_COMPACT_TURNS", 2)
+    monkeypatch.setattr(scripted, "SCRIPTED_LATENCY", 0.05)
+    messages = []
+    chat = llm.chat
+
+    def recording_chat(system_prompt, user_message, **kwargs):
+        messages.append(user_message)
+        return chat(system_prompt, user_message, **kwargs)
+
+    monkeypatch.setattr(llm, "chat", recording_chat)
+
+    skills = load_all_skills(verbose=False)
+    agent = Orchestrator(skills=skills, quiet=True)
+    discussion = Transcript([Turn(f"persona-{i}", 1, f"point {i}") for i in range(6)])
+    # Rounds 2 (normal) and 3 (compact) overlap, as they do when staggered
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        normal = pool.submit(agent._staggered_turn, RoundPlan(), "idea", None, skills["skeptical-vc"],
+                             discussion, 2)
+        compact = pool.submit(agent._staggered_turn, RoundPlan("compact", compact=True), "idea", None,
+                              skills["early-adopter"], discussion, 3)
+        normal.result(), compact.result()
+
+    full = [text for text in messages if "Previous discussion:" in text]
+    recent = [text for text in messages if "Recent discussion" in text]
+    assert len(full) == 1 and "point 0" in full[0]
+    assert len(recent) == 1 and "point 0" not in recent[0] and "point 5" in recent[0]
+
+
+def test_founder_answer_lands_before_the_next_round(scripted, monkeypatch):
+    monkeypatch.setattr(scripted, "SCRIPTED_LATENCY", 0.05)
+    monkeypatch.setattr(scripted, "STAGGER_TURNS", 1)
+    monkeypatch.setattr(scripted, "MAX_TOTAL_ROUNDS", 3)
+    monkeypatch.setattr(scripted, "MAX_SILENT_ROUNDS", 4)
+    answers = iter([ANSWER])
+    agent = Orchestrator(interactive=True, skills=load_all_skills(verbose=False), bus=events.NULL_BUS)
+
+    turns = {"started": 0, "finished": 0}
+    staggered_turn = agent._staggered_turn
+
+    def counted_turn(*args, **kwargs):
+        turns["started"] += 1
+        try:
+            return staggered_turn(*args, **kwargs)
+        finally:
+            turns["finished"] += 1
+
+    monkeypatch.setattr(agent, "_staggered_turn", counted_turn)
+    at_prompt = []
+
+    def founder(prompt=""):
+        time.sleep(0.3)  # Anything allowed to run ahead would start meanwhile
+        at_prompt.append(dict(turns))
+        return next(answers, "")
+
+    monkeypatch.setattr("builtins.input", founder)
+    agent.run("AI pet translator for dogs and cats", "critique")
+
+    order = [(turn.persona, turn.round) for turn in agent.plenary]
+    founder_at = order.index(("FOUNDER", 1))
+    assert all(round_num == 1 for _, round_num in order[:founder_at])
+    assert all(round_num == 2 for _, round_num in order[founder_at + 1:founder_at + 4])
+    # Nothing ran while the founder was at the prompt
+    assert at_prompt and all(counts["started"] == counts["finished"] for counts in at_prompt)
+    assert at_prompt[0]["started"] == 3  # Round 1 only
@@ -0,0 +1,50 @@
+import time
+
+import llm
+import scheduler
+from backends import ScriptedBackend
+
+SYSTEM = "You are a moderator."
+MESSAGE = "Should we ask the founder?"
+
+
+def test_closed_stream_is_charged_for_what_was_sent():
+    backend = ScriptedBackend()
+    session = scheduler.Session("early-close")
+    with scheduler.session_scope(session):
+        stream = backend.stream(SYSTEM, MESSAGE, json_mode=True)
+        first = next(iter(stream))
+        stream.close()
+
+    assert session.usage["calls"] == 1
+    assert session.usage["prompt_tokens"] == len(SYSTEM + MESSAGE) // 4
+    assert session.usage["completion_tokens"] == len(first) // 4
+    assert backend.usage()["calls"] == 1
+
+
+def test_stream_closed_before_reading_is_charged_once():
+    backend = ScriptedBackend()
+    session = scheduler.Session("never-read")
+    with scheduler.session_scope(session):
+        stream = backend.stream(SYSTEM, MESSAGE)
+    stream.close()  # From outside the session's context, like a cancelled hedge
+    stream.close()
+
+    assert session.usage["calls"] == 1
+    assert session.usage["completion_tokens"] == 0
+
+
+def test_moderator_early_decision_is_charged(scripted, monkeypatch):
+    monkeypatch.setattr(scripted, "COALESCE_REQUESTS", True)
+    session = scheduler.Session("moderator")
+    with scheduler.session_scope(session):
+        stream = llm.stream(SYSTEM, MESSAGE, role="moderator", json_mode=True)
+        for _ in stream:
+            break
+        stream.close()
+
+    deadline = time.monotonic() + 5
+    while session.usage["calls"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)  # The upstream stream is closed by the pump thread
+    assert session.usage["calls"] == 1
+    assert session.usage["prompt_tokens"] == len(SYSTEM + MESSAGE) // 4
@@ -0,0 +1,220 @@
+"""
+Tracing - Where did a session's time go?
+
+Spans mark the phases of a session (skill selection, persona generation,
+each persona turn, the moderator, the summary, saving) with start and end
+times and the thread they ran on, so concurrent work shows up side by side.
+
+Export formats:
+- Chrome trace JSON: open in https://ui.perfetto.dev or chrome://tracing
+- OTLP JSON (OpenTelemetry): for Jaeger, Tempo, Honeycomb, ...
+
+KEY CONCEPT: Tracing is off unless main.py is run with --trace. When off,
+span() returns one shared do-nothing object, so instrumented code pays for
+a function call and nothing else.
+
+Parent spans travel in a context variable, so work handed to a pool with
+scheduler.bind() still nests under the span that started it.
+"""
+
+import contextvars
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+_enabled = False
+_spans = []  # Finished spans, in the order they ended
+_ids = itertools.count(1)
+_current_span = contextvars.ContextVar("hotseat_span", default=None)
+_origin_ns = time.perf_counter_ns()  # Span times are relative to this...
+_origin_unix_ns = time.time_ns()  # ...which was this wall-clock time
+_trace_id = os.urandom(16).hex()
+
+
+class _Span:
+    """One timed operation. Use as a context manager."""
+
+    __slots__ = ("id", "parent", "name", "attrs", "start", "end", "thread_id", "thread_name", "_token")
+
+    def __init__(self, name: str, attrs: dict):
+        self.id = next(_ids)
+        self.name = name
+        self.attrs = attrs
+        self.parent = None
+        self.start = self.end = 0
+
+    def __enter__(self):
+        self.parent = _current_span.get()
+        self._token = _current_span.set(self.id)
+        thread = threading.current_thread()
+        self.thread_id = thread.ident
+        self.thread_name = thread.name
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end = time.perf_counter_ns()
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attrs["error"] = f"{exc_type.__name__}: {exc}"
+        _spans.append(self)
+        return False
+
+    def set(self, **attrs):
+        """Add attributes once they're known (e.g. the result size)."""
+        self.attrs.update(attrs)
+
+
+class _NoSpan:
+    """What span() returns when tracing is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def enable():
+    """Start recording spans."""
+    global _enabled
+    _enabled = True
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def span(name: str, **attrs):
+    """
+    Time a block:
+
+        with tracing.span("persona_turn", persona=name, round=3):
+            ...
+    """
+    if not _enabled:
+        return _NO_SPAN
+    return _Span(name, attrs)
+
+
+def traced(name: str):
+    """Decorator form of span() for a whole function."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(name, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def summary() -> dict:
+    """
+    Per span name: count, total seconds and peak concurrency (how many
+    overlapped at once - 1 means they ran strictly one after another).
+    """
+    by_name = {}
+    for s in list(_spans):
+        by_name.setdefault(s.name, []).append(s)
+
+    result = {}
+    for name, spans in by_name.items():
+        edges = sorted([(s.start, 1) for s in spans] + [(s.end, -1) for s in spans])
+        running = peak = 0
+        for _, step in edges:
+            running += step
+            peak = max(peak, running)
+        result[name] = {
+            "count": len(spans),
+            "seconds": sum(s.end - s.start for s in spans) / 1e9,
+            "peak_concurrency": peak,
+        }
+    return result
+
+
+def _attr_value(value):
+    return value if isinstance(value, (str, int, float, bool)) else str(value)
+
+
+def export_chrome(filepath: str) -> int:
+    """Write spans as Chrome trace JSON (complete events, one lane per thread). Returns the span count."""
+    spans = list(_spans)
+    events = []
+    for thread_id, thread_name in {(s.thread_id, s.thread_name) for s in spans}:
+        events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": thread_id,
+                       "args": {"name": thread_name}})
+    for s in spans:
+        events.append({
+            "name": s.name,
+            "cat": "hotseat",
+            "ph": "X",
+            "ts": (s.start - _origin_ns) / 1000,
+            "dur": (s.end - s.start) / 1000,
+            "pid": 1,
+            "tid": s.thread_id,
+            "args": {key: _attr_value(value) for key, value in s.attrs.items()},
+        })
+
+    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    with open(filepath, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return len(spans)
+
+
+def _otel_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def export_otel(filepath: str) -> int:
+    """Write spans as OTLP/JSON (an OpenTelemetry ExportTraceServiceRequest). Returns the span count."""
+    spans = list(_spans)
+
+    def unix_ns(ns: int) -> str:
+        return str(_origin_unix_ns + ns - _origin_ns)
+
+    otel_spans = []
+    for s in spans:
+        entry = {
+            "traceId": _trace_id,
+            "spanId": f"{s.id:016x}",
+            "name": s.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": unix_ns(s.start),
+            "endTimeUnixNano": unix_ns(s.end),
+            "attributes": [
+                {"key": key, "value": _otel_value(value)}
+                for key, value in {**s.attrs, "thread.name": s.thread_name}.items()
+            ],
+            "status": {"code": 2, "message": s.attrs["error"]} if "error" in s.attrs else {},
+        }
+        if s.parent is not None:
+            entry["parentSpanId"] = f"{s.parent:016x}"
+        otel_spans.append(entry)
+
+    request = {"resourceSpans": [{
+        "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": "hotseat"}}]},
+        "scopeSpans": [{"scope": {"name": "hotseat"}, "spans": otel_spans}],
+    }]}
+
+    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+    with open(filepath, "w") as f:
+        json.dump(request, f)
+    return len(spans)
@@ -0,0 +1,175 @@
+"""
+Transcript - The discussion history, rendered incrementally.
+
+Every persona call, moderator call and the summary need the discussion as
+text. Rebuilding that text from scratch on every call is O(turns²) work over
+a session, so the Transcript keeps each rendering cached and only formats
+the turns added since the last time it was asked.
+
+KEY CONCEPT: Turns are append-only. Once a turn has been rendered, its text
+never changes, so the cache only ever grows at the end.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+
+@dataclass(slots=True)
+class Turn:
+    """
+    One message in the discussion.
+
+    Attributes:
+        persona: Who spoke (a persona name, or "FOUNDER")
+        round: Which round it belongs to
+        message: What they said
+    """
+    persona: str
+    round: int
+    message: str
+
+    def to_dict(self) -> dict:
+        return {"persona": self.persona, "round": self.round, "message": self.message}
+
+
+class _Rendering:
+    """Cached text for one rendering style, extended as turns are added."""
+
+    __slots__ = ("format_turn", "separator", "text", "count", "last_round")
+
+    def __init__(self, format_turn: Callable[[Turn, int], str], separator: str = "\n"):
+        self.format_turn = format_turn  # (turn, previous_round) -> text
+        self.separator = separator
+        self.text = ""
+        self.count = 0  # How many turns are in self.text
+        self.last_round = 0
+
+
+def _history_line(turn: Turn, previous_round: int) -> str:
+    return f"- {turn.persona} (round {turn.round}): {turn.message}"
+
+
+def _short_line(turn: Turn, previous_round: int) -> str:
+    return f"- {turn.persona}: {turn.message}"
+
+
+def _markdown_block(turn: Turn, previous_round: int) -> str:
+    header = f"\n### Round {turn.round}\n\n" if turn.round != previous_round else ""
+    emoji = "👤" if turn.persona == "USER" else "🎭"
+    return f"{header}**{emoji} {turn.persona}:**\n{turn.message}\n"
+
+
+class Transcript:
+    """
+    Append-only discussion history with cached renderings.
+
+    - turns: every Turn, in order
+    - a per-round index, so a round's turns can be read without a scan
+    - one cached text per rendering style (history, short, markdown)
+    """
+
+    __slots__ = ("turns", "_rounds", "_renderings", "_lock")
+
+    def __init__(self, turns: list[Turn] | None = None):
+        self.turns: list[Turn] = []
+        self._rounds: dict[int, list[int]] = {}
+        self._renderings = {
+            "history": _Rendering(_history_line),
+            "short": _Rendering(_short_line),
+            "markdown": _Rendering(_markdown_block),
+        }
+        self._lock = threading.Lock()
+        for turn in turns or []:
+            self._add(turn)
+
+    @classmethod
+    def from_dicts(cls, entries: list[dict]) -> "Transcript":
+        """Rebuild a transcript from saved {persona, round, message} dicts."""
+        return cls([Turn(e["persona"], e["round"], e["message"]) for e in entries])
+
+    def append(self, persona: str, round_num: int, message: str) -> Turn:
+        turn = Turn(persona, round_num, message)
+        self._add(turn)
+        return turn
+
+    def extend(self, turns: list[Turn]):
+        for turn in turns:
+            self._add(turn)
+
+    def _add(self, turn: Turn):
+        with self._lock:
+            self._rounds.setdefault(turn.round, []).append(len(self.turns))
+            self.turns.append(turn)
+
+    def __len__(self) -> int:
+        return len(self.turns)
+
+    def __iter__(self) -> Iterator[Turn]:
+        return iter(self.turns)
+
+    def __getitem__(self, index):
+        return self.turns[index]
+
+    def round(self, round_num: int) -> list[Turn]:
+        """All turns from one round, in order."""
+        return [self.turns[i] for i in self._rounds.get(round_num, [])]
+
+    def in_round_order(self) -> "Transcript":
+        """
+        A copy sorted by round (stable, so each round keeps its order) - for
+        export and display. Staggered rounds append turns as they finish, so
+        indexes into the original (running summaries) don't apply to the copy.
+        """
+        return Transcript(sorted(self.turns, key=lambda turn: turn.round))
+
+    def to_dicts(self) -> list[dict]:
+        """Plain dicts, for JSON export."""
+        return [turn.to_dict() for turn in self.turns]
+
+    def _render(self, style: str) -> str:
+        """Bring one cached rendering up to date and return its text."""
+        with self._lock:
+            rendering = self._renderings[style]
+            if rendering.count < len(self.turns):
+                pieces = []
+                for turn in self.turns[rendering.count:]:
+                    pieces.append(rendering.format_turn(turn, rendering.last_round))
+                    rendering.last_round = turn.round
+                new_text = rendering.separator.join(pieces)
+                if rendering.text:
+                    rendering.text = rendering.text + rendering.separator + new_text
+                else:
+                    rendering.text = new_text
+                rendering.count = len(self.turns)
+            return rendering.text
+
+    def history_text(self) -> str:
+        """Every turn as "- persona (round N): message" - what personas read."""
+        return self._render("history")
+
+    def history_since(self, start: int, exclude: str | None = None) -> str:
+        """
+        Turns from index `start` on, in the history format, skipping `exclude`.
+
+        Used by persona threads, which only need what's new since they spoke.
+        """
+        return '\n'.join(
+            _history_line(turn, 0) for turn in self.turns[start:] if turn.persona != exclude
+        )
+
+    def summary_text(self) -> str:
+        """Every turn as "- persona: message" - what the summarizer reads."""
+        return self._render("short")
+
+    def summary_since(self, start: int) -> str:
+        """Turns from index `start` on, in the summary format."""
+        return '\n'.join(_short_line(turn, 0) for turn in self.turns[start:])
+
+    def recent_text(self, count: int) -> str:
+        """The last `count` turns as "- persona: message" - what the moderator reads."""
+        return '\n'.join(_short_line(turn, 0) for turn in self.turns[-count:])
+
+    def markdown_text(self) -> str:
+        """The discussion as markdown, with a heading per round."""
+        return self._render("markdown")
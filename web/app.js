@@ -18,7 +18,9 @@ const state = {
     currentRound: 0,
     silentRounds: 0,
     isRunning: false,
-    summary: null
+    summary: null,
+    sessionId: null,
+    lastSession: null  // Most recent saved session (from IndexedDB), for downloads after a reload
 };
 
 // Core advisors - mix of archetypes and famous figures
@@ -263,6 +265,8 @@ async function readStream(response, onStream) {
                 const delta = parsed.choices?.[0]?.delta;
 
                 if (delta) {
+                    if (perfRecorder.active) perfRecorder.capture(response, delta);
+
                     // Handle reasoning/thinking content
                     if (delta.reasoning_content) {
                         thinking += delta.reasoning_content;
@@ -283,6 +287,190 @@ async function readStream(response, onStream) {
     return { content, thinking: thinking || null };
 }
 
+// ============================================
+// LOCAL CACHE (IndexedDB)
+// ============================================
+// Advisor selections and generated advisor prompts are cached per
+// normalized idea + task + model, so re-running a tweaked idea skips
+// straight to the discussion. Finished sessions are kept too, so they can
+// still be downloaded after a reload. Both stores are size-bounded: the
+// least recently used entries are evicted first.
+const CACHE_DB_NAME = 'hotseat';
+const CACHE_LIMITS = { cache: 200, sessions: 50 };
+const NEAR_MATCH_THRESHOLD = 0.85; // Word overlap for a "tweaked" idea to reuse a cache entry
+
+let cacheDbPromise = null;
+
+function openCacheDb() {
+    if (cacheDbPromise) return cacheDbPromise;
+
+    cacheDbPromise = new Promise(resolve => {
+        if (!window.indexedDB) return resolve(null);
+
+        const request = indexedDB.open(CACHE_DB_NAME, 1);
+        request.onupgradeneeded = () => {
+            const db = request.result;
+            const cache = db.createObjectStore('cache', { keyPath: 'key' });
+            cache.createIndex('scope', 'scope');
+            cache.createIndex('lastUsed', 'lastUsed');
+            const sessions = db.createObjectStore('sessions', { keyPath: 'id' });
+            sessions.createIndex('lastUsed', 'lastUsed');
+        };
+        request.onsuccess = () => resolve(request.result);
+        // The cache is an optimization - without it we just call the API
+        request.onerror = () => resolve(null);
+        request.onblocked = () => resolve(null);
+    });
+    return cacheDbPromise;
+}
+
+function idbResult(request) {
+    return new Promise((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+function ideaWords(text) {
+    return text.toLowerCase().replace(/[^\p{L}\p{N}\s]/gu, ' ').split(/\s+/).filter(Boolean);
+}
+
+function normalizeIdea(text) {
+    return ideaWords(text).join(' ');
+}
+
+async function hashText(text) {
+    if (window.crypto?.subtle) {
+        const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(text));
+        return Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join('');
+    }
+    // FNV-1a fallback for insecure contexts (no crypto.subtle)
+    let hash = 0x811c9dc5;
+    for (let i = 0; i < text.length; i++) {
+        hash = Math.imul(hash ^ text.charCodeAt(i), 0x01000193) >>> 0;
+    }
+    return hash.toString(16);
+}
+
+function wordOverlap(a, b) {
+    const setA = new Set(a);
+    const setB = new Set(b);
+    let shared = 0;
+    for (const word of setA) if (setB.has(word)) shared++;
+    const union = setA.size + setB.size - shared;
+    return union ? shared / union : 0;
+}
+
+function cacheScope(kind, extra) {
+    return `${kind}|${state.taskType}|${state.model}|${extra}`;
+}
+
+async function cacheGet(kind, productIdea, extra = '') {
+    try {
+        const db = await openCacheDb();
+        if (!db) return null;
+
+        const scope = cacheScope(kind, extra);
+        const key = `${scope}|${await hashText(normalizeIdea(productIdea))}`;
+        const store = db.transaction('cache', 'readwrite').objectStore('cache');
+
+        let entry = await idbResult(store.get(key));
+
+        // No exact hit: reuse the closest cached idea if it's nearly the same
+        if (!entry) {
+            const words = ideaWords(productIdea);
+            const candidates = await idbResult(store.index('scope').getAll(scope));
+            let bestScore = NEAR_MATCH_THRESHOLD;
+            for (const candidate of candidates) {
+                const score = wordOverlap(words, candidate.words);
+                if (score >= bestScore) {
+                    bestScore = score;
+                    entry = candidate;
+                }
+            }
+        }
+
+        if (!entry) return null;
+        entry.lastUsed = Date.now();
+        store.put(entry);
+        return entry.value;
+    } catch (e) {
+        console.warn('Cache read failed:', e);
+        return null;
+    }
+}
+
+async function cachePut(kind, productIdea, value, extra = '') {
+    try {
+        const db = await openCacheDb();
+        if (!db) return;
+
+        const scope = cacheScope(kind, extra);
+        const key = `${scope}|${await hashText(normalizeIdea(productIdea))}`;
+        const store = db.transaction('cache', 'readwrite').objectStore('cache');
+        await idbResult(store.put({ key, scope, words: ideaWords(productIdea), value, lastUsed: Date.now() }));
+        await evictOldest(db, 'cache');
+    } catch (e) {
+        console.warn('Cache write failed:', e);
+    }
+}
+
+async function evictOldest(db, storeName) {
+    const store = db.transaction(storeName, 'readwrite').objectStore(storeName);
+    let excess = (await idbResult(store.count())) - CACHE_LIMITS[storeName];
+    if (excess <= 0) return;
+
+    const cursorRequest = store.index('lastUsed').openCursor();
+    cursorRequest.onsuccess = () => {
+        const cursor = cursorRequest.result;
+        if (!cursor || excess <= 0) return;
+        cursor.delete();
+        excess--;
+        cursor.continue();
+    };
+}
+
+function sessionSnapshot() {
+    return {
+        id: state.sessionId,
+        timestamp: new Date().toISOString(),
+        productIdea: state.productIdea,
+        taskType: state.taskType,
+        model: state.model,
+        advisors: state.advisors.map(a => a.name),
+        discussion: state.discussion,
+        summary: state.summary,
+        lastUsed: Date.now()
+    };
+}
+
+async function persistSession() {
+    try {
+        const db = await openCacheDb();
+        if (!db || !state.sessionId) return;
+
+        const store = db.transaction('sessions', 'readwrite').objectStore('sessions');
+        await idbResult(store.put(sessionSnapshot()));
+        await evictOldest(db, 'sessions');
+    } catch (e) {
+        console.warn('Session save failed:', e);
+    }
+}
+
+async function loadLatestSession() {
+    try {
+        const db = await openCacheDb();
+        if (!db) return null;
+
+        const index = db.transaction('sessions').objectStore('sessions').index('lastUsed');
+        const cursor = await idbResult(index.openCursor(null, 'prev'));
+        return cursor ? cursor.value : null;
+    } catch (e) {
+        console.warn('Session load failed:', e);
+        return null;
+    }
+}
+
 // ============================================
 // ADVISOR SELECTION
 // ============================================
@@ -314,14 +502,23 @@ Respond with JSON:
     ]
 }`;
 
+    const cached = await cacheGet('selection', productIdea);
+    if (cached) return { ...cached, _cached: true };
+
     const result = await callOpenAI(systemPrompt, `Product: ${productIdea}`, true);
-    return {
+    const selection = {
         ...JSON.parse(result.content),
         _thinking: result.thinking
     };
+    cachePut('selection', productIdea, selection);
+    return selection;
 }
 
 async function generateAdvisorPrompt(advisor, productIdea) {
+    const scope = `${advisor.name}|${advisor.role}`;
+    const cached = await cacheGet('advisor-prompt', productIdea, scope);
+    if (cached) return { ...cached, _cached: true };
+
     const systemPrompt = `Create a brief advisor persona (100-150 words) for a product feedback session.
 
 Include: identity, evaluation criteria, communication style.`;
@@ -331,10 +528,12 @@ Name: ${advisor.name}
 Role: ${advisor.role}
 Description: ${advisor.description}
 Product: ${productIdea}`);
-    return {
+    const generated = {
         prompt: result.content,
         thinking: result.thinking
     };
+    cachePut('advisor-prompt', productIdea, generated, scope);
+    return generated;
 }
 
 // ============================================
@@ -487,7 +686,8 @@ function addMessage(advisor, message, round, thinking = null) {
     const msgEl = createMessageElement(advisor, round);
     if (thinking) updateMessageThinking(msgEl, thinking);
     if (message) updateMessageContent(msgEl, message);
-    $('messages').scrollTop = $('messages').scrollHeight;
+    finishMessageStream(msgEl);
+    requestScroll();
     return msgEl;
 }
 
@@ -526,26 +726,167 @@ function createMessageElement(advisor, round) {
 }
 
 function updateMessageThinking(msgEl, thinking) {
-    const thinkingEl = msgEl.querySelector('.message-thinking');
-    const contentEl = thinkingEl.querySelector('.thinking-content');
-    thinkingEl.style.display = 'block';
-    contentEl.textContent = thinking;
-    msgEl.classList.add('has-thinking', 'streaming');
-    $('messages').scrollTop = $('messages').scrollHeight;
+    queueMessageUpdate(msgEl, 'thinking', thinking);
 }
 
 function updateMessageContent(msgEl, content) {
-    const responseEl = msgEl.querySelector('.message-response');
-    const textEl = responseEl.querySelector('.message-text');
-    responseEl.style.display = 'block';
-    textEl.innerHTML = renderMarkdown(content);
-    $('messages').scrollTop = $('messages').scrollHeight;
+    queueMessageUpdate(msgEl, 'content', content);
 }
 
 function finishMessageStream(msgEl) {
+    // Apply whatever is still queued so the final text is on screen
+    const pending = pendingUpdates.get(msgEl);
+    if (pending) {
+        pendingUpdates.delete(msgEl);
+        applyMessageUpdate(msgEl, pending);
+    }
+    finishMarkdownIncremental(msgEl.querySelector('.message-text'));
     msgEl.classList.remove('streaming');
 }
 
+// ============================================
+// STREAM RENDERING
+// ============================================
+// SSE chunks arrive much faster than the screen refreshes. Instead of
+// re-rendering a message on every chunk, we keep only the latest text per
+// message and apply it once per animation frame. Markdown is rendered block
+// by block: finished blocks (split on blank lines outside code fences) are
+// rendered once, and only the trailing, still-open block is re-rendered.
+// When the stream ends the whole message is rendered once more in one piece,
+// so the final markup is exactly what renderMarkdown gives for the full text.
+const streamRendering = {
+    batched: true,          // false = render every chunk immediately (old behavior)
+    scrollThrottleMs: 100,  // Minimum gap between auto-scrolls
+    renderMs: 0             // Time spent applying updates (read by the perf harness)
+};
+const pendingUpdates = new Map(); // msgEl -> { content?, thinking? }
+const markdownBlocks = new WeakMap(); // textEl -> { consumed, openEl, content }
+let frameRequested = false;
+let scrollRequested = false;
+let lastScrollAt = 0;
+
+function queueMessageUpdate(msgEl, field, text) {
+    if (!streamRendering.batched) {
+        applyMessageUpdate(msgEl, { [field]: text });
+        scrollToLatest();
+        return;
+    }
+
+    const pending = pendingUpdates.get(msgEl) || {};
+    pending[field] = text;
+    pendingUpdates.set(msgEl, pending);
+    requestScroll();
+}
+
+function requestFrame() {
+    if (frameRequested) return;
+    frameRequested = true;
+    requestAnimationFrame(flushFrame);
+}
+
+function flushFrame() {
+    frameRequested = false;
+
+    for (const [msgEl, pending] of pendingUpdates) {
+        applyMessageUpdate(msgEl, pending);
+    }
+    pendingUpdates.clear();
+
+    if (scrollRequested) {
+        if (performance.now() - lastScrollAt >= streamRendering.scrollThrottleMs) {
+            scrollToLatest();
+        } else {
+            requestFrame(); // Try again next frame
+        }
+    }
+}
+
+function requestScroll() {
+    scrollRequested = true;
+    requestFrame();
+}
+
+function scrollToLatest() {
+    const messages = $('messages');
+    messages.scrollTop = messages.scrollHeight;
+    scrollRequested = false;
+    lastScrollAt = performance.now();
+}
+
+function applyMessageUpdate(msgEl, { content, thinking }) {
+    const started = performance.now();
+
+    if (thinking !== undefined) {
+        const thinkingEl = msgEl.querySelector('.message-thinking');
+        thinkingEl.style.display = 'block';
+        thinkingEl.querySelector('.thinking-content').textContent = thinking;
+        msgEl.classList.add('has-thinking', 'streaming');
+    }
+
+    if (content !== undefined) {
+        const responseEl = msgEl.querySelector('.message-response');
+        responseEl.style.display = 'block';
+        renderMarkdownIncremental(responseEl.querySelector('.message-text'), content);
+    }
+
+    streamRendering.renderMs += performance.now() - started;
+}
+
+function renderMarkdownIncremental(textEl, content) {
+    let blocks = markdownBlocks.get(textEl);
+
+    // Streams only ever append; anything else means start over
+    if (!blocks || content.length < blocks.consumed) {
+        textEl.innerHTML = '<div class="md-block md-open"></div>';
+        blocks = { consumed: 0, openEl: textEl.firstElementChild };
+        markdownBlocks.set(textEl, blocks);
+    }
+
+    // Commit every block that a blank line has closed since last time
+    const closed = closedMarkdownBlocks(content.slice(blocks.consumed));
+    if (closed.consumed) {
+        const html = closed.blocks
+            .filter(block => block.trim())
+            .map(block => `<div class="md-block">${renderMarkdown(block)}</div>`)
+            .join('');
+        blocks.openEl.insertAdjacentHTML('beforebegin', html);
+        blocks.consumed += closed.consumed;
+    }
+
+    blocks.content = content;
+    blocks.openEl.innerHTML = renderMarkdown(content.slice(blocks.consumed));
+}
+
+function closedMarkdownBlocks(text) {
+    // The blocks of `text` closed by a blank line (one inside a ``` fence
+    // doesn't count), and how many characters they and their blank lines use up
+    const blocks = [];
+    let inFence = false;
+    let start = 0;
+    let lineStart = 0;
+    let lineEnd;
+    while ((lineEnd = text.indexOf('\n', lineStart)) !== -1) {
+        const line = text.slice(lineStart, lineEnd);
+        if (line.trimStart().startsWith('```')) {
+            inFence = !inFence;
+        } else if (!inFence && line === '') {
+            if (lineStart > start) blocks.push(text.slice(start, lineStart - 1));
+            start = lineEnd + 1;
+        }
+        lineStart = lineEnd + 1;
+    }
+    return { blocks, consumed: start };
+}
+
+function finishMarkdownIncremental(textEl) {
+    // Block-by-block rendering can differ from the full render where markup
+    // spans blocks (list spacing, paragraphs) - end on the full render
+    const blocks = markdownBlocks.get(textEl);
+    if (!blocks) return;
+    markdownBlocks.delete(textEl);
+    textEl.innerHTML = renderMarkdown(blocks.content);
+}
+
 function addSystemThinking(source, thinking, conclusion) {
     const el = createSystemThinkingElement(source);
     updateSystemThinking(el, thinking);
@@ -568,14 +909,14 @@ function createSystemThinkingElement(source) {
         </div>
     `);
 
-    messages.scrollTop = messages.scrollHeight;
+    requestScroll();
     return document.getElementById(id);
 }
 
 function updateSystemThinking(el, thinking) {
     const contentEl = el.querySelector('.thinking-content');
     contentEl.textContent = thinking;
-    $('messages').scrollTop = $('messages').scrollHeight;
+    requestScroll();
 }
 
 function finalizeSystemThinking(el, conclusion) {
@@ -583,7 +924,7 @@ function finalizeSystemThinking(el, conclusion) {
     const conclusionEl = el.querySelector('.system-conclusion');
     conclusionEl.textContent = `→ ${conclusion}`;
     conclusionEl.style.display = 'block';
-    $('messages').scrollTop = $('messages').scrollHeight;
+    requestScroll();
 }
 
 function escapeHtml(text) {
@@ -693,6 +1034,7 @@ async function startSession() {
     state.silentRounds = 0;
     state.isRunning = true;
     state.summary = null;
+    state.sessionId = `${Date.now()}-${Math.random().toString(36).slice(2, 8)}`;
 
     $('messages').innerHTML = '';
     $('summary').style.display = 'none';
@@ -732,6 +1074,9 @@ async function startSession() {
         const selection = await selectAdvisors(state.productIdea);
         clearInterval(msgInterval);
 
+        // Cached panels skip the entrance theatrics and go straight to the discussion
+        const pause = (ms) => selection._cached ? Promise.resolve() : sleep(ms);
+
         state.advisors = [];
 
         // Shuffle and pick arrival messages for variety
@@ -776,7 +1121,7 @@ async function startSession() {
             const core = CORE_ADVISORS.find(a => a.name === name);
             if (core) {
                 showLoading(getArrivalMessage(name, core.role));
-                await sleep(700);
+                await pause(700);
                 state.advisors.push(core);
             }
         }
@@ -798,13 +1143,13 @@ async function startSession() {
 
             for (const msg of drama) {
                 showLoading(msg);
-                await sleep(400);
+                await pause(400);
             }
 
             const generated = await generateAdvisorPrompt(advisor, state.productIdea);
 
             showLoading(`🎤 ${advisor.name} (${advisor.role}) is ready.`);
-            await sleep(400);
+            await pause(400);
 
             state.advisors.push({
                 name: advisor.name,
@@ -817,7 +1162,7 @@ async function startSession() {
         }
 
         showLoading("🔥 Everyone's seated. The grilling begins NOW.");
-        await sleep(600);
+        await pause(600);
 
         // Store selection thinking for display
         state.selectionThinking = selection._thinking;
@@ -956,6 +1301,7 @@ RULES:
         }
 
         clearAdvisorSpeaking();
+        persistSession();
         if (!state.isRunning) break;
 
         // Check if should ask founder (runs silently in background)
@@ -989,6 +1335,8 @@ RULES:
             thinking: summaryResult.thinking
         };
         showSummary(state.summary);
+        await persistSession();
+        state.lastSession = sessionSnapshot();
     }
 
     state.isRunning = false;
@@ -1038,21 +1386,25 @@ function endSession() {
 // DOWNLOAD
 // ============================================
 function downloadSession(format) {
-    if (!state.discussion.length) {
+    // Fall back to the last saved session (e.g. after a page reload)
+    const session = state.discussion.length ? sessionSnapshot() : state.lastSession;
+
+    if (!session || !session.discussion.length) {
         showToast('No session to download', true);
         return;
     }
 
     let content, filename, type;
+    const summary = session.summary?.content || session.summary;
 
     if (format === 'json') {
         content = JSON.stringify({
-            timestamp: new Date().toISOString(),
-            productIdea: state.productIdea,
-            taskType: state.taskType,
-            advisors: state.advisors.map(a => a.name),
-            discussion: state.discussion,
-            summary: state.summary
+            timestamp: session.timestamp,
+            productIdea: session.productIdea,
+            taskType: session.taskType,
+            advisors: session.advisors,
+            discussion: session.discussion,
+            summary: session.summary
         }, null, 2);
         filename = 'hotseat-session.json';
         type = 'application/json';
@@ -1060,10 +1412,10 @@ function downloadSession(format) {
         const lines = [
             `# Hot Seat Session`,
             '',
-            `**Product:** ${state.productIdea}`,
-            `**Mode:** ${state.taskType}`,
-            `**Date:** ${new Date().toISOString()}`,
-            `**Advisors:** ${state.advisors.map(a => a.name).join(', ')}`,
+            `**Product:** ${session.productIdea}`,
+            `**Mode:** ${session.taskType}`,
+            `**Date:** ${session.timestamp}`,
+            `**Advisors:** ${session.advisors.join(', ')}`,
             '',
             '---',
             '',
@@ -1072,7 +1424,7 @@ function downloadSession(format) {
         ];
 
         let currentRound = 0;
-        for (const entry of state.discussion) {
+        for (const entry of session.discussion) {
             if (entry.round !== currentRound) {
                 currentRound = entry.round;
                 lines.push(`### Round ${currentRound}`, '');
@@ -1080,8 +1432,8 @@ function downloadSession(format) {
             lines.push(`**${entry.advisor}:** ${entry.message}`, '');
         }
 
-        if (state.summary) {
-            lines.push('---', '', '## Summary', '', state.summary);
+        if (summary) {
+            lines.push('---', '', '## Summary', '', summary);
         }
 
         content = lines.join('\n');
@@ -1113,9 +1465,185 @@ function newSession() {
     state.currentRound = 0;
     state.summary = null;
 
+    if (state.lastSession) $('lastSessionHint').style.display = 'block';
+
     window.scrollTo({ top: 0, behavior: 'smooth' });
 }
 
+// ============================================
+// PERF HARNESS
+// ============================================
+// Replays a recorded (or synthetic) multi-advisor stream through the normal
+// rendering path and reports frame times. Open the app with ?perf to run
+// it, or use hotseatPerf.* from the console:
+//
+//   hotseatPerf.startRecording()   // then run a real session
+//   hotseatPerf.stopRecording()    // saves the chunks to localStorage
+//   hotseatPerf.replay()           // batched vs. per-chunk rendering
+const PERF_RECORDING_KEY = 'hotseat_perf_recording';
+
+const perfRecorder = {
+    active: false,
+    startedAt: 0,
+    streams: new Map(), // response -> stream index
+    chunks: [],
+
+    capture(response, delta) {
+        if (!this.streams.has(response)) this.streams.set(response, this.streams.size);
+        this.chunks.push({
+            t: Math.round(performance.now() - this.startedAt),
+            i: this.streams.get(response),
+            d: delta.content || '',
+            r: delta.reasoning_content || ''
+        });
+    }
+};
+
+function startPerfRecording() {
+    Object.assign(perfRecorder, { active: true, startedAt: performance.now(), streams: new Map(), chunks: [] });
+    showToast('Recording streams...');
+}
+
+function stopPerfRecording() {
+    perfRecorder.active = false;
+    const recording = { streams: perfRecorder.streams.size, chunks: perfRecorder.chunks };
+    localStorage.setItem(PERF_RECORDING_KEY, JSON.stringify(recording));
+    showToast(`Recorded ${recording.chunks.length} chunks from ${recording.streams} streams`);
+    return recording;
+}
+
+function syntheticPerfRecording(streams = 4, tokensPerStream = 600) {
+    // Deterministic pseudo-random so runs are comparable
+    let seed = 42;
+    const random = () => (seed = (seed * 1103515245 + 12345) % 2147483648) / 2147483648;
+    const words = ['unit', 'economics', 'retention', 'the', 'market', 'is', '**crowded**', 'pricing', 'and', 'churn', 'risk', 'moat'];
+
+    const chunks = [];
+    for (let i = 0; i < streams; i++) {
+        let t = 300 + random() * 700; // Time to first token
+        for (let n = 0; n < tokensPerStream; n++) {
+            t += 8 + random() * 25;   // ~30-60 tokens/sec
+            let d = ' ' + words[Math.floor(random() * words.length)];
+            if (n % 200 === 199) d += '\n\n```\nscore = retention * price\n\nchurn = 1 - retention\n```\n\n';
+            else if (n % 60 === 59) d += '.\n\n';
+            else if (n % 40 === 39) d += '\n\n- ';
+            else if (n % 20 === 19) d += '\n- ';
+            chunks.push({ t: Math.round(t), i, d, r: '' });
+        }
+    }
+    return { streams, chunks: chunks.sort((a, b) => a.t - b.t) };
+}
+
+async function replayPerfRecording({ batched = true } = {}) {
+    const saved = localStorage.getItem(PERF_RECORDING_KEY);
+    const recording = saved ? JSON.parse(saved) : syntheticPerfRecording();
+
+    $('heroSection').style.display = 'none';
+    $('sessionSection').style.display = 'block';
+    $('messages').innerHTML = '';
+    state.advisors = CORE_ADVISORS.slice(0, recording.streams);
+    renderAdvisors(state.advisors);
+
+    const elements = [];
+    const content = [];
+    const thinking = [];
+    for (let i = 0; i < recording.streams; i++) {
+        const advisor = state.advisors[i % state.advisors.length];
+        elements.push(createMessageElement(advisor.name, 1));
+        content.push('');
+        thinking.push('');
+    }
+
+    // Measure the gap between consecutive frames while the replay runs
+    const frameTimes = [];
+    let monitoring = true;
+    let lastFrame = performance.now();
+    const onFrame = (now) => {
+        frameTimes.push(now - lastFrame);
+        lastFrame = now;
+        if (monitoring) requestAnimationFrame(onFrame);
+    };
+    requestAnimationFrame(onFrame);
+
+    const previousMode = streamRendering.batched;
+    streamRendering.batched = batched;
+    streamRendering.renderMs = 0;
+
+    const startedAt = performance.now();
+    for (const chunk of recording.chunks) {
+        const wait = chunk.t - (performance.now() - startedAt);
+        if (wait > 0) await sleep(wait);
+
+        if (chunk.r) {
+            thinking[chunk.i] += chunk.r;
+            updateMessageThinking(elements[chunk.i], thinking[chunk.i]);
+        }
+        if (chunk.d) {
+            content[chunk.i] += chunk.d;
+            updateMessageContent(elements[chunk.i], content[chunk.i]);
+        }
+    }
+    flushFrame();
+    const markdownMismatches = compareMarkdownRenders(elements, content);
+    elements.forEach(finishMessageStream);
+
+    await sleep(200);
+    monitoring = false;
+    streamRendering.batched = previousMode;
+
+    const sorted = [...frameTimes].sort((a, b) => a - b);
+    const pick = (p) => sorted[Math.min(sorted.length - 1, Math.floor(p * sorted.length))] || 0;
+    return {
+        mode: batched ? 'frame-batched' : 'per-chunk',
+        chunks: recording.chunks.length,
+        frames: frameTimes.length,
+        p50Ms: +pick(0.5).toFixed(1),
+        p95Ms: +pick(0.95).toFixed(1),
+        maxMs: +(sorted[sorted.length - 1] || 0).toFixed(1),
+        longFrames: frameTimes.filter(ms => ms > 50).length,
+        renderMs: +streamRendering.renderMs.toFixed(1),
+        markdownMismatches
+    };
+}
+
+function compareMarkdownRenders(elements, content) {
+    // Streams whose block-by-block text differs from the full render (should be
+    // none), and any whose final markup isn't exactly the full render
+    const full = document.createElement('div');
+    let mismatches = 0;
+    elements.forEach((msgEl, i) => {
+        const textEl = msgEl.querySelector('.message-text');
+        full.innerHTML = renderMarkdown(content[i]);
+        if (textEl.textContent !== full.textContent) mismatches++;
+    });
+    elements.forEach((msgEl, i) => {
+        finishMarkdownIncremental(msgEl.querySelector('.message-text'));
+        if (msgEl.querySelector('.message-text').innerHTML !== renderMarkdown(content[i])) mismatches++;
+    });
+    return mismatches;
+}
+
+async function runPerfHarness() {
+    const results = [];
+    results.push(await replayPerfRecording({ batched: false }));
+    results.push(await replayPerfRecording({ batched: true }));
+    console.table(results);
+
+    const [before, after] = results;
+    const mismatches = before.markdownMismatches + after.markdownMismatches;
+    if (mismatches) console.warn(`${mismatches} streamed messages rendered differently from their full markdown`);
+    showToast(`Frame p95: ${before.p95Ms}ms → ${after.p95Ms}ms, render: ${before.renderMs}ms → ${after.renderMs}ms` +
+        (mismatches ? ` - ${mismatches} markdown mismatches!` : ''));
+    return results;
+}
+
+window.hotseatPerf = {
+    startRecording: startPerfRecording,
+    stopRecording: stopPerfRecording,
+    replay: replayPerfRecording,
+    run: runPerfHarness
+};
+
 // ============================================
 // INIT
 // ============================================
@@ -1126,6 +1654,19 @@ document.addEventListener('DOMContentLoaded', () => {
 
     // Close settings on backdrop click (already in HTML)
 
+    // Offer the last saved session for download (survives reloads)
+    loadLatestSession().then(session => {
+        if (!session || !session.discussion?.length) return;
+        state.lastSession = session;
+        const hint = $('lastSessionHint');
+        if (hint) hint.style.display = 'block';
+    });
+
+    // ?perf runs the stream rendering harness
+    if (new URLSearchParams(location.search).has('perf')) {
+        runPerfHarness();
+    }
+
     // Keyboard shortcuts
     document.addEventListener('keydown', (e) => {
         // Escape closes settings